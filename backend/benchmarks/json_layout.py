@@ -0,0 +1,46 @@
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambdas", "create-json-diagram", "utils"))
+
+from generate_graph import json_to_graph
+from layout import spring_layout, tree_layout
+
+NODE_COUNTS = [100, 1000, 10000]
+BRANCHING = 4
+RUNS = int(os.getenv("BENCHMARK_RUNS", "3"))
+
+def build_document(node_count, branching=BRANCHING):
+    # Breadth-first fill keeps the tree balanced; each key becomes exactly one graph node.
+    root = {}
+    frontier = [root]
+    created = 0
+    while created < node_count:
+        parent = frontier.pop(0)
+        for _ in range(branching):
+            if created >= node_count:
+                break
+            child = {}
+            parent[f"key_{created}"] = child
+            frontier.append(child)
+            created += 1
+    return json.dumps(root)
+
+def time_layout(layout_fn, graph):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        layout_fn(graph)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+if __name__ == "__main__":
+    for node_count in NODE_COUNTS:
+        graph = json_to_graph(build_document(node_count))
+        tree_time = time_layout(tree_layout, graph)
+        spring_time = time_layout(spring_layout, graph)
+        print(f"{len(graph):>6} nodes  tree={tree_time * 1000:9.2f} ms  spring={spring_time * 1000:10.1f} ms  "
+              f"ratio={spring_time / max(tree_time, 1e-9):8.1f}x")
@@ -0,0 +1,46 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+UTILS_DIR = os.path.join(os.path.dirname(__file__), "..", "lambdas", "create-aws-diagram", "utils")
+RUNS = int(os.getenv("BENCHMARK_RUNS", "10"))
+
+TYPICAL_TYPES = [
+    "APIGateway", "Lambda", "DynamodbTable", "SimpleStorageServiceS3", "CloudFront", "Route53",
+    "ELB", "EC2", "RDS", "ElasticacheForRedis", "SimpleQueueServiceSqs", "SimpleNotificationServiceSns",
+    "Cognito", "Cloudwatch", "IdentityAndAccessManagementIam", "VPC", "ECS", "Fargate",
+    "StepFunctions", "Kinesis",
+]
+
+# Equivalent of the previous eager module: import every diagrams.aws submodule and resolve every class.
+EAGER_SNIPPET = """
+import importlib
+from node_types import AWS_PACKAGE, node_types
+modules = {name: importlib.import_module(f"{AWS_PACKAGE}.{name}") for name, _ in node_types.values()}
+classes = {key: getattr(modules[name], cls) for key, (name, cls) in node_types.items()}
+"""
+
+LAZY_SNIPPET = """
+from node_types import get_node_class
+for node_type in {types!r}:
+    get_node_class(node_type)
+"""
+
+def time_cold_import(snippet):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", snippet], cwd=UTILS_DIR, check=True)
+    return time.perf_counter() - start
+
+def run_benchmark(name, snippet):
+    samples = [time_cold_import(snippet) for _ in range(RUNS)]
+    print(f"{name:<6} min={min(samples) * 1000:8.1f} ms  median={statistics.median(samples) * 1000:8.1f} ms")
+    return statistics.median(samples)
+
+if __name__ == "__main__":
+    baseline = time_cold_import("pass")
+    print(f"interpreter startup: {baseline * 1000:.1f} ms ({RUNS} runs per case)")
+    eager = run_benchmark("eager", EAGER_SNIPPET)
+    lazy = run_benchmark("lazy", LAZY_SNIPPET.format(types=TYPICAL_TYPES))
+    print(f"speedup (excluding startup): {(eager - baseline) / max(lazy - baseline, 1e-9):.1f}x")
@@ -0,0 +1,299 @@
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from importlib import metadata
+from io import BytesIO
+
+from json_layout import build_document
+from s3_upload import start_s3_stand_in
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARKS_DIR)
+REPO_ROOT = os.path.dirname(BACKEND_DIR)
+
+BUCKET_NAME = "benchmark-diagrams"
+TENANT_ID = "benchmark"
+RUNS = int(os.getenv("BENCHMARK_RUNS", "3"))
+OUTPUT_FORMAT = os.getenv("BENCHMARK_OUTPUT_FORMAT", "png")
+REGRESSION_THRESHOLD = float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "0.2"))
+# Stages faster than this are too noisy to compare against the baseline.
+MIN_COMPARED_SECONDS = 0.005
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+STAGES = ("parse", "layout", "render", "upload", "db_write")
+TRACKED_PACKAGES = ("diagrams", "eralchemy", "networkx", "matplotlib", "numpy", "sqlalchemy", "boto3")
+
+ER_TABLE_COUNTS = [10, 50, 200]
+JSON_SHAPES = [(100, 3), (1000, 5), (5000, 6)]
+AWS_SHAPES = [(10, 15), (50, 80), (200, 300)]
+AWS_NODE_TYPES = ["EC2", "Lambda", "RDS", "Dynamodb", "APIGateway", "ELB", "SimpleQueueServiceSqs", "SimpleStorageServiceS3"]
+
+TABLES = {
+    "Files": [("tenantId", "HASH"), ("fileId", "RANGE")],
+    "FileCounters": [("tenantId", "HASH")],
+    "FileVersions": [("fileKey", "HASH"), ("versionTimestamp", "RANGE")],
+}
+
+
+class StageTimer:
+    # Wraps pipeline functions in place; nested calls are subtracted so each stage reports its own time.
+    def __init__(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+        self.nested = []
+
+    def reset(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+
+    def wrap(self, module, name, stage):
+        function = getattr(module, name)
+
+        def timed(*args, **kwargs):
+            self.nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.totals[stage] += elapsed - self.nested.pop()
+                if self.nested:
+                    self.nested[-1] += elapsed
+
+        setattr(module, name, timed)
+
+
+def build_er_schema(table_count):
+    statements = []
+    for index in range(table_count):
+        columns = ["id INTEGER PRIMARY KEY", "name TEXT NOT NULL", "created_at TEXT"]
+        if index:
+            columns.append(f"parent_id INTEGER REFERENCES table_{index - 1}(id)")
+        statements.append(f"CREATE TABLE table_{index} ({', '.join(columns)});")
+    return "\n".join(statements)
+
+def build_json_document(node_count, depth):
+    # build_document fills breadth-first, so this branching factor reaches roughly the requested depth.
+    branching = max(2, math.ceil(node_count ** (1 / depth)))
+    return build_document(node_count, branching)
+
+def build_aws_graph(node_count, edge_count, seed=0):
+    rng = random.Random(seed)
+    nodes = [
+        {"id": f"n{index}", "type": AWS_NODE_TYPES[index % len(AWS_NODE_TYPES)], "label": f"service-{index}"}
+        for index in range(node_count)
+    ]
+    edges = [
+        {"from": f"n{source}", "to": f"n{rng.randrange(node_count)}"}
+        for source in (rng.randrange(node_count) for _ in range(edge_count))
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+def build_cases(pipelines):
+    cases = []
+    if "er" in pipelines:
+        for table_count in ER_TABLE_COUNTS:
+            body = {"inputFormat": "sqlite-sql", "inputText": build_er_schema(table_count)}
+            cases.append(("er", f"er tables={table_count}", body))
+    if "json" in pipelines:
+        for node_count, depth in JSON_SHAPES:
+            body = {"inputFormat": "json", "schemaText": build_json_document(node_count, depth), "layout": "tree"}
+            cases.append(("json", f"json nodes={node_count} depth={depth}", body))
+    if "aws" in pipelines:
+        for node_count, edge_count in AWS_SHAPES:
+            body = {"inputFormat": "json", "schemaText": build_aws_graph(node_count, edge_count)}
+            cases.append(("aws", f"aws nodes={node_count} edges={edge_count}", body))
+    return cases
+
+
+def load_handler(lambda_name):
+    # Every lambda imports its own helpers as the bare `utils` package, so each handler needs a fresh one.
+    for name in [name for name in sys.modules if name == "utils" or name.startswith("utils.")]:
+        del sys.modules[name]
+
+    lambda_dir = os.path.join(BACKEND_DIR, "lambdas", lambda_name)
+    import_paths = [lambda_dir, os.path.join(lambda_dir, "utils")]
+    sys.path[:0] = import_paths
+    try:
+        return importlib.import_module(f"backend.lambdas.{lambda_name}.handler")
+    finally:
+        for path in import_paths:
+            sys.path.remove(path)
+
+def instrument(pipeline):
+    handler = load_handler(f"create-{pipeline}-diagram")
+    timer = StageTimer()
+
+    # Measure real renders: the render cache would turn every run after the first into a lookup.
+    handler.cached_render_many = lambda cache_keys, render, metrics=None: {
+        name: BytesIO(data) for name, data in render().items()
+    }
+
+    if pipeline == "er":
+        timer.wrap(handler, "generate_er_file", "parse")
+        # A single format is laid out and drawn in one Graphviz call, so ER layout is reported under render.
+        timer.wrap(handler, "render_er_formats", "render")
+    elif pipeline == "json":
+        render_image = sys.modules["utils.render_image"]
+        timer.wrap(render_image, "json_to_graph", "parse")
+        timer.wrap(render_image, "compute_layout", "layout")
+        timer.wrap(handler, "render_json_with_layout", "render")
+    else:
+        build_diagram = sys.modules["build_diagram"]
+        timer.wrap(build_diagram, "build_graph", "parse")
+        timer.wrap(build_diagram, "layout_graph", "layout")
+        timer.wrap(handler, "generate_aws_layout", "render")
+
+    file_upload = sys.modules["backend.utils.file_upload"]
+    timer.wrap(handler, "handle_formats_upload", "upload")
+    timer.wrap(handler, "save_intermediate", "upload")
+    timer.wrap(file_upload, "get_next_file_id", "db_write")
+    timer.wrap(file_upload, "insert_file_version", "db_write")
+    timer.wrap(handler, "upsert_file_data", "db_write")
+    return handler, timer
+
+
+def invoke(handler, body):
+    # Handlers print a metrics line per request; keep the report readable.
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        response = handler.lambda_handler({"body": json.dumps({**body, "tenantId": TENANT_ID, "outputFormat": OUTPUT_FORMAT})}, None)
+    if response.get("statusCode") != 200:
+        raise RuntimeError(f"status {response.get('statusCode')}: {response.get('body')}")
+
+def run_case(handler, timer, body):
+    samples = []
+    for _ in range(RUNS):
+        timer.reset()
+        start = time.perf_counter()
+        invoke(handler, body)
+        samples.append({"total": time.perf_counter() - start, **timer.totals})
+
+    # tracemalloc slows allocation-heavy stages, so peak memory gets its own untimed run.
+    # It only sees Python allocations; Graphviz subprocesses and Agg pixel buffers are not included.
+    tracemalloc.start()
+    try:
+        invoke(handler, body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {metric: statistics.median(sample[metric] for sample in samples) for metric in ("total", *STAGES)}
+    result["peak_bytes"] = peak
+    return result
+
+def run_benchmarks(pipelines):
+    results = {}
+    instrumented = {}
+    for pipeline, case_name, body in build_cases(pipelines):
+        try:
+            if pipeline not in instrumented:
+                instrumented[pipeline] = instrument(pipeline)
+            handler, timer = instrumented[pipeline]
+            results[case_name] = run_case(handler, timer, body)
+            print_result(case_name, results[case_name])
+        except Exception as e:
+            results[case_name] = {"error": str(e)}
+            print(f"{case_name:<28}  failed: {e}")
+    return results
+
+
+def print_result(case_name, result):
+    stages = "  ".join(f"{stage}={result[stage] * 1000:8.1f}" for stage in STAGES)
+    print(f"{case_name:<28}  total={result['total'] * 1000:9.1f} ms  {stages}  peak={result['peak_bytes'] / 1024 / 1024:7.1f} MB")
+
+def package_versions():
+    versions = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump({"python": platform.python_version(), "packages": package_versions(), "results": results}, f, indent=2, sort_keys=True)
+    print(f"Baseline written to {path}")
+
+def compare_to_baseline(path, results):
+    with open(path) as f:
+        baseline = json.load(f)
+
+    changed = {
+        package: (version, baseline.get("packages", {}).get(package))
+        for package, version in package_versions().items()
+        if version != baseline.get("packages", {}).get(package)
+    }
+    for package, (version, baseline_version) in changed.items():
+        print(f"package {package}: {baseline_version} -> {version}")
+
+    regressions = 0
+    for case_name, result in results.items():
+        previous = baseline["results"].get(case_name)
+        if not previous or "error" in result or "error" in previous:
+            continue
+        for metric in ("total", *STAGES, "peak_bytes"):
+            before, after = previous[metric], result[metric]
+            if metric != "peak_bytes" and max(before, after) < MIN_COMPARED_SECONDS:
+                continue
+            ratio = after / before if before else math.inf
+            if ratio > 1 + REGRESSION_THRESHOLD:
+                regressions += 1
+                print(f"REGRESSION {case_name} {metric}: {before:.4g} -> {after:.4g} ({ratio:.2f}x)")
+
+    print(f"{regressions} regression(s) above {REGRESSION_THRESHOLD:.0%} against {path}")
+    return regressions
+
+
+def create_stand_in_resources():
+    import boto3
+
+    dynamodb = boto3.client("dynamodb")
+    for table_name, key_schema in TABLES.items():
+        dynamodb.create_table(
+            TableName=table_name,
+            KeySchema=[{"AttributeName": name, "KeyType": key_type} for name, key_type in key_schema],
+            AttributeDefinitions=[{"AttributeName": name, "AttributeType": "S"} for name, _ in key_schema],
+            BillingMode="PAY_PER_REQUEST"
+        )
+
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=BUCKET_NAME)
+    s3.put_bucket_versioning(Bucket=BUCKET_NAME, VersioningConfiguration={"Status": "Enabled"})
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end benchmarks of the diagram lambdas against moto_server.")
+    parser.add_argument("--pipelines", default="er,json,aws", help="comma-separated subset of er,json,aws")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="write results as the new baseline")
+    parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE, help="compare results against a stored baseline")
+    args = parser.parse_args()
+
+    server, endpoint_url = start_s3_stand_in()
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ["AWS_ENDPOINT_URL"] = endpoint_url
+    os.environ["S3-BUCKET-NAME"] = BUCKET_NAME
+
+    try:
+        sys.path.insert(0, REPO_ROOT)
+        create_stand_in_resources()
+        results = run_benchmarks(args.pipelines.split(","))
+
+        from backend.db.file_counters_queries import release_leased_blocks
+        release_leased_blocks()
+
+        if args.save_baseline:
+            save_baseline(args.save_baseline, results)
+        regressions = compare_to_baseline(args.baseline, results) if args.baseline else 0
+    finally:
+        server.terminate()
+
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,69 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+IMAGE_SIZES_MB = [1, 8, 32, 128]
+BUCKET_NAME = "benchmark-diagrams"
+
+def start_s3_stand_in():
+    # moto_server runs in its own process so its object storage does not count towards our peak memory.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    endpoint_url = f"http://127.0.0.1:{port}"
+    for _ in range(50):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server, endpoint_url
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("moto_server did not start")
+
+def measure(upload, image_bytes):
+    buffer = BytesIO(image_bytes)
+    tracemalloc.start()
+    start = time.perf_counter()
+    upload(buffer)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+if __name__ == "__main__":
+    server, endpoint_url = start_s3_stand_in()
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ["AWS_ENDPOINT_URL_S3"] = endpoint_url
+
+    try:
+        sys.path.insert(0, REPO_ROOT)
+        from backend.utils import file_upload
+
+        file_upload.s3.create_bucket(Bucket=BUCKET_NAME)
+        # Versioned like the image bucket, so both paths are measured returning a VersionId.
+        file_upload.s3.put_bucket_versioning(Bucket=BUCKET_NAME, VersioningConfiguration={"Status": "Enabled"})
+        strategies = {
+            "put_object": lambda buffer: file_upload.s3.put_object(Bucket=BUCKET_NAME, Key="put", Body=buffer, ContentType="png"),
+            "multipart": lambda buffer: file_upload.multipart_upload(buffer, BUCKET_NAME, "multipart", "png"),
+            "upload_image": lambda buffer: file_upload.upload_image(buffer, BUCKET_NAME, "image", "png"),
+        }
+
+        for size_mb in IMAGE_SIZES_MB:
+            image_bytes = os.urandom(size_mb * 1024 * 1024)
+            for name, upload in strategies.items():
+                elapsed, peak = measure(upload, image_bytes)
+                print(f"{size_mb:>4} MB  {name:<12}  wall={elapsed * 1000:9.1f} ms  peak={peak / 1024 / 1024:8.1f} MB")
+    finally:
+        server.terminate()
@@ -0,0 +1,37 @@
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambdas", "create-er-diagram", "utils"))
+
+from generate_er import generate_er_file
+
+# SQL scripts are parsed by ddl_parser and never executed, so this times parsing plus markup for each dialect.
+SCHEMA_SIZES = [10, 100, 1000]
+INPUT_FORMATS = ["sqlite-sql", "postgresql-sql"]
+RUNS = int(os.getenv("BENCHMARK_RUNS", "5"))
+
+def build_schema(table_count):
+    statements = []
+    for index in range(table_count):
+        columns = [
+            "id INTEGER PRIMARY KEY",
+            "name TEXT NOT NULL",
+            "created_at TEXT",
+        ]
+        if index:
+            columns.append(f"parent_id INTEGER REFERENCES table_{index - 1}(id)")
+        statements.append(f"CREATE TABLE table_{index} ({', '.join(columns)});")
+    return "\n".join(statements)
+
+if __name__ == "__main__":
+    for table_count in SCHEMA_SIZES:
+        script = build_schema(table_count)
+        for input_format in INPUT_FORMATS:
+            samples = []
+            for _ in range(RUNS):
+                start = time.perf_counter()
+                generate_er_file(input_format, script)
+                samples.append(time.perf_counter() - start)
+            print(f"{table_count:>5} tables  {input_format:<15} min={min(samples) * 1000:9.1f} ms  median={statistics.median(samples) * 1000:9.1f} ms")
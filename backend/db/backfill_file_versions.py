@@ -0,0 +1,65 @@
+import os
+from collections import Counter
+from datetime import timedelta
+
+from .file_versions_queries import build_file_key, table as versions_table
+from .files_queries import table as files_table
+from ..utils.s3_versions import format_last_modified, iter_key_versions, s3
+
+# Adds the S3 versions saved before the FileVersions index existed. Safe to run again.
+# restore-file-version runs backfill_file for a file it cannot find a version for; backfill_all covers the rest.
+# Usage: python -m backend.db.backfill_file_versions
+
+def get_indexed_version_ids(tenant_id, file_id):
+    version_ids = set()
+    query_args = {
+        'KeyConditionExpression': "fileKey = :fileKey",
+        'ExpressionAttributeValues': {':fileKey': build_file_key(tenant_id, file_id)},
+        'ProjectionExpression': "versionId, restored"
+    }
+    while True:
+        response = versions_table.query(**query_args)
+        # A restore row names an older version but is not that version's own entry.
+        version_ids.update(item['versionId'] for item in response.get('Items', []) if not item.get('restored'))
+        if 'LastEvaluatedKey' not in response:
+            return version_ids
+        query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def backfill_file(bucket_name, tenant_id, file_id, s3_key):
+    indexed = get_indexed_version_ids(tenant_id, file_id)
+    added = 0
+    # S3 times are whole seconds, so versions saved within one second would share a sort key and overwrite
+    # each other; each older one (the listing is newest first) moves back a microsecond instead.
+    same_second = Counter()
+    for version in iter_key_versions(bucket_name, s3_key):
+        last_modified = version['LastModified'] - timedelta(microseconds=same_second[version['LastModified']])
+        same_second[version['LastModified']] += 1
+        if version['VersionId'] in indexed:
+            continue
+        head = s3.head_object(Bucket=bucket_name, Key=s3_key, VersionId=version['VersionId'])
+        versions_table.put_item(
+            Item={
+                'fileKey': build_file_key(tenant_id, file_id),
+                'versionTimestamp': format_last_modified(last_modified),
+                'versionId': version['VersionId'],
+                'sizeBytes': version['Size'],
+                'contentType': head.get('ContentType')
+            }
+        )
+        added += 1
+    return added
+
+def backfill_all(bucket_name):
+    scan_args = {'ProjectionExpression': "tenantId, fileId, s3Key"}
+    added = 0
+    while True:
+        response = files_table.scan(**scan_args)
+        for item in response.get('Items', []):
+            s3_key = item.get('s3Key', f"{item['tenantId']}/{item['fileId']}")
+            added += backfill_file(bucket_name, item['tenantId'], item['fileId'], s3_key)
+        if 'LastEvaluatedKey' not in response:
+            return added
+        scan_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+if __name__ == "__main__":
+    print(f"Indexed {backfill_all(os.getenv('S3-BUCKET-NAME'))} versions")
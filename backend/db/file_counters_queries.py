@@ -1,17 +1,88 @@
 import boto3
+import os
+import threading
 
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table('FileCounters')
 
-def get_next_file_id(tenant_id):
+BLOCK_SIZE = int(os.getenv("FILE_ID_BLOCK_SIZE", "20"))
+
+# tenantId -> [[next id, last id], ...] for the blocks this container currently holds.
+leased_blocks = {}
+# Only guards the dict; never held across DynamoDB calls. Reentrant so a signal handler in the same thread can take it.
+lease_lock = threading.RLock()
+
+def claim_free_block(tenant_id):
+    response = table.get_item(
+        Key={"tenantId": tenant_id},
+        ProjectionExpression="freeBlocks",
+        ConsistentRead=True
+    )
+    for block in response.get('Item', {}).get('freeBlocks', []):
+        try:
+            table.update_item(
+                Key={"tenantId": tenant_id},
+                UpdateExpression="DELETE freeBlocks :block",
+                ConditionExpression="contains(freeBlocks, :claimed)",
+                ExpressionAttributeValues={
+                    ":block": {block},
+                    ":claimed": block
+                }
+            )
+        except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            continue
+        start, end = block.split("-")
+        return [int(start), int(end)]
+    return None
+
+def lease_new_block(tenant_id):
     response = table.update_item(
         Key={"tenantId": tenant_id},
-        UpdateExpression="SET currentCounter = if_not_exists(currentCounter, :start) + :inc",
+        UpdateExpression="SET currentCounter = if_not_exists(currentCounter, :start) + :block",
         ExpressionAttributeValues={
             ":start": 0,
-            ":inc": 1
+            ":block": BLOCK_SIZE
         },
         ReturnValues="UPDATED_NEW"
     )
-    next_counter = response['Attributes']['currentCounter']
+    end = int(response['Attributes']['currentCounter'])
+    return [end - BLOCK_SIZE + 1, end]
+
+def release_leased_blocks():
+    with lease_lock:
+        unused = [
+            (tenant_id, f"{next_id}-{end}")
+            for tenant_id, blocks in leased_blocks.items()
+            for next_id, end in blocks
+            if next_id <= end
+        ]
+        leased_blocks.clear()
+
+    for tenant_id, block in unused:
+        try:
+            table.update_item(
+                Key={"tenantId": tenant_id},
+                UpdateExpression="ADD freeBlocks :block",
+                ExpressionAttributeValues={":block": {block}}
+            )
+        except Exception as e:
+            print(f"Error releasing file ids for {tenant_id}: {e}")
+
+def take_leased_id(tenant_id):
+    with lease_lock:
+        for block in leased_blocks.get(tenant_id, []):
+            if block[0] <= block[1]:
+                block[0] += 1
+                return block[0] - 1
+    return None
+
+def get_next_file_id(tenant_id):
+    next_counter = take_leased_id(tenant_id)
+    while next_counter is None:
+        # Threads that run out together each lease a block; both are kept, so no ids are lost.
+        block = claim_free_block(tenant_id) or lease_new_block(tenant_id)
+        with lease_lock:
+            blocks = [current for current in leased_blocks.get(tenant_id, []) if current[0] <= current[1]]
+            leased_blocks[tenant_id] = blocks + [block]
+        next_counter = take_leased_id(tenant_id)
     return f"file_{next_counter:03d}"
@@ -0,0 +1,58 @@
+import boto3
+from datetime import datetime
+
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table('FileVersions')
+
+def build_file_key(tenant_id, file_id):
+    return f"{tenant_id}#{file_id}"
+
+def insert_file_version(tenant_id, file_id, version_id, size_bytes, content_type, format_versions=None):
+    item = {
+        'fileKey': build_file_key(tenant_id, file_id),
+        'versionTimestamp': datetime.utcnow().isoformat(),
+        'versionId': version_id,
+        'sizeBytes': size_bytes,
+        'contentType': content_type
+    }
+    # Extra formats saved with this version: format -> S3 VersionId of <tenant>/<fileId>.<format>.
+    if format_versions:
+        item['formatVersions'] = format_versions
+    try:
+        table.put_item(Item=item)
+    except Exception as e:
+        print(f"Error occurred: {e}")
+
+def query_file_versions(tenant_id, file_id, limit, start_key=None):
+    query_args = {
+        'KeyConditionExpression': "fileKey = :fileKey",
+        'ExpressionAttributeValues': {':fileKey': build_file_key(tenant_id, file_id)},
+        'ProjectionExpression': "versionId, versionTimestamp, sizeBytes, formatVersions",
+        'ScanIndexForward': False,
+        'Limit': limit
+    }
+    if start_key:
+        query_args['ExclusiveStartKey'] = start_key
+
+    response = table.query(**query_args)
+    return response.get('Items', []), response.get('LastEvaluatedKey')
+
+def find_file_version(tenant_id, file_id, version_id):
+    query_args = {
+        'KeyConditionExpression': "fileKey = :fileKey",
+        'FilterExpression': "versionId = :versionId",
+        'ExpressionAttributeValues': {
+            ':fileKey': build_file_key(tenant_id, file_id),
+            ':versionId': version_id
+        },
+        'ProjectionExpression': "versionId, sizeBytes, contentType, formatVersions"
+    }
+
+    while True:
+        response = table.query(**query_args)
+        items = response.get('Items', [])
+        if items:
+            return items[0]
+        if 'LastEvaluatedKey' not in response:
+            return None
+        query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
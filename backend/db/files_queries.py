@@ -1,8 +1,20 @@
 import boto3
+from datetime import datetime
+
+from .file_versions_queries import build_file_key, table as versions_table
 
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table('Files')
 
+# Written on every save; every other attribute only keeps its create-time value.
+ALWAYS_SET_ATTRIBUTES = ('updatedAt', 'currentVersionId')
+# What a file gallery shows; everything else on the item stays in DynamoDB.
+GALLERY_ATTRIBUTES = ('fileId', 'fileName', 'diagramType', 's3Key', 'createdAt', 'updatedAt', 'currentVersionId')
+# Sorts a tenant's files by creation time; file ids say nothing about age once blocks are leased and released.
+CREATED_AT_INDEX = "TenantCreatedAtIndex"
+# Keyed (diagramType, tenantId), so one type's files for a tenant come back in no particular order.
+DIAGRAM_TYPE_INDEX = "DiagramTypeIndex"
+
 def get_file(tenant_id, file_id):
     response = table.get_item(
         Key={
@@ -10,32 +22,138 @@ def get_file(tenant_id, file_id):
             'fileId': file_id
         }
     )
-    return response.get('Items', [])
+    return response.get('Item')
+
+def query_tenant_files(tenant_id, limit, start_key=None, diagram_type=None):
+    names = {f"#g{index}": attribute for index, attribute in enumerate(GALLERY_ATTRIBUTES)}
+    query_args = {
+        'IndexName': CREATED_AT_INDEX,
+        'KeyConditionExpression': "tenantId = :tenantId",
+        'ExpressionAttributeValues': {':tenantId': tenant_id},
+        'ProjectionExpression': ", ".join(names),
+        'ExpressionAttributeNames': names,
+        'ScanIndexForward': False,
+        'Limit': limit
+    }
+    if diagram_type:
+        query_args['IndexName'] = DIAGRAM_TYPE_INDEX
+        query_args['KeyConditionExpression'] = "diagramType = :diagramType AND tenantId = :tenantId"
+        query_args['ExpressionAttributeValues'][':diagramType'] = diagram_type
+    if start_key:
+        query_args['ExclusiveStartKey'] = start_key
+
+    response = table.query(**query_args)
+    return response.get('Items', []), response.get('LastEvaluatedKey')
+
+def upsert_file_data(tenant_id, file_id, s3_key, file_name, diagram_type, metadata):
+    now = datetime.utcnow().isoformat()
+    attributes = {
+        'fileName': file_name,
+        'diagramType': diagram_type,
+        's3Key': s3_key,
+        **{key: value for key, value in metadata.items() if key not in ('createdAt', *ALWAYS_SET_ATTRIBUTES)},
+        'createdAt': now
+    }
+
+    names = {}
+    values = {':updatedAt': now}
+    assignments = ["updatedAt = :updatedAt"]
+    if metadata.get('currentVersionId'):
+        values[':currentVersionId'] = metadata['currentVersionId']
+        assignments.append("currentVersionId = :currentVersionId")
+
+    for index, (key, value) in enumerate(attributes.items()):
+        names[f"#a{index}"] = key
+        values[f":a{index}"] = value
+        assignments.append(f"#a{index} = if_not_exists(#a{index}, :a{index})")
 
-def insert_file_data(tenant_id, file_id, s3_key, file_name, diagram_type, metadata):
     try:
-        if metadata['createdAt'] == metadata['updatedAt']:
-            table.put_item(
-                Item={
-                    'tenantId': tenant_id,
-                    'fileId': file_id,
-                    'fileName': file_name,
-                    'diagramType': diagram_type,
-                    's3Key': s3_key,
-                    **metadata
-                }
-            )
-        else:
-            table.update_item(
-                Key={
-                    'tenantId': tenant_id,
-                    'fileId': file_id
-                },
-                UpdateExpression="SET updatedAt = :updatedAt",
-                ExpressionAttributeValues={
-                    ':updatedAt': metadata['updatedAt']
-                }
-            )
+        response = table.update_item(
+            Key={
+                'tenantId': tenant_id,
+                'fileId': file_id
+            },
+            UpdateExpression="SET " + ", ".join(assignments),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="ALL_NEW"
+        )
+        return response['Attributes']
     except Exception as e:
         print(f"Error occurred: {e}")
-    
\ No newline at end of file
+
+def insert_files_batch(files):
+    now = datetime.utcnow().isoformat()
+    existing = []
+    # A repeated key would fail the whole BatchWriteItem; the last write for it wins instead.
+    with table.batch_writer(overwrite_by_pkeys=['tenantId', 'fileId']) as batch:
+        for tenant_id, file_id, s3_key, file_name, diagram_type, metadata, is_new in files:
+            if is_new:
+                batch.put_item(
+                    Item={
+                        'tenantId': tenant_id,
+                        'fileId': file_id,
+                        'fileName': file_name,
+                        'diagramType': diagram_type,
+                        's3Key': s3_key,
+                        **metadata,
+                        'createdAt': now,
+                        'updatedAt': now
+                    }
+                )
+            else:
+                existing.append((tenant_id, file_id, s3_key, file_name, diagram_type, metadata))
+
+    for file in existing:
+        upsert_file_data(*file)
+
+def get_current_versions(tenant_id, file_ids):
+    versions = {}
+    keys = [{'tenantId': tenant_id, 'fileId': file_id} for file_id in dict.fromkeys(file_ids)]
+    for start in range(0, len(keys), 100):
+        request = {
+            table.name: {
+                'Keys': keys[start:start + 100],
+                'ProjectionExpression': "fileId, currentVersionId"
+            }
+        }
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response['Responses'].get(table.name, []):
+                versions[item['fileId']] = item.get('currentVersionId')
+            request = response.get('UnprocessedKeys')
+    return versions
+
+def restore_file_version(tenant_id, file_id, version):
+    now = datetime.utcnow().isoformat()
+    # One transaction: move the pointer and log the restore as the newest history entry.
+    dynamodb.meta.client.transact_write_items(
+        TransactItems=[
+            {
+                'Update': {
+                    'TableName': table.name,
+                    'Key': {'tenantId': tenant_id, 'fileId': file_id},
+                    'UpdateExpression': "SET currentVersionId = :versionId, updatedAt = :updatedAt",
+                    'ConditionExpression': "attribute_exists(fileId)",
+                    'ExpressionAttributeValues': {
+                        ':versionId': version['versionId'],
+                        ':updatedAt': now
+                    }
+                }
+            },
+            {
+                'Put': {
+                    'TableName': versions_table.name,
+                    'Item': {
+                        'fileKey': build_file_key(tenant_id, file_id),
+                        'versionTimestamp': now,
+                        'versionId': version['versionId'],
+                        'sizeBytes': version['sizeBytes'],
+                        'contentType': version['contentType'],
+                        'restored': True,
+                        **({'formatVersions': version['formatVersions']} if version.get('formatVersions') else {})
+                    }
+                }
+            }
+        ]
+    )
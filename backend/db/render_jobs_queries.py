@@ -0,0 +1,45 @@
+import boto3
+from datetime import datetime
+from decimal import Decimal
+
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table('RenderJobs')
+
+def insert_render_job(job_id, tenant_id, diagram_type):
+    now = datetime.utcnow().isoformat()
+    table.put_item(
+        Item={
+            'jobId': job_id,
+            'tenantId': tenant_id,
+            'diagramType': diagram_type,
+            'status': 'queued',
+            'progress': Decimal(0),
+            'createdAt': now,
+            'updatedAt': now
+        }
+    )
+
+def update_render_job(job_id, status, progress, **fields):
+    attributes = {
+        'status': status,
+        'progress': Decimal(str(progress)),
+        'updatedAt': datetime.utcnow().isoformat(),
+        **fields
+    }
+    try:
+        table.update_item(
+            Key={'jobId': job_id},
+            UpdateExpression="SET " + ", ".join(f"#a{index} = :a{index}" for index in range(len(attributes))),
+            ExpressionAttributeNames={f"#a{index}": key for index, key in enumerate(attributes)},
+            ExpressionAttributeValues={f":a{index}": value for index, value in enumerate(attributes.values())}
+        )
+    except Exception as e:
+        print(f"Error occurred: {e}")
+
+def get_render_job(job_id):
+    response = table.get_item(
+        Key={'jobId': job_id},
+        ProjectionExpression="jobId, tenantId, diagramType, #status, progress, imageUrl, fileId, #error, createdAt, updatedAt",
+        ExpressionAttributeNames={'#status': 'status', '#error': 'error'}
+    )
+    return response.get('Item')
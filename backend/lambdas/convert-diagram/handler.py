@@ -0,0 +1,69 @@
+import json
+import os
+from io import BytesIO
+
+from ...utils.diagram_renderers import CONVERT_OUTPUT_FORMATS, convert_intermediate
+from ...utils.file_upload import build_image_key, upload_image
+from ...utils.intermediate import load_intermediate
+from ...utils.metrics import instrument_handler
+from ...db.files_queries import get_file
+
+@instrument_handler()
+def lambda_handler(event, context, metrics):
+    try:
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
+
+        tenant_id = body.get('tenantId')
+        file_id = (event.get('pathParameters') or {}).get('fileId')
+        output_format = body.get('outputFormat')
+
+        if not tenant_id or not file_id or not output_format:
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"message": "tenantId, fileId, and outputFormat are required"})
+            }
+
+        with metrics.stage("dynamoRead"):
+            file = get_file(tenant_id, file_id)
+        if not file:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"message": "File not found"})
+            }
+
+        with metrics.stage("s3Download"):
+            # Follows the version pointer, so a restored version converts from its own diagram.
+            diagram_type, intermediate = load_intermediate(tenant_id, file_id, file.get('currentVersionId'))
+        if intermediate is None:
+            return {
+                "statusCode": 409,
+                "body": json.dumps({"message": "This file has no stored intermediate form; re-create it from its source"})
+            }
+
+        metrics.diagram_type = diagram_type
+        if output_format not in CONVERT_OUTPUT_FORMATS.get(diagram_type, ()):
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"message": f"Unsupported output format for {diagram_type} diagrams: {output_format}"})
+            }
+
+        with metrics.stage("render"):
+            image_bytes = convert_intermediate(diagram_type, intermediate, output_format)
+
+        # Converted images sit beside the file like extra output formats; the file and its history are unchanged.
+        bucket_name = os.getenv("S3-BUCKET-NAME")
+        s3_key = build_image_key(tenant_id, file_id, output_format)
+        metrics.record("outputBytes", len(image_bytes), "Bytes")
+        with metrics.stage("s3Upload"):
+            upload_image(BytesIO(image_bytes), bucket_name, s3_key, output_format)
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({"imageUrl": f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"})
+        }
+    except Exception as e:
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": str(e)})
+        }
@@ -1,33 +1,94 @@
 import json
+from io import BytesIO
 
-from utils.validate_body import validate_body
-from utils.generate_aws import generate_aws_file
+from utils.validate_body import validate_body, validate_diagram
+from utils.generate_aws import generate_aws_layout
+from utils.build_diagram import parse_positions
 
-from ...utils.file_upload import handle_file_upload
-from ...db.files_queries import insert_file_data
+from ...utils.file_upload import handle_formats_upload
+from ...utils.graph_layout import layout_runner, validate_layout_engine
+from ...utils.intermediate import save_intermediate
+from ...utils.lifecycle import on_shutdown
+from ...utils.metrics import instrument_handler
+from ...utils.node_layouts import load_pinned_positions, save_node_positions
+from ...utils.output_formats import build_image_urls_body, get_output_formats, validate_output_formats
+from ...utils.render_cache import build_cache_key, cached_render_many
+from ...utils.render_jobs import submit_render_job
+from ...db.file_counters_queries import release_leased_blocks
+from ...db.files_queries import upsert_file_data
 
-def lambda_handler(event, context):
+RENDERER_VERSION = "aws-5"
+
+# Hand unused file ids back when the container shuts down so other containers can use them.
+on_shutdown(release_leased_blocks)
+
+@instrument_handler('aws')
+def lambda_handler(event, context, metrics):
     try:
-        body = json.loads(event['body'])
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
 
         tenant_id = body.get('tenantId')
         input_format = body.get('inputFormat')
         output_format = body.get('outputFormat')
         input_text = body.get('schemaText')
         file_name = body.get('fileName')
+        layout_engine = body.get('layoutEngine')
 
-        error = validate_body(input_format, output_format, input_text, tenant_id)
+        with metrics.stage("validation"):
+            error = validate_body(input_format, output_format, input_text, tenant_id) or validate_output_formats(output_format) or validate_layout_engine(layout_engine)
         if error:
             return {"statusCode": 400, "body": error}
 
-        aws_file = generate_aws_file(input_text, output_format)
+        with metrics.stage("validation"):
+            errors = validate_diagram(input_text)
+        if errors:
+            return {"statusCode": 400, "body": json.dumps({"message": "Invalid diagram", "errors": errors})}
+
+        output_formats = get_output_formats(output_format)
+        if body.get('async') and len(output_formats) > 1:
+            return {"statusCode": 400, "body": "Asynchronous renders take a single outputFormat"}
+
+        metrics.record("nodeCount", len(input_text.get('nodes', [])))
+        metrics.record("edgeCount", len(input_text.get('edges', [])))
+
+        if body.get('async'):
+            job_id = submit_render_job('aws', tenant_id, input_text, body)
+            return {"statusCode": 202, "body": json.dumps({"jobId": job_id})}
+
+        file_id = body.get('fileId')
+        with metrics.stage("s3Download"):
+            previous_positions = load_pinned_positions(tenant_id, file_id, layout_engine, body.get('relayout'))
+
+        def render():
+            images, laid_out, _ = generate_aws_layout(input_text, output_formats, previous_positions, metrics, layout_runner(layout_engine, metrics))
+            return {**{name: buffer.getvalue() for name, buffer in images.items()}, 'intermediate': laid_out.encode()}
+
+        if previous_positions:
+            # The result depends on the stored layout, not just the input, so it cannot be shared through the cache.
+            artifacts = {name: BytesIO(data) for name, data in render().items()}
+        else:
+            cache_keys = {
+                name: build_cache_key('aws', input_format, input_text, name, RENDERER_VERSION, layout_engine)
+                for name in [*output_formats, 'intermediate']
+            }
+            artifacts = cached_render_many(cache_keys, render, metrics)
+        laid_out = artifacts.pop('intermediate').getvalue()
 
-        bucket_name, s3_key, file_id, metadata = handle_file_upload(aws_file, tenant_id, body.get('fileId'), body.get('metadata', {}), output_format)
-        insert_file_data(tenant_id, file_id, s3_key, file_name, 'json', metadata)
+        bucket_name, s3_keys, file_id, metadata = handle_formats_upload(artifacts, tenant_id, file_id, body.get('metadata', {}), metrics)
+        with metrics.stage("s3Upload"):
+            save_intermediate(tenant_id, file_id, 'aws', laid_out, metadata.get('currentVersionId'))
+            # Read back from the intermediate, so a cached render stores the layout it was drawn with too.
+            positions = parse_positions(laid_out.decode())
+            if positions:
+                save_node_positions(tenant_id, file_id, positions)
+        with metrics.stage("dynamoWrite"):
+            saved = upsert_file_data(tenant_id, file_id, s3_keys[output_formats[0]], file_name, 'aws', metadata)
+        metrics.record("dynamoWriteErrors", 0 if saved else 1)
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"imageUrl": f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"})
+            "body": json.dumps(build_image_urls_body(bucket_name, s3_keys, output_format))
         }
     except Exception as e:
         return {"statusCode": 500, "body": str(e)}
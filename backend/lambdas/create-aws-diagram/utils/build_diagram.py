@@ -1,17 +1,41 @@
-from diagrams import Diagram
+import re
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from contextlib import nullcontext
+from diagrams import Diagram, setdiagram
+from graphviz import Source
 
-from node_types import node_types
+from node_types import get_icon_path, get_node_class
 
+POINTS_PER_INCH = 72
+# Above this share of new nodes a full dot layout reads better than pinning what is left.
+MAX_NEW_NODE_FRACTION = 0.5
+# Initial guess for a new node: right of its known neighbours, matching the left-to-right flow.
+NEW_NODE_OFFSET_INCHES = 2.0
 
-def build_diagram(nodes, edges, filename, output_format):
-    node_objs = {}
+# Node statements in `-Tdot` output; diagrams names nodes with uuid4().hex.
+NODE_STATEMENT = re.compile(r'^\t"?([0-9a-f]{32})"?\s+\[(.*?)\];$', re.MULTILINE | re.DOTALL)
+NODE_POSITION = re.compile(r'\bpos="(-?[\d.]+),(-?[\d.]+)!?"')
+# Graphviz may wrap long quoted values with a backslash-newline.
+IMAGE_ATTRIBUTE = re.compile(r'\bimage="((?:[^"\\]|\\.)*)"')
+NODE_TYPE_ATTRIBUTE = re.compile(r'\bnodetype="([^"]*)"')
+DIAGRAM_ID_ATTRIBUTE = re.compile(r'\bdiagramid=(?:"((?:[^"\\]|\\.)*)"|([^\s,\]]+))', re.DOTALL)
 
-    with Diagram("AWS Architecture", filename=filename, outformat=output_format, show=False):
+
+class InMemoryDiagram(Diagram):
+    # Skip Diagram.render() on exit so nothing is written to disk; callers pipe self.dot instead.
+    def __exit__(self, exc_type, exc_value, traceback):
+        setdiagram(None)
+
+
+def build_graph(nodes, edges):
+    with InMemoryDiagram("AWS Architecture", show=False) as diagram:
         node_objs = {}
         for node in nodes:
-            cls = node_types.get(node["type"])
+            cls = get_node_class(node["type"])
             if cls:
-                node_objs[node["id"]] = cls(node["label"])
+                # diagramid carries the caller's id through layout, so positions can be read back from any stored layout.
+                node_objs[node["id"]] = cls(node["label"], diagramid=node["id"])
             else:
                 raise ValueError(f"Unknown node type: {node['type']}")
 
@@ -19,4 +43,111 @@ def build_diagram(nodes, edges, filename, output_format):
             from_node = node_objs[edge["from"]]
             to_node = node_objs[edge["to"]]
             from_node >> to_node
-    
\ No newline at end of file
+
+    return diagram.dot, {node_id: node._id for node_id, node in node_objs.items()}
+
+
+def pin_positions(graph, node_names, edges, previous_positions):
+    # neato reads pos in inches; "!" keeps a node exactly where it was last time.
+    for node_id, name in node_names.items():
+        if node_id in previous_positions:
+            x, y = previous_positions[node_id]
+            graph.node(name, pos=f"{x / POINTS_PER_INCH},{y / POINTS_PER_INCH}!", pin="true")
+
+    neighbours = defaultdict(list)
+    for edge in edges:
+        neighbours[edge["from"]].append(edge["to"])
+        neighbours[edge["to"]].append(edge["from"])
+
+    # New nodes start next to what they connect to, so neato only has to settle the changed region.
+    for node_id, name in node_names.items():
+        known = [previous_positions[other] for other in neighbours[node_id] if other in previous_positions]
+        if node_id not in previous_positions and known:
+            x = sum(position[0] for position in known) / len(known) / POINTS_PER_INCH + NEW_NODE_OFFSET_INCHES
+            y = sum(position[1] for position in known) / len(known) / POINTS_PER_INCH
+            graph.node(name, pos=f"{x},{y}")
+
+    graph.engine = "neato"
+    graph.graph_attr["overlap"] = "false"
+
+
+def layout_graph(graph, node_count, edge_count, layout=None, pinned=False):
+    if layout is None:
+        return graph.pipe(format="dot").decode()
+    # Pinned positions are only honoured by neato, whatever engine the graph's size would suggest.
+    return layout(graph.source, node_count, edge_count, "neato" if pinned else None)
+
+
+def to_stored_layout(laid_out, nodes):
+    # The stored layout names each node's type instead of an icon path from this container's install.
+    icon_types = {get_icon_path(node["type"]): node["type"] for node in nodes}
+
+    def replace(match):
+        node_type = icon_types.get(match.group(1).replace("\\\n", ""))
+        return f'nodetype="{node_type}"' if node_type else match.group()
+
+    return IMAGE_ATTRIBUTE.sub(replace, laid_out)
+
+
+def from_stored_layout(laid_out):
+    return NODE_TYPE_ATTRIBUTE.sub(lambda match: f'image="{get_icon_path(match.group(1))}"', laid_out)
+
+
+def render_laid_out(laid_out, output_format):
+    # -n2 keeps every node and edge coordinate from the layout pass and only draws.
+    return Source(laid_out, engine="neato").pipe(format=output_format, neato_no_op=2)
+
+
+def render_stored_layout(laid_out, output_format):
+    return render_laid_out(from_stored_layout(laid_out), output_format)
+
+
+def render_formats(laid_out, output_formats):
+    # One Graphviz process per format, all drawing the same layout.
+    with ThreadPoolExecutor(max_workers=len(output_formats)) as pool:
+        images = pool.map(lambda output_format: render_laid_out(laid_out, output_format), output_formats)
+        return dict(zip(output_formats, images))
+
+
+def parse_positions(laid_out):
+    # Works on the fresh layout and on a stored or cached one alike, since both keep diagramid.
+    positions = {}
+    for _, attributes in NODE_STATEMENT.findall(laid_out):
+        node_id = DIAGRAM_ID_ATTRIBUTE.search(attributes)
+        position = NODE_POSITION.search(attributes)
+        if node_id and position:
+            quoted, bare = node_id.groups()
+            node_id = bare if quoted is None else quoted.replace("\\\n", "").replace('\\"', '"').replace("\\\\", "\\")
+            positions[node_id] = [float(position.group(1)), float(position.group(2))]
+    return positions
+
+
+def can_reuse_positions(nodes, previous_positions):
+    if not previous_positions or not nodes:
+        return False
+    new_nodes = sum(1 for node in nodes if node["id"] not in previous_positions)
+    return new_nodes / len(nodes) <= MAX_NEW_NODE_FRACTION
+
+
+def build_diagram(nodes, edges, output_formats, metrics=None, previous_positions=None, layout=None):
+    with metrics.stage("graphBuild") if metrics else nullcontext():
+        graph, node_names = build_graph(nodes, edges)
+        incremental = can_reuse_positions(nodes, previous_positions)
+        if incremental:
+            pin_positions(graph, node_names, edges, previous_positions)
+    if metrics:
+        metrics.record("incrementalLayout", 1 if incremental else 0)
+
+    if layout is not None and len(output_formats) == 1:
+        # One Graphviz process lays out and draws the only format; its laid-out source still gives positions.
+        with metrics.stage("render") if metrics else nullcontext():
+            laid_out, image = layout(graph.source, len(nodes), len(edges), "neato" if incremental else None, output_formats[0])
+        images = {output_formats[0]: image}
+    else:
+        with metrics.stage("layout") if metrics else nullcontext():
+            laid_out = layout_graph(graph, len(nodes), len(edges), layout, incremental)
+
+        with metrics.stage("render") if metrics else nullcontext():
+            images = render_formats(laid_out, output_formats)
+
+    return images, to_stored_layout(laid_out, nodes), parse_positions(laid_out)
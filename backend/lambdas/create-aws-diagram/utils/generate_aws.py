@@ -1,16 +1,10 @@
-import tempfile
 from io import BytesIO
 
 from build_diagram import build_diagram
 
-def generate_aws_file(inputText, output_format):
-    with tempfile.NamedTemporaryFile(suffix=f".{output_format}", delete=False) as temp_file:
-        base_filename = temp_file.name[:-len(f".{output_format}")]
-    
-    build_diagram(inputText['nodes'], inputText['edges'], base_filename, output_format)
+def generate_aws_layout(inputText, output_formats, previous_positions=None, metrics=None, layout=None):
+    images, laid_out, positions = build_diagram(inputText['nodes'], inputText['edges'], output_formats, metrics, previous_positions, layout)
+    return {output_format: BytesIO(image) for output_format, image in images.items()}, laid_out, positions
 
-    rendered_file_path = f"{base_filename}.{output_format}"
-    with open(rendered_file_path, "rb") as f:
-        aws_file = BytesIO(f.read())
-
-    return aws_file
+def generate_aws_file(inputText, output_format, metrics=None, layout=None):
+    return generate_aws_layout(inputText, [output_format], metrics=metrics, layout=layout)[0][output_format]
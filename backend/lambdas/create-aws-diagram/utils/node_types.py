@@ -1,593 +1,562 @@
-from diagrams.aws.analytics import *
-from diagrams.aws.ar import *
-from diagrams.aws.blockchain import *
-from diagrams.aws.business import *
-from diagrams.aws.compute import *
-from diagrams.aws.cost import *
-from diagrams.aws.database import *
-from diagrams.aws.devtools import *
-from diagrams.aws.enablement import *
-from diagrams.aws.enduser import *
-from diagrams.aws.engagement import *
-from diagrams.aws.game import *
-from diagrams.aws.general import *
-from diagrams.aws.integration import *
-from diagrams.aws.iot import *
-from diagrams.aws.management import *
-from diagrams.aws.media import *
-from diagrams.aws.migration import *
-from diagrams.aws.ml import *
-from diagrams.aws.mobile import *
-from diagrams.aws.network import *
-from diagrams.aws.quantum import *
-from diagrams.aws.robotics import *
-from diagrams.aws.satellite import *
-from diagrams.aws.security import *
-from diagrams.aws.storage import *
+import importlib
+import os
+
+AWS_PACKAGE = "diagrams.aws"
 
 node_types = {
     # Analytics
-    "AmazonOpensearchService": AmazonOpensearchService,
-    "Analytics": Analytics,
-    "Athena": Athena,
-    "CloudsearchSearchDocuments": CloudsearchSearchDocuments,
-    "Cloudsearch": Cloudsearch,
-    "DataLakeResource": DataLakeResource,
-    "DataPipeline": DataPipeline,
-    "ElasticsearchService": ElasticsearchService,
-    "ES": ElasticsearchService,  # Alias
-    "EMRCluster": EMRCluster,
-    "EMREngineMaprM3": EMREngineMaprM3,
-    "EMREngineMaprM5": EMREngineMaprM5,
-    "EMREngineMaprM7": EMREngineMaprM7,
-    "EMREngine": EMREngine,
-    "EMRHdfsCluster": EMRHdfsCluster,
-    "EMR": EMR,
-    "GlueCrawlers": GlueCrawlers,
-    "GlueDataCatalog": GlueDataCatalog,
-    "Glue": Glue,
-    "KinesisDataAnalytics": KinesisDataAnalytics,
-    "KinesisDataFirehose": KinesisDataFirehose,
-    "KinesisDataStreams": KinesisDataStreams,
-    "KinesisVideoStreams": KinesisVideoStreams,
-    "Kinesis": Kinesis,
-    "LakeFormation": LakeFormation,
-    "ManagedStreamingForKafka": ManagedStreamingForKafka,
-    "Quicksight": Quicksight,
-    "RedshiftDenseComputeNode": RedshiftDenseComputeNode,
-    "RedshiftDenseStorageNode": RedshiftDenseStorageNode,
-    "Redshift": Redshift,
+    "AmazonOpensearchService": ("analytics", "AmazonOpensearchService"),
+    "Analytics": ("analytics", "Analytics"),
+    "Athena": ("analytics", "Athena"),
+    "CloudsearchSearchDocuments": ("analytics", "CloudsearchSearchDocuments"),
+    "Cloudsearch": ("analytics", "Cloudsearch"),
+    "DataLakeResource": ("analytics", "DataLakeResource"),
+    "DataPipeline": ("analytics", "DataPipeline"),
+    "ElasticsearchService": ("analytics", "ElasticsearchService"),
+    "ES": ("analytics", "ElasticsearchService"),  # Alias
+    "EMRCluster": ("analytics", "EMRCluster"),
+    "EMREngineMaprM3": ("analytics", "EMREngineMaprM3"),
+    "EMREngineMaprM5": ("analytics", "EMREngineMaprM5"),
+    "EMREngineMaprM7": ("analytics", "EMREngineMaprM7"),
+    "EMREngine": ("analytics", "EMREngine"),
+    "EMRHdfsCluster": ("analytics", "EMRHdfsCluster"),
+    "EMR": ("analytics", "EMR"),
+    "GlueCrawlers": ("analytics", "GlueCrawlers"),
+    "GlueDataCatalog": ("analytics", "GlueDataCatalog"),
+    "Glue": ("analytics", "Glue"),
+    "KinesisDataAnalytics": ("analytics", "KinesisDataAnalytics"),
+    "KinesisDataFirehose": ("analytics", "KinesisDataFirehose"),
+    "KinesisDataStreams": ("analytics", "KinesisDataStreams"),
+    "Kinesis": ("analytics", "Kinesis"),
+    "LakeFormation": ("analytics", "LakeFormation"),
+    "ManagedStreamingForKafka": ("analytics", "ManagedStreamingForKafka"),
+    "Quicksight": ("analytics", "Quicksight"),
 
     # Augmented Reality
-    "ArVr": ArVr,
-    "Sumerian": Sumerian,
+    "ArVr": ("ar", "ArVr"),
+    "Sumerian": ("ar", "Sumerian"),
 
     # Blockchain
-    "BlockchainResource": BlockchainResource,
-    "Blockchain": Blockchain,
-    "ManagedBlockchain": ManagedBlockchain,
-    "QuantumLedgerDatabaseQldb": QuantumLedgerDatabaseQldb,
-    "QLDB": QuantumLedgerDatabaseQldb,  # Alias
-
-    # Business Applications
-    "BlockchainResource": BlockchainResource,
-    "Blockchain": Blockchain,
-    "ManagedBlockchain": ManagedBlockchain,
-    "QuantumLedgerDatabaseQldb": QuantumLedgerDatabaseQldb,
-    "QLDB": QuantumLedgerDatabaseQldb,  # Alias
+    "BlockchainResource": ("blockchain", "BlockchainResource"),
+    "Blockchain": ("blockchain", "Blockchain"),
+    "ManagedBlockchain": ("blockchain", "ManagedBlockchain"),
 
     # Compute
-    "AppRunner": AppRunner,
-    "ApplicationAutoScaling": ApplicationAutoScaling,
-    "AutoScaling": ApplicationAutoScaling,  # Alias
-
-    "Batch": Batch,
-    "ComputeOptimizer": ComputeOptimizer,
-    "Compute": Compute,
-
-    "EC2Ami": EC2Ami,
-    "AMI": EC2Ami,  # Alias
-    "EC2AutoScaling": EC2AutoScaling,
-    "EC2ContainerRegistryImage": EC2ContainerRegistryImage,
-    "EC2ContainerRegistryRegistry": EC2ContainerRegistryRegistry,
-    "EC2ContainerRegistry": EC2ContainerRegistry,
-    "ECR": EC2ContainerRegistry,  # Alias
-    "EC2ElasticIpAddress": EC2ElasticIpAddress,
-    "EC2ImageBuilder": EC2ImageBuilder,
-    "EC2Instance": EC2Instance,
-    "EC2Instances": EC2Instances,
-    "EC2Rescue": EC2Rescue,
-    "EC2SpotInstance": EC2SpotInstance,
-    "EC2": EC2,
-
-    "ElasticBeanstalkApplication": ElasticBeanstalkApplication,
-    "ElasticBeanstalkDeployment": ElasticBeanstalkDeployment,
-    "ElasticBeanstalk": ElasticBeanstalk,
-    "EB": ElasticBeanstalk,  # Alias
-
-    "ElasticContainerServiceContainer": ElasticContainerServiceContainer,
-    "ElasticContainerServiceService": ElasticContainerServiceService,
-    "ElasticContainerService": ElasticContainerService,
-    "ECS": ElasticContainerService,  # Alias
-
-    "ElasticKubernetesService": ElasticKubernetesService,
-    "EKS": ElasticKubernetesService,  # Alias
-
-    "Fargate": Fargate,
-    "LambdaFunction": LambdaFunction,
-    "Lambda": Lambda,
-
-    "Lightsail": Lightsail,
-    "LocalZones": LocalZones,
-    "Outposts": Outposts,
-    "ServerlessApplicationRepository": ServerlessApplicationRepository,
-    "SAR": ServerlessApplicationRepository,  # Alias
-
-    # Thinkbox Suite
-    "ThinkboxDeadline": ThinkboxDeadline,
-    "ThinkboxDraft": ThinkboxDraft,
-    "ThinkboxFrost": ThinkboxFrost,
-    "ThinkboxKrakatoa": ThinkboxKrakatoa,
-    "ThinkboxSequoia": ThinkboxSequoia,
-    "ThinkboxStoke": ThinkboxStoke,
-    "ThinkboxXmesh": ThinkboxXmesh,
-
-    "VmwareCloudOnAWS": VmwareCloudOnAWS,
-    "Wavelength": Wavelength,
+    "AppRunner": ("compute", "AppRunner"),
+    "ApplicationAutoScaling": ("compute", "ApplicationAutoScaling"),
+    "Batch": ("compute", "Batch"),
+    "ComputeOptimizer": ("compute", "ComputeOptimizer"),
+    "Compute": ("compute", "Compute"),
+    "EC2Ami": ("compute", "EC2Ami"),
+    "AMI": ("compute", "EC2Ami"),  # Alias
+    "EC2AutoScaling": ("compute", "EC2AutoScaling"),
+    "EC2ContainerRegistryImage": ("compute", "EC2ContainerRegistryImage"),
+    "EC2ContainerRegistryRegistry": ("compute", "EC2ContainerRegistryRegistry"),
+    "EC2ContainerRegistry": ("compute", "EC2ContainerRegistry"),
+    "ECR": ("compute", "EC2ContainerRegistry"),  # Alias
+    "EC2ElasticIpAddress": ("compute", "EC2ElasticIpAddress"),
+    "EC2ImageBuilder": ("compute", "EC2ImageBuilder"),
+    "EC2Instance": ("compute", "EC2Instance"),
+    "EC2Instances": ("compute", "EC2Instances"),
+    "EC2Rescue": ("compute", "EC2Rescue"),
+    "EC2SpotInstance": ("compute", "EC2SpotInstance"),
+    "EC2": ("compute", "EC2"),
+    "ElasticBeanstalkApplication": ("compute", "ElasticBeanstalkApplication"),
+    "ElasticBeanstalkDeployment": ("compute", "ElasticBeanstalkDeployment"),
+    "ElasticBeanstalk": ("compute", "ElasticBeanstalk"),
+    "EB": ("compute", "ElasticBeanstalk"),  # Alias
+    "ElasticContainerServiceContainer": ("compute", "ElasticContainerServiceContainer"),
+    "ElasticContainerServiceService": ("compute", "ElasticContainerServiceService"),
+    "ElasticContainerService": ("compute", "ElasticContainerService"),
+    "ECS": ("compute", "ElasticContainerService"),  # Alias
+    "ElasticKubernetesService": ("compute", "ElasticKubernetesService"),
+    "EKS": ("compute", "ElasticKubernetesService"),  # Alias
+    "Fargate": ("compute", "Fargate"),
+    "LambdaFunction": ("compute", "LambdaFunction"),
+    "Lambda": ("compute", "Lambda"),
+    "Lightsail": ("compute", "Lightsail"),
+    "LocalZones": ("compute", "LocalZones"),
+    "Outposts": ("compute", "Outposts"),
+    "ServerlessApplicationRepository": ("compute", "ServerlessApplicationRepository"),
+    "SAR": ("compute", "ServerlessApplicationRepository"),  # Alias
+    "ThinkboxDeadline": ("compute", "ThinkboxDeadline"),
+    "ThinkboxDraft": ("compute", "ThinkboxDraft"),
+    "ThinkboxFrost": ("compute", "ThinkboxFrost"),
+    "ThinkboxKrakatoa": ("compute", "ThinkboxKrakatoa"),
+    "ThinkboxSequoia": ("compute", "ThinkboxSequoia"),
+    "ThinkboxStoke": ("compute", "ThinkboxStoke"),
+    "ThinkboxXmesh": ("compute", "ThinkboxXmesh"),
+    "VmwareCloudOnAWS": ("compute", "VmwareCloudOnAWS"),
+    "Wavelength": ("compute", "Wavelength"),
 
     # Cost
-    "Budgets": Budgets,
-    "CostAndUsageReport": CostAndUsageReport,
-    "CostExplorer": CostExplorer,
-    "CostManagement": CostManagement,
-    "ReservedInstanceReporting": ReservedInstanceReporting,
-    "SavingsPlans": SavingsPlans,
-    
+    "Budgets": ("cost", "Budgets"),
+    "CostAndUsageReport": ("cost", "CostAndUsageReport"),
+    "CostExplorer": ("cost", "CostExplorer"),
+    "CostManagement": ("cost", "CostManagement"),
+    "ReservedInstanceReporting": ("cost", "ReservedInstanceReporting"),
+    "SavingsPlans": ("cost", "SavingsPlans"),
+
     # Database
-    "AuroraInstance": AuroraInstance,
-    "Aurora": Aurora,
-    "DatabaseMigrationServiceDatabaseMigrationWorkflow": DatabaseMigrationServiceDatabaseMigrationWorkflow,
-    "DatabaseMigrationService": DatabaseMigrationService,  # alias: DMS
-    "Database": Database,  # alias: DB
-    "DocumentdbMongodbCompatibility": DocumentdbMongodbCompatibility,  # alias: DocumentDB
-    "DynamodbAttribute": DynamodbAttribute,
-    "DynamodbAttributes": DynamodbAttributes,
-    "DynamodbDax": DynamodbDax,  # alias: DAX
-    "DynamodbGlobalSecondaryIndex": DynamodbGlobalSecondaryIndex,  # alias: DynamodbGSI
-    "DynamodbItem": DynamodbItem,
-    "DynamodbItems": DynamodbItems,
-    "DynamodbStreams": DynamodbStreams,
-    "DynamodbTable": DynamodbTable,
-    "Dynamodb": Dynamodb,  # alias: DDB
-    "ElasticacheCacheNode": ElasticacheCacheNode,
-    "ElasticacheForMemcached": ElasticacheForMemcached,
-    "ElasticacheForRedis": ElasticacheForRedis,
-    "Elasticache": Elasticache,  # alias: ElastiCache
-    "KeyspacesManagedApacheCassandraService": KeyspacesManagedApacheCassandraService,
-    "Neptune": Neptune,
-    "QuantumLedgerDatabaseQldb": QuantumLedgerDatabaseQldb,  # alias: QLDB
-    "RDSInstance": RDSInstance,
-    "RDSMariadbInstance": RDSMariadbInstance,
-    "RDSMysqlInstance": RDSMysqlInstance,
-    "RDSOnVmware": RDSOnVmware,
-    "RDSOracleInstance": RDSOracleInstance,
-    "RDSPostgresqlInstance": RDSPostgresqlInstance,
-    "RDSSqlServerInstance": RDSSqlServerInstance,
-    "RDS": RDS,
-    "RedshiftDenseComputeNode": RedshiftDenseComputeNode,
-    "RedshiftDenseStorageNode": RedshiftDenseStorageNode,
-    "Redshift": Redshift,
-    "Timestream": Timestream,
+    "RedshiftDenseComputeNode": ("database", "RedshiftDenseComputeNode"),
+    "RedshiftDenseStorageNode": ("database", "RedshiftDenseStorageNode"),
+    "Redshift": ("database", "Redshift"),
+    "QuantumLedgerDatabaseQldb": ("database", "QuantumLedgerDatabaseQldb"),
+    "QLDB": ("database", "QuantumLedgerDatabaseQldb"),  # Alias
+    "AuroraInstance": ("database", "AuroraInstance"),
+    "Aurora": ("database", "Aurora"),
+    "DatabaseMigrationServiceDatabaseMigrationWorkflow": ("database", "DatabaseMigrationServiceDatabaseMigrationWorkflow"),
+    "Database": ("database", "Database"),
+    "DocumentdbMongodbCompatibility": ("database", "DocumentdbMongodbCompatibility"),
+    "DynamodbAttribute": ("database", "DynamodbAttribute"),
+    "DynamodbAttributes": ("database", "DynamodbAttributes"),
+    "DynamodbDax": ("database", "DynamodbDax"),
+    "DynamodbGlobalSecondaryIndex": ("database", "DynamodbGlobalSecondaryIndex"),
+    "DynamodbItem": ("database", "DynamodbItem"),
+    "DynamodbItems": ("database", "DynamodbItems"),
+    "DynamodbStreams": ("database", "DynamodbStreams"),
+    "DynamodbTable": ("database", "DynamodbTable"),
+    "Dynamodb": ("database", "Dynamodb"),
+    "ElasticacheCacheNode": ("database", "ElasticacheCacheNode"),
+    "ElasticacheForMemcached": ("database", "ElasticacheForMemcached"),
+    "ElasticacheForRedis": ("database", "ElasticacheForRedis"),
+    "Elasticache": ("database", "Elasticache"),
+    "KeyspacesManagedApacheCassandraService": ("database", "KeyspacesManagedApacheCassandraService"),
+    "Neptune": ("database", "Neptune"),
+    "RDSInstance": ("database", "RDSInstance"),
+    "RDSMariadbInstance": ("database", "RDSMariadbInstance"),
+    "RDSMysqlInstance": ("database", "RDSMysqlInstance"),
+    "RDSOnVmware": ("database", "RDSOnVmware"),
+    "RDSOracleInstance": ("database", "RDSOracleInstance"),
+    "RDSPostgresqlInstance": ("database", "RDSPostgresqlInstance"),
+    "RDSSqlServerInstance": ("database", "RDSSqlServerInstance"),
+    "RDS": ("database", "RDS"),
+    "Timestream": ("database", "Timestream"),
 
     # DevTools
-    "CloudDevelopmentKit": CloudDevelopmentKit,
-    "Cloud9Resource": Cloud9Resource,
-    "Cloud9": Cloud9,
-    "Codeartifact": Codeartifact,
-    "Codebuild": Codebuild,
-    "Codecommit": Codecommit,
-    "Codedeploy": Codedeploy,
-    "Codepipeline": Codepipeline,
-    "Codestar": Codestar,
-    "CommandLineInterface": CommandLineInterface,  # alias: CLI
-    "DeveloperTools": DeveloperTools,  # alias: DevTools
-    "ToolsAndSdks": ToolsAndSdks,
-    "XRay": XRay,
+    "CloudDevelopmentKit": ("devtools", "CloudDevelopmentKit"),
+    "Cloud9Resource": ("devtools", "Cloud9Resource"),
+    "Cloud9": ("devtools", "Cloud9"),
+    "Codeartifact": ("devtools", "Codeartifact"),
+    "Codebuild": ("devtools", "Codebuild"),
+    "Codecommit": ("devtools", "Codecommit"),
+    "Codedeploy": ("devtools", "Codedeploy"),
+    "Codepipeline": ("devtools", "Codepipeline"),
+    "Codestar": ("devtools", "Codestar"),
+    "DeveloperTools": ("devtools", "DeveloperTools"),
+    "ToolsAndSdks": ("devtools", "ToolsAndSdks"),
+    "XRay": ("devtools", "XRay"),
 
     # Enablement
-    "CustomerEnablement": CustomerEnablement,
-    "Iq": Iq,
-    "ManagedServices": ManagedServices,
-    "ProfessionalServices": ProfessionalServices,
-    "Support": Support,
+    "CustomerEnablement": ("enablement", "CustomerEnablement"),
+    "Iq": ("enablement", "Iq"),
+    "ProfessionalServices": ("enablement", "ProfessionalServices"),
+    "Support": ("enablement", "Support"),
 
     # End User Computing
-    "Appstream20": Appstream20,
-    "DesktopAndAppStreaming": DesktopAndAppStreaming,
-    "Workdocs": Workdocs,
-    "Worklink": Worklink,
-    "Workspaces": Workspaces,
+    "Appstream20": ("enduser", "Appstream20"),
+    "DesktopAndAppStreaming": ("enduser", "DesktopAndAppStreaming"),
+    "Workdocs": ("enduser", "Workdocs"),
+    "Worklink": ("enduser", "Worklink"),
+    "Workspaces": ("enduser", "Workspaces"),
 
     # Customer Engagement
-    "Connect": Connect,
-    "CustomerEngagement": CustomerEngagement,
-    "Pinpoint": Pinpoint,
-    "SimpleEmailServiceSesEmail": SimpleEmailServiceSesEmail,
-    "SimpleEmailServiceSes": SimpleEmailServiceSes,  # alias: SES
+    "Connect": ("engagement", "Connect"),
+    "CustomerEngagement": ("engagement", "CustomerEngagement"),
+    "SimpleEmailServiceSesEmail": ("engagement", "SimpleEmailServiceSesEmail"),
+    "SimpleEmailServiceSes": ("engagement", "SimpleEmailServiceSes"),
 
     # Game Tech
-    "GameTech": GameTech,
-    "Gamelift": Gamelift,
+    "GameTech": ("game", "GameTech"),
+    "Gamelift": ("game", "Gamelift"),
 
     # General
-    "Client": Client,
-    "Disk": Disk,
-    "Forums": Forums,
-    "General": General,
-    "GenericDatabase": GenericDatabase,
-    "GenericFirewall": GenericFirewall,
-    "GenericOfficeBuilding": GenericOfficeBuilding,  # alias: OfficeBuilding
-    "GenericSamlToken": GenericSamlToken,
-    "GenericSDK": GenericSDK,
-    "InternetAlt1": InternetAlt1,
-    "InternetAlt2": InternetAlt2,
-    "InternetGateway": InternetGateway,
-    "Marketplace": Marketplace,
-    "MobileClient": MobileClient,
-    "Multimedia": Multimedia,
-    "OfficeBuilding": OfficeBuilding,
-    "SamlToken": SamlToken,
-    "SDK": SDK,
-    "SslPadlock": SslPadlock,
-    "TapeStorage": TapeStorage,
-    "Toolkit": Toolkit,
-    "TraditionalServer": TraditionalServer,
-    "User": User,
-    "Users": Users,
+    "Client": ("general", "Client"),
+    "Disk": ("general", "Disk"),
+    "Forums": ("general", "Forums"),
+    "General": ("general", "General"),
+    "GenericDatabase": ("general", "GenericDatabase"),
+    "GenericFirewall": ("general", "GenericFirewall"),
+    "GenericOfficeBuilding": ("general", "GenericOfficeBuilding"),
+    "GenericSamlToken": ("general", "GenericSamlToken"),
+    "GenericSDK": ("general", "GenericSDK"),
+    "InternetAlt1": ("general", "InternetAlt1"),
+    "InternetAlt2": ("general", "InternetAlt2"),
+    "Marketplace": ("general", "Marketplace"),
+    "MobileClient": ("general", "MobileClient"),
+    "Multimedia": ("general", "Multimedia"),
+    "OfficeBuilding": ("general", "OfficeBuilding"),
+    "SamlToken": ("general", "SamlToken"),
+    "SDK": ("general", "SDK"),
+    "SslPadlock": ("general", "SslPadlock"),
+    "TapeStorage": ("general", "TapeStorage"),
+    "Toolkit": ("general", "Toolkit"),
+    "TraditionalServer": ("general", "TraditionalServer"),
+    "User": ("general", "User"),
+    "Users": ("general", "Users"),
 
     # Integration
-    "ApplicationIntegration": ApplicationIntegration,
-    "Appsync": Appsync,
-    "ConsoleMobileApplication": ConsoleMobileApplication,
-    "EventResource": EventResource,
-    "EventbridgeCustomEventBusResource": EventbridgeCustomEventBusResource,
-    "EventbridgeDefaultEventBusResource": EventbridgeDefaultEventBusResource,
-    "EventbridgeSaasPartnerEventBusResource": EventbridgeSaasPartnerEventBusResource,
-    "Eventbridge": Eventbridge,
-    "ExpressWorkflows": ExpressWorkflows,
-    "MQ": MQ,
-    "SimpleNotificationServiceSnsEmailNotification": SimpleNotificationServiceSnsEmailNotification,
-    "SimpleNotificationServiceSnsHttpNotification": SimpleNotificationServiceSnsHttpNotification,
-    "SimpleNotificationServiceSnsTopic": SimpleNotificationServiceSnsTopic,
-    "SimpleNotificationServiceSns": SimpleNotificationServiceSns,  # alias: SNS
-    "SimpleQueueServiceSqsMessage": SimpleQueueServiceSqsMessage,
-    "SimpleQueueServiceSqsQueue": SimpleQueueServiceSqsQueue,
-    "SimpleQueueServiceSqs": SimpleQueueServiceSqs,  # alias: SQS
-    "StepFunctions": StepFunctions,  # alias: SF
+    "ApplicationIntegration": ("integration", "ApplicationIntegration"),
+    "ConsoleMobileApplication": ("integration", "ConsoleMobileApplication"),
+    "EventResource": ("integration", "EventResource"),
+    "EventbridgeCustomEventBusResource": ("integration", "EventbridgeCustomEventBusResource"),
+    "EventbridgeDefaultEventBusResource": ("integration", "EventbridgeDefaultEventBusResource"),
+    "EventbridgeSaasPartnerEventBusResource": ("integration", "EventbridgeSaasPartnerEventBusResource"),
+    "Eventbridge": ("integration", "Eventbridge"),
+    "ExpressWorkflows": ("integration", "ExpressWorkflows"),
+    "MQ": ("integration", "MQ"),
+    "SimpleNotificationServiceSnsEmailNotification": ("integration", "SimpleNotificationServiceSnsEmailNotification"),
+    "SimpleNotificationServiceSnsHttpNotification": ("integration", "SimpleNotificationServiceSnsHttpNotification"),
+    "SimpleNotificationServiceSnsTopic": ("integration", "SimpleNotificationServiceSnsTopic"),
+    "SimpleNotificationServiceSns": ("integration", "SimpleNotificationServiceSns"),
+    "SimpleQueueServiceSqsMessage": ("integration", "SimpleQueueServiceSqsMessage"),
+    "SimpleQueueServiceSqsQueue": ("integration", "SimpleQueueServiceSqsQueue"),
+    "SimpleQueueServiceSqs": ("integration", "SimpleQueueServiceSqs"),
+    "StepFunctions": ("integration", "StepFunctions"),
 
     # Internet of Things
-    "Freertos": Freertos,  # alias: FreeRTOS
-    "InternetOfThings": InternetOfThings,
-    "Iot1Click": Iot1Click,
-    "IotAction": IotAction,
-    "IotActuator": IotActuator,
-    "IotAlexaEcho": IotAlexaEcho,
-    "IotAlexaEnabledDevice": IotAlexaEnabledDevice,
-    "IotAlexaSkill": IotAlexaSkill,
-    "IotAlexaVoiceService": IotAlexaVoiceService,
-    "IotAnalyticsChannel": IotAnalyticsChannel,
-    "IotAnalyticsDataSet": IotAnalyticsDataSet,
-    "IotAnalyticsDataStore": IotAnalyticsDataStore,
-    "IotAnalyticsNotebook": IotAnalyticsNotebook,
-    "IotAnalyticsPipeline": IotAnalyticsPipeline,
-    "IotAnalytics": IotAnalytics,
-    "IotBank": IotBank,
-    "IotBicycle": IotBicycle,
-    "IotButton": IotButton,
-    "IotCamera": IotCamera,
-    "IotCar": IotCar,
-    "IotCart": IotCart,
-    "IotCertificate": IotCertificate,
-    "IotCoffeePot": IotCoffeePot,
-    "IotCore": IotCore,
-    "IotDesiredState": IotDesiredState,
-    "IotDeviceDefender": IotDeviceDefender,
-    "IotDeviceGateway": IotDeviceGateway,
-    "IotDeviceManagement": IotDeviceManagement,
-    "IotDoorLock": IotDoorLock,
-    "IotEvents": IotEvents,
-    "IotFactory": IotFactory,
-    "IotFireTvStick": IotFireTvStick,
-    "IotFireTv": IotFireTv,
-    "IotGeneric": IotGeneric,
-    "IotGreengrassConnector": IotGreengrassConnector,
-    "IotGreengrass": IotGreengrass,
-    "IotHardwareBoard": IotHardwareBoard,  # alias: IotBoard
-    "IotHouse": IotHouse,
-    "IotHttp": IotHttp,
-    "IotHttp2": IotHttp2,
-    "IotJobs": IotJobs,
-    "IotLambda": IotLambda,
-    "IotLightbulb": IotLightbulb,
-    "IotMedicalEmergency": IotMedicalEmergency,
-    "IotMqtt": IotMqtt,
-    "IotOverTheAirUpdate": IotOverTheAirUpdate,
-    "IotPolicyEmergency": IotPolicyEmergency,
-    "IotPolicy": IotPolicy,
-    "IotReportedState": IotReportedState,
-    "IotRule": IotRule,
-    "IotSensor": IotSensor,
-    "IotServo": IotServo,
-    "IotShadow": IotShadow,
-    "IotSimulator": IotSimulator,
-    "IotSitewise": IotSitewise,
-    "IotThermostat": IotThermostat,
-    "IotThingsGraph": IotThingsGraph,
-    "IotTopic": IotTopic,
-    "IotTravel": IotTravel,
-    "IotUtility": IotUtility,
-    "IotWindfarm": IotWindfarm,
+    "Freertos": ("iot", "Freertos"),
+    "InternetOfThings": ("iot", "InternetOfThings"),
+    "Iot1Click": ("iot", "Iot1Click"),
+    "IotAction": ("iot", "IotAction"),
+    "IotActuator": ("iot", "IotActuator"),
+    "IotAlexaEcho": ("iot", "IotAlexaEcho"),
+    "IotAlexaEnabledDevice": ("iot", "IotAlexaEnabledDevice"),
+    "IotAlexaSkill": ("iot", "IotAlexaSkill"),
+    "IotAlexaVoiceService": ("iot", "IotAlexaVoiceService"),
+    "IotAnalyticsChannel": ("iot", "IotAnalyticsChannel"),
+    "IotAnalyticsDataSet": ("iot", "IotAnalyticsDataSet"),
+    "IotAnalyticsDataStore": ("iot", "IotAnalyticsDataStore"),
+    "IotAnalyticsNotebook": ("iot", "IotAnalyticsNotebook"),
+    "IotAnalyticsPipeline": ("iot", "IotAnalyticsPipeline"),
+    "IotAnalytics": ("iot", "IotAnalytics"),
+    "IotBank": ("iot", "IotBank"),
+    "IotBicycle": ("iot", "IotBicycle"),
+    "IotButton": ("iot", "IotButton"),
+    "IotCamera": ("iot", "IotCamera"),
+    "IotCar": ("iot", "IotCar"),
+    "IotCart": ("iot", "IotCart"),
+    "IotCertificate": ("iot", "IotCertificate"),
+    "IotCoffeePot": ("iot", "IotCoffeePot"),
+    "IotCore": ("iot", "IotCore"),
+    "IotDesiredState": ("iot", "IotDesiredState"),
+    "IotDeviceDefender": ("iot", "IotDeviceDefender"),
+    "IotDeviceGateway": ("iot", "IotDeviceGateway"),
+    "IotDeviceManagement": ("iot", "IotDeviceManagement"),
+    "IotDoorLock": ("iot", "IotDoorLock"),
+    "IotEvents": ("iot", "IotEvents"),
+    "IotFactory": ("iot", "IotFactory"),
+    "IotFireTvStick": ("iot", "IotFireTvStick"),
+    "IotFireTv": ("iot", "IotFireTv"),
+    "IotGeneric": ("iot", "IotGeneric"),
+    "IotGreengrassConnector": ("iot", "IotGreengrassConnector"),
+    "IotGreengrass": ("iot", "IotGreengrass"),
+    "IotHardwareBoard": ("iot", "IotHardwareBoard"),
+    "IotHouse": ("iot", "IotHouse"),
+    "IotHttp": ("iot", "IotHttp"),
+    "IotHttp2": ("iot", "IotHttp2"),
+    "IotJobs": ("iot", "IotJobs"),
+    "IotLambda": ("iot", "IotLambda"),
+    "IotLightbulb": ("iot", "IotLightbulb"),
+    "IotMedicalEmergency": ("iot", "IotMedicalEmergency"),
+    "IotMqtt": ("iot", "IotMqtt"),
+    "IotOverTheAirUpdate": ("iot", "IotOverTheAirUpdate"),
+    "IotPolicyEmergency": ("iot", "IotPolicyEmergency"),
+    "IotPolicy": ("iot", "IotPolicy"),
+    "IotReportedState": ("iot", "IotReportedState"),
+    "IotRule": ("iot", "IotRule"),
+    "IotSensor": ("iot", "IotSensor"),
+    "IotServo": ("iot", "IotServo"),
+    "IotShadow": ("iot", "IotShadow"),
+    "IotSimulator": ("iot", "IotSimulator"),
+    "IotSitewise": ("iot", "IotSitewise"),
+    "IotThermostat": ("iot", "IotThermostat"),
+    "IotThingsGraph": ("iot", "IotThingsGraph"),
+    "IotTopic": ("iot", "IotTopic"),
+    "IotTravel": ("iot", "IotTravel"),
+    "IotUtility": ("iot", "IotUtility"),
+    "IotWindfarm": ("iot", "IotWindfarm"),
 
     # Management
-    "AmazonDevopsGuru": AmazonDevopsGuru,
-    "AmazonManagedGrafana": AmazonManagedGrafana,
-    "AmazonManagedPrometheus": AmazonManagedPrometheus,
-    "AmazonManagedWorkflowsApacheAirflow": AmazonManagedWorkflowsApacheAirflow,
-    "AutoScaling": AutoScaling,
-    "Chatbot": Chatbot,
-    "CloudformationChangeSet": CloudformationChangeSet,
-    "CloudformationStack": CloudformationStack,
-    "CloudformationTemplate": CloudformationTemplate,
-    "Cloudformation": Cloudformation,
-    "Cloudtrail": Cloudtrail,
-    "CloudwatchAlarm": CloudwatchAlarm,
-    "CloudwatchEventEventBased": CloudwatchEventEventBased,
-    "CloudwatchEventTimeBased": CloudwatchEventTimeBased,
-    "CloudwatchLogs": CloudwatchLogs,
-    "CloudwatchRule": CloudwatchRulediagrams.aws.management.CloudwatchRule,
-    "Cloudwatch": Cloudwatch,
-    "Codeguru": Codeguru,
-    "CommandLineInterface": CommandLineInterface,
-    "Config": Config,
-    "ControlTower": ControlTower,
-    "LicenseManager": LicenseManager,
-    "ManagedServices": ManagedServices,
-    "ManagementAndGovernance": ManagementAndGovernance,
-    "ManagementConsole": ManagementConsole,
-    "OpsworksApps": OpsworksApps,
-    "OpsworksDeployments": OpsworksDeployments,
-    "OpsworksInstances": OpsworksInstances,
-    "OpsworksLayers": OpsworksLayers,
-    "OpsworksMonitoring": OpsworksMonitoring,
-    "OpsworksPermissions": OpsworksPermissions,
-    "OpsworksResources": OpsworksResources,
-    "OpsworksStack": OpsworksStack,
-    "Opsworks": Opsworks,
-    "OrganizationsAccount": OrganizationsAccount,
-    "OrganizationsOrganizationalUnit": OrganizationsOrganizationalUnit,
-    "Organizations": Organizations,
-    "PersonalHealthDashboard": PersonalHealthDashboard,
-    "Proton": Proton,
-    "ServiceCatalog": ServiceCatalog,
-    "SystemsManagerAppConfig": SystemsManagerAppConfig,
-    "SystemsManagerAutomation": SystemsManagerAutomation,
-    "SystemsManagerDocuments": SystemsManagerDocuments,
-    "SystemsManagerInventory": SystemsManagerInventory,
-    "SystemsManagerMaintenanceWindows": SystemsManagerMaintenanceWindows,
-    "SystemsManagerOpscenter": SystemsManagerOpscenter,
-    "SystemsManagerParameterStore": SystemsManagerParameterStore,  # alias: ParameterStore
-    "SystemsManagerPatchManager": SystemsManagerPatchManager,
-    "SystemsManagerRunCommand": SystemsManagerRunCommand,
-    "SystemsManagerStateManager": SystemsManagerStateManager,
-    "SystemsManager": SystemsManager,  # alias: SSM
-    "TrustedAdvisorChecklistCost": TrustedAdvisorChecklistCost,
-    "TrustedAdvisorChecklistFaultTolerant": TrustedAdvisorChecklistFaultTolerant,
-    "TrustedAdvisorChecklistPerformance": TrustedAdvisorChecklistPerformance,
-    "TrustedAdvisorChecklistSecurity": TrustedAdvisorChecklistSecurity,
-    "TrustedAdvisorChecklist": TrustedAdvisorChecklist,
-    "TrustedAdvisor": TrustedAdvisor,
-    "WellArchitectedTool": WellArchitectedTool,
+    "AutoScaling": ("management", "AutoScaling"),
+    "CommandLineInterface": ("management", "CommandLineInterface"),
+    "ManagedServices": ("management", "ManagedServices"),
+    "AmazonDevopsGuru": ("management", "AmazonDevopsGuru"),
+    "AmazonManagedGrafana": ("management", "AmazonManagedGrafana"),
+    "AmazonManagedPrometheus": ("management", "AmazonManagedPrometheus"),
+    "AmazonManagedWorkflowsApacheAirflow": ("management", "AmazonManagedWorkflowsApacheAirflow"),
+    "Chatbot": ("management", "Chatbot"),
+    "CloudformationChangeSet": ("management", "CloudformationChangeSet"),
+    "CloudformationStack": ("management", "CloudformationStack"),
+    "CloudformationTemplate": ("management", "CloudformationTemplate"),
+    "Cloudformation": ("management", "Cloudformation"),
+    "Cloudtrail": ("management", "Cloudtrail"),
+    "CloudwatchAlarm": ("management", "CloudwatchAlarm"),
+    "CloudwatchEventEventBased": ("management", "CloudwatchEventEventBased"),
+    "CloudwatchEventTimeBased": ("management", "CloudwatchEventTimeBased"),
+    "CloudwatchLogs": ("management", "CloudwatchLogs"),
+    "CloudwatchRule": ("management", "CloudwatchRule"),
+    "Cloudwatch": ("management", "Cloudwatch"),
+    "Codeguru": ("management", "Codeguru"),
+    "Config": ("management", "Config"),
+    "ControlTower": ("management", "ControlTower"),
+    "LicenseManager": ("management", "LicenseManager"),
+    "ManagementAndGovernance": ("management", "ManagementAndGovernance"),
+    "ManagementConsole": ("management", "ManagementConsole"),
+    "OpsworksApps": ("management", "OpsworksApps"),
+    "OpsworksDeployments": ("management", "OpsworksDeployments"),
+    "OpsworksInstances": ("management", "OpsworksInstances"),
+    "OpsworksLayers": ("management", "OpsworksLayers"),
+    "OpsworksMonitoring": ("management", "OpsworksMonitoring"),
+    "OpsworksPermissions": ("management", "OpsworksPermissions"),
+    "OpsworksResources": ("management", "OpsworksResources"),
+    "OpsworksStack": ("management", "OpsworksStack"),
+    "Opsworks": ("management", "Opsworks"),
+    "OrganizationsAccount": ("management", "OrganizationsAccount"),
+    "OrganizationsOrganizationalUnit": ("management", "OrganizationsOrganizationalUnit"),
+    "Organizations": ("management", "Organizations"),
+    "PersonalHealthDashboard": ("management", "PersonalHealthDashboard"),
+    "Proton": ("management", "Proton"),
+    "ServiceCatalog": ("management", "ServiceCatalog"),
+    "SystemsManagerAppConfig": ("management", "SystemsManagerAppConfig"),
+    "SystemsManagerAutomation": ("management", "SystemsManagerAutomation"),
+    "SystemsManagerDocuments": ("management", "SystemsManagerDocuments"),
+    "SystemsManagerInventory": ("management", "SystemsManagerInventory"),
+    "SystemsManagerMaintenanceWindows": ("management", "SystemsManagerMaintenanceWindows"),
+    "SystemsManagerOpscenter": ("management", "SystemsManagerOpscenter"),
+    "SystemsManagerParameterStore": ("management", "SystemsManagerParameterStore"),
+    "SystemsManagerPatchManager": ("management", "SystemsManagerPatchManager"),
+    "SystemsManagerRunCommand": ("management", "SystemsManagerRunCommand"),
+    "SystemsManagerStateManager": ("management", "SystemsManagerStateManager"),
+    "SystemsManager": ("management", "SystemsManager"),
+    "TrustedAdvisorChecklistCost": ("management", "TrustedAdvisorChecklistCost"),
+    "TrustedAdvisorChecklistFaultTolerant": ("management", "TrustedAdvisorChecklistFaultTolerant"),
+    "TrustedAdvisorChecklistPerformance": ("management", "TrustedAdvisorChecklistPerformance"),
+    "TrustedAdvisorChecklistSecurity": ("management", "TrustedAdvisorChecklistSecurity"),
+    "TrustedAdvisorChecklist": ("management", "TrustedAdvisorChecklist"),
+    "TrustedAdvisor": ("management", "TrustedAdvisor"),
+    "WellArchitectedTool": ("management", "WellArchitectedTool"),
 
     # Media
-    "ElasticTranscoder": ElasticTranscoder,
-    "ElementalConductor": ElementalConductor,
-    "ElementalDelta": ElementalDelta,
-    "ElementalLive": ElementalLive,
-    "ElementalMediaconnect": ElementalMediaconnect,
-    "ElementalMediaconvert": ElementalMediaconvert,
-    "ElementalMedialive": ElementalMedialive,
-    "ElementalMediapackage": ElementalMediapackage,
-    "ElementalMediastore": ElementalMediastore,
-    "ElementalMediatailor": ElementalMediatailor,
-    "ElementalServer": ElementalServer,
-    "KinesisVideoStreams": KinesisVideoStreams,
-    "MediaServices": MediaServices,
+    "KinesisVideoStreams": ("media", "KinesisVideoStreams"),
+    "ElasticTranscoder": ("media", "ElasticTranscoder"),
+    "ElementalConductor": ("media", "ElementalConductor"),
+    "ElementalDelta": ("media", "ElementalDelta"),
+    "ElementalLive": ("media", "ElementalLive"),
+    "ElementalMediaconnect": ("media", "ElementalMediaconnect"),
+    "ElementalMediaconvert": ("media", "ElementalMediaconvert"),
+    "ElementalMedialive": ("media", "ElementalMedialive"),
+    "ElementalMediapackage": ("media", "ElementalMediapackage"),
+    "ElementalMediastore": ("media", "ElementalMediastore"),
+    "ElementalMediatailor": ("media", "ElementalMediatailor"),
+    "ElementalServer": ("media", "ElementalServer"),
+    "MediaServices": ("media", "MediaServices"),
 
     # Migration
-    "ApplicationDiscoveryService": ApplicationDiscoveryService,  # alias: ADS
-    "CloudendureMigration": CloudendureMigration,  # alias: CEM
-    "DatabaseMigrationService": DatabaseMigrationService,  # alias: DMS
-    "DatasyncAgent": DatasyncAgent,
-    "Datasync": Datasync,
-    "MigrationAndTransfer": MigrationAndTransfer,  # alias: MAT
-    "MigrationHub": MigrationHub,
-    "ServerMigrationService": ServerMigrationService,  # alias: SMS
-    "SnowballEdge": SnowballEdge,
-    "Snowball": Snowball,
-    "Snowmobile": Snowmobile,
-    "TransferForSftp": TransferForSftp,
+    "DatabaseMigrationService": ("migration", "DatabaseMigrationService"),
+    "ApplicationDiscoveryService": ("migration", "ApplicationDiscoveryService"),
+    "CloudendureMigration": ("migration", "CloudendureMigration"),
+    "DatasyncAgent": ("migration", "DatasyncAgent"),
+    "Datasync": ("migration", "Datasync"),
+    "MigrationAndTransfer": ("migration", "MigrationAndTransfer"),
+    "MigrationHub": ("migration", "MigrationHub"),
+    "ServerMigrationService": ("migration", "ServerMigrationService"),
+    "TransferForSftp": ("migration", "TransferForSftp"),
 
     # Machine Learning
-    "ApacheMxnetOnAWS": ApacheMxnetOnAWS,
-    "AugmentedAi": AugmentedAi,
-    "Bedrock": Bedrock,
-    "Comprehend": Comprehend,
-    "DeepLearningAmis": DeepLearningAmis,
-    "DeepLearningContainers": DeepLearningContainers,  # alias: DLC
-    "Deepcomposer": Deepcomposer,
-    "Deeplens": Deeplens,
-    "Deepracer": Deepracer,
-    "ElasticInference": ElasticInference,
-    "Forecast": Forecast,
-    "FraudDetector": FraudDetector,
-    "Kendra": Kendra,
-    "Lex": Lex,
-    "MachineLearning": MachineLearning,
-    "Personalize": Personalize,
-    "Polly": Polly,
-    "RekognitionImage": RekognitionImage,
-    "RekognitionVideo": RekognitionVideo,
-    "Rekognition": Rekognition,
-    "SagemakerGroundTruth": SagemakerGroundTruth,
-    "SagemakerModel": SagemakerModel,
-    "SagemakerNotebook": SagemakerNotebook,
-    "SagemakerTrainingJob": SagemakerTrainingJob,
-    "Sagemaker": Sagemaker,
-    "TensorflowOnAWS": TensorflowOnAWS,
-    "Textract": Textract,
-    "Transcribe": Transcribe,
-    "Translate": Translate,
+    "ApacheMxnetOnAWS": ("ml", "ApacheMxnetOnAWS"),
+    "AugmentedAi": ("ml", "AugmentedAi"),
+    "Bedrock": ("ml", "Bedrock"),
+    "Comprehend": ("ml", "Comprehend"),
+    "DeepLearningAmis": ("ml", "DeepLearningAmis"),
+    "DeepLearningContainers": ("ml", "DeepLearningContainers"),
+    "Deepcomposer": ("ml", "Deepcomposer"),
+    "Deeplens": ("ml", "Deeplens"),
+    "Deepracer": ("ml", "Deepracer"),
+    "ElasticInference": ("ml", "ElasticInference"),
+    "Forecast": ("ml", "Forecast"),
+    "FraudDetector": ("ml", "FraudDetector"),
+    "Kendra": ("ml", "Kendra"),
+    "Lex": ("ml", "Lex"),
+    "MachineLearning": ("ml", "MachineLearning"),
+    "Personalize": ("ml", "Personalize"),
+    "Polly": ("ml", "Polly"),
+    "RekognitionImage": ("ml", "RekognitionImage"),
+    "RekognitionVideo": ("ml", "RekognitionVideo"),
+    "Rekognition": ("ml", "Rekognition"),
+    "SagemakerGroundTruth": ("ml", "SagemakerGroundTruth"),
+    "SagemakerModel": ("ml", "SagemakerModel"),
+    "SagemakerNotebook": ("ml", "SagemakerNotebook"),
+    "SagemakerTrainingJob": ("ml", "SagemakerTrainingJob"),
+    "Sagemaker": ("ml", "Sagemaker"),
+    "TensorflowOnAWS": ("ml", "TensorflowOnAWS"),
+    "Textract": ("ml", "Textract"),
+    "Transcribe": ("ml", "Transcribe"),
+    "Translate": ("ml", "Translate"),
 
     # Mobile
-    "Amplify": Amplify,
-    "APIGatewayEndpoint": APIGatewayEndpoint,
-    "APIGateway": APIGateway,
-    "Appsync": Appsync,
-    "DeviceFarm": DeviceFarm,
-    "Mobile": Mobile,
-    "Pinpoint": Pinpoint,
+    "Pinpoint": ("mobile", "Pinpoint"),
+    "Appsync": ("mobile", "Appsync"),
+    "Amplify": ("mobile", "Amplify"),
+    "DeviceFarm": ("mobile", "DeviceFarm"),
+    "Mobile": ("mobile", "Mobile"),
 
     # Network
-    "APIGatewayEndpoint": APIGatewayEndpoint,
-    "APIGateway": APIGateway,
-    "AppMesh": AppMesh,
-    "ClientVpn": ClientVpn,
-    "CloudMap": CloudMap,
-    "CloudFrontDownloadDistribution": CloudFrontDownloadDistribution,
-    "CloudFrontEdgeLocation": CloudFrontEdgeLocation,
-    "CloudFrontStreamingDistribution": CloudFrontStreamingDistribution,
-    "CloudFront": CloudFront,  # alias: CF
-    "DirectConnect": DirectConnect,
-    "ElasticLoadBalancing": ElasticLoadBalancing,
-    "ELB": ElasticLoadBalancing,
-    "ElbApplicationLoadBalancer": ElbApplicationLoadBalancer,
-    "ALB": ElbApplicationLoadBalancer,
-    "ElbClassicLoadBalancer": ElbClassicLoadBalancer,  # alias: CLB
-    "ElbNetworkLoadBalancer": ElbNetworkLoadBalancer,  # alias: NLB
-    "Endpoint": Endpoint,
-    "GlobalAccelerator": GlobalAccelerator,  # alias: GAX
-    "InternetGateway": InternetGateway,  # alias: IGW
-    "Nacl": Nacl,
-    "NATGateway": NATGateway,
-    "NetworkFirewall": NetworkFirewall,
-    "NetworkingAndContentDelivery": NetworkingAndContentDelivery,
-    "PrivateSubnet": PrivateSubnet,
-    "Privatelink": Privatelink,
-    "PublicSubnet": PublicSubnet,
-    "Route53HostedZone": Route53HostedZone,
-    "Route53": Route53,
-    "RouteTable": RouteTable,
-    "SiteToSiteVpn": SiteToSiteVpn,
-    "TransitGatewayAttachment": TransitGatewayAttachment,  # alias: TGWAttach
-    "TransitGateway": TransitGateway,  # alias: TGW
-    "VPCCustomerGateway": VPCCustomerGateway,
-    "VPCElasticNetworkAdapter": VPCElasticNetworkAdapter,
-    "VPCElasticNetworkInterface": VPCElasticNetworkInterface,
-    "VPCFlowLogs": VPCFlowLogs,
-    "VPCPeering": VPCPeering,
-    "VPCRouter": VPCRouter,
-    "VPCTrafficMirroring": VPCTrafficMirroring,
-    "VPC": VPC,
-    "VpnConnection": VpnConnection,
-    "VpnGateway": VpnGateway,
+    "InternetGateway": ("network", "InternetGateway"),
+    "APIGatewayEndpoint": ("network", "APIGatewayEndpoint"),
+    "APIGateway": ("network", "APIGateway"),
+    "AppMesh": ("network", "AppMesh"),
+    "ClientVpn": ("network", "ClientVpn"),
+    "CloudMap": ("network", "CloudMap"),
+    "CloudFrontDownloadDistribution": ("network", "CloudFrontDownloadDistribution"),
+    "CloudFrontEdgeLocation": ("network", "CloudFrontEdgeLocation"),
+    "CloudFrontStreamingDistribution": ("network", "CloudFrontStreamingDistribution"),
+    "CloudFront": ("network", "CloudFront"),
+    "DirectConnect": ("network", "DirectConnect"),
+    "ElasticLoadBalancing": ("network", "ElasticLoadBalancing"),
+    "ELB": ("network", "ElasticLoadBalancing"),  # Alias
+    "ElbApplicationLoadBalancer": ("network", "ElbApplicationLoadBalancer"),
+    "ALB": ("network", "ElbApplicationLoadBalancer"),  # Alias
+    "ElbClassicLoadBalancer": ("network", "ElbClassicLoadBalancer"),
+    "ElbNetworkLoadBalancer": ("network", "ElbNetworkLoadBalancer"),
+    "Endpoint": ("network", "Endpoint"),
+    "GlobalAccelerator": ("network", "GlobalAccelerator"),
+    "Nacl": ("network", "Nacl"),
+    "NATGateway": ("network", "NATGateway"),
+    "NetworkFirewall": ("network", "NetworkFirewall"),
+    "NetworkingAndContentDelivery": ("network", "NetworkingAndContentDelivery"),
+    "PrivateSubnet": ("network", "PrivateSubnet"),
+    "Privatelink": ("network", "Privatelink"),
+    "PublicSubnet": ("network", "PublicSubnet"),
+    "Route53HostedZone": ("network", "Route53HostedZone"),
+    "Route53": ("network", "Route53"),
+    "RouteTable": ("network", "RouteTable"),
+    "SiteToSiteVpn": ("network", "SiteToSiteVpn"),
+    "TransitGatewayAttachment": ("network", "TransitGatewayAttachment"),
+    "TransitGateway": ("network", "TransitGateway"),
+    "VPCCustomerGateway": ("network", "VPCCustomerGateway"),
+    "VPCElasticNetworkAdapter": ("network", "VPCElasticNetworkAdapter"),
+    "VPCElasticNetworkInterface": ("network", "VPCElasticNetworkInterface"),
+    "VPCFlowLogs": ("network", "VPCFlowLogs"),
+    "VPCPeering": ("network", "VPCPeering"),
+    "VPCRouter": ("network", "VPCRouter"),
+    "VPCTrafficMirroring": ("network", "VPCTrafficMirroring"),
+    "VPC": ("network", "VPC"),
+    "VpnConnection": ("network", "VpnConnection"),
+    "VpnGateway": ("network", "VpnGateway"),
 
     # Quantum
-    "Braket": Braket,
-    "QuantumTechnologies": QuantumTechnologies,
+    "Braket": ("quantum", "Braket"),
+    "QuantumTechnologies": ("quantum", "QuantumTechnologies"),
 
     # Robotics
-    "RobomakerCloudExtensionRos": RobomakerCloudExtensionRos,
-    "RobomakerDevelopmentEnvironment": RobomakerDevelopmentEnvironment,
-    "RobomakerFleetManagement": RobomakerFleetManagement,
-    "RobomakerSimulator": RobomakerSimulator,
-    "Robomaker": Robomaker,
-    "Robotics": Robotics,
+    "RobomakerCloudExtensionRos": ("robotics", "RobomakerCloudExtensionRos"),
+    "RobomakerDevelopmentEnvironment": ("robotics", "RobomakerDevelopmentEnvironment"),
+    "RobomakerFleetManagement": ("robotics", "RobomakerFleetManagement"),
+    "RobomakerSimulator": ("robotics", "RobomakerSimulator"),
+    "Robomaker": ("robotics", "Robomaker"),
+    "Robotics": ("robotics", "Robotics"),
 
     # Satellite
-    "GroundStation": GroundStation,
-    "Satellite": Satellite,
+    "GroundStation": ("satellite", "GroundStation"),
+    "Satellite": ("satellite", "Satellite"),
 
     # Security
-    "AdConnector": AdConnector,
-    "Artifact": Artifact,
-    "CertificateAuthority": CertificateAuthority,
-    "CertificateManager": CertificateManager,  # alias: ACM
-    "CloudDirectory": CloudDirectory,
-    "Cloudhsm": Cloudhsm,  # alias: CloudHSM
-    "Cognito": Cognito,
-    "Detective": Detective,
-    "DirectoryService": DirectoryService,  # alias: DS
-    "FirewallManager": FirewallManager,  # alias: FMS
-    "Guardduty": Guardduty,
-    "IdentityAndAccessManagementIamAccessAnalyzer": IdentityAndAccessManagementIamAccessAnalyzer,  # alias: IAMAccessAnalyzer
-    "IdentityAndAccessManagementIamAddOn": IdentityAndAccessManagementIamAddOn,
-    "IdentityAndAccessManagementIamAWSStsAlternate": IdentityAndAccessManagementIamAWSStsAlternate,
-    "IdentityAndAccessManagementIamAWSSts": IdentityAndAccessManagementIamAWSSts,  # alias: IAMAWSSts
-    "IdentityAndAccessManagementIamDataEncryptionKey": IdentityAndAccessManagementIamDataEncryptionKey,
-    "IdentityAndAccessManagementIamEncryptedData": IdentityAndAccessManagementIamEncryptedData,
-    "IdentityAndAccessManagementIamLongTermSecurityCredential": IdentityAndAccessManagementIamLongTermSecurityCredential,
-    "IdentityAndAccessManagementIamMfaToken": IdentityAndAccessManagementIamMfaToken,
-    "IdentityAndAccessManagementIamPermissions": IdentityAndAccessManagementIamPermissions,  # alias: IAMPermissions
-    "IdentityAndAccessManagementIamRole": IdentityAndAccessManagementIamRole,  # alias: IAMRole
-    "IdentityAndAccessManagementIamTemporarySecurityCredential": IdentityAndAccessManagementIamTemporarySecurityCredential,
-    "IdentityAndAccessManagementIam": IdentityAndAccessManagementIam,  # alias: IAM
-    "InspectorAgent": InspectorAgent,
-    "Inspector": Inspector,
-    "KeyManagementService": KeyManagementService,  # alias: KMS
-    "Macie": Macie,
-    "ManagedMicrosoftAd": ManagedMicrosoftAd,
-    "ResourceAccessManager": ResourceAccessManager,  # alias: RAM
-    "SecretsManager": SecretsManager,
-    "SecurityHubFinding": SecurityHubFinding,
-    "SecurityHub": SecurityHub,
-    "SecurityIdentityAndCompliance": SecurityIdentityAndCompliance,
-    "ShieldAdvanced": ShieldAdvanced,
-    "Shield": Shield,
-    "SimpleAd": SimpleAd,
-    "SingleSignOn": SingleSignOn,
-    "WAFFilteringRule": WAFFilteringRule,
-    "WAF": WAF,
+    "AdConnector": ("security", "AdConnector"),
+    "Artifact": ("security", "Artifact"),
+    "CertificateAuthority": ("security", "CertificateAuthority"),
+    "CertificateManager": ("security", "CertificateManager"),
+    "CloudDirectory": ("security", "CloudDirectory"),
+    "Cloudhsm": ("security", "Cloudhsm"),
+    "Cognito": ("security", "Cognito"),
+    "Detective": ("security", "Detective"),
+    "DirectoryService": ("security", "DirectoryService"),
+    "FirewallManager": ("security", "FirewallManager"),
+    "Guardduty": ("security", "Guardduty"),
+    "IdentityAndAccessManagementIamAccessAnalyzer": ("security", "IdentityAndAccessManagementIamAccessAnalyzer"),
+    "IdentityAndAccessManagementIamAddOn": ("security", "IdentityAndAccessManagementIamAddOn"),
+    "IdentityAndAccessManagementIamAWSStsAlternate": ("security", "IdentityAndAccessManagementIamAWSStsAlternate"),
+    "IdentityAndAccessManagementIamAWSSts": ("security", "IdentityAndAccessManagementIamAWSSts"),
+    "IdentityAndAccessManagementIamDataEncryptionKey": ("security", "IdentityAndAccessManagementIamDataEncryptionKey"),
+    "IdentityAndAccessManagementIamEncryptedData": ("security", "IdentityAndAccessManagementIamEncryptedData"),
+    "IdentityAndAccessManagementIamLongTermSecurityCredential": ("security", "IdentityAndAccessManagementIamLongTermSecurityCredential"),
+    "IdentityAndAccessManagementIamMfaToken": ("security", "IdentityAndAccessManagementIamMfaToken"),
+    "IdentityAndAccessManagementIamPermissions": ("security", "IdentityAndAccessManagementIamPermissions"),
+    "IdentityAndAccessManagementIamRole": ("security", "IdentityAndAccessManagementIamRole"),
+    "IdentityAndAccessManagementIamTemporarySecurityCredential": ("security", "IdentityAndAccessManagementIamTemporarySecurityCredential"),
+    "IdentityAndAccessManagementIam": ("security", "IdentityAndAccessManagementIam"),
+    "InspectorAgent": ("security", "InspectorAgent"),
+    "Inspector": ("security", "Inspector"),
+    "KeyManagementService": ("security", "KeyManagementService"),
+    "Macie": ("security", "Macie"),
+    "ManagedMicrosoftAd": ("security", "ManagedMicrosoftAd"),
+    "ResourceAccessManager": ("security", "ResourceAccessManager"),
+    "SecretsManager": ("security", "SecretsManager"),
+    "SecurityHubFinding": ("security", "SecurityHubFinding"),
+    "SecurityHub": ("security", "SecurityHub"),
+    "SecurityIdentityAndCompliance": ("security", "SecurityIdentityAndCompliance"),
+    "ShieldAdvanced": ("security", "ShieldAdvanced"),
+    "Shield": ("security", "Shield"),
+    "SimpleAd": ("security", "SimpleAd"),
+    "SingleSignOn": ("security", "SingleSignOn"),
+    "WAFFilteringRule": ("security", "WAFFilteringRule"),
+    "WAF": ("security", "WAF"),
 
     # Storage
-    "Backup": Backup,
-    "CloudendureDisasterRecovery": CloudendureDisasterRecovery,  # alias: CDR
-    "EFSInfrequentaccessPrimaryBg": EFSInfrequentaccessPrimaryBg,
-    "EFSStandardPrimaryBg": EFSStandardPrimaryBg,
-    "ElasticBlockStoreEBSSnapshot": ElasticBlockStoreEBSSnapshot,
-    "ElasticBlockStoreEBSVolume": ElasticBlockStoreEBSVolume,
-    "ElasticBlockStoreEBS": ElasticBlockStoreEBS,  # alias: EBS
-    "ElasticFileSystemEFSFileSystem": ElasticFileSystemEFSFileSystem,
-    "ElasticFileSystemEFS": ElasticFileSystemEFS,  # alias: EFS
-    "FsxForLustre": FsxForLustre,
-    "FsxForWindowsFileServer": FsxForWindowsFileServer,
-    "Fsx": Fsx,  # alias: FSx
-    "MultipleVolumesResource": MultipleVolumesResource,
-    "S3AccessPoints": S3AccessPoints,
-    "S3GlacierArchive": S3GlacierArchive,
-    "S3GlacierVault": S3GlacierVault,
-    "S3Glacier": S3Glacier,
-    "S3ObjectLambdaAccessPoints": S3ObjectLambdaAccessPoints,
-    "SimpleStorageServiceS3BucketWithObjects": SimpleStorageServiceS3BucketWithObjects,
-    "SimpleStorageServiceS3Bucket": SimpleStorageServiceS3Bucket,
-    "SimpleStorageServiceS3Object": SimpleStorageServiceS3Object,
-    "SimpleStorageServiceS3": SimpleStorageServiceS3,  # alias: S3
-    "SnowFamilySnowballImportExport": SnowFamilySnowballImportExport,
-    "SnowballEdge": SnowballEdge,
-    "Snowball": Snowball,
-    "Snowmobile": Snowmobile,
-    "StorageGatewayCachedVolume": StorageGatewayCachedVolume,
-    "StorageGatewayNonCachedVolume": StorageGatewayNonCachedVolume,
-    "StorageGatewayVirtualTapeLibrary": StorageGatewayVirtualTapeLibrary,
-    "StorageGateway": StorageGateway,
-    "Storage": Storage,
-}
\ No newline at end of file
+    "SnowballEdge": ("storage", "SnowballEdge"),
+    "Snowball": ("storage", "Snowball"),
+    "Snowmobile": ("storage", "Snowmobile"),
+    "Backup": ("storage", "Backup"),
+    "CloudendureDisasterRecovery": ("storage", "CloudendureDisasterRecovery"),
+    "EFSInfrequentaccessPrimaryBg": ("storage", "EFSInfrequentaccessPrimaryBg"),
+    "EFSStandardPrimaryBg": ("storage", "EFSStandardPrimaryBg"),
+    "ElasticBlockStoreEBSSnapshot": ("storage", "ElasticBlockStoreEBSSnapshot"),
+    "ElasticBlockStoreEBSVolume": ("storage", "ElasticBlockStoreEBSVolume"),
+    "ElasticBlockStoreEBS": ("storage", "ElasticBlockStoreEBS"),
+    "ElasticFileSystemEFSFileSystem": ("storage", "ElasticFileSystemEFSFileSystem"),
+    "ElasticFileSystemEFS": ("storage", "ElasticFileSystemEFS"),
+    "FsxForLustre": ("storage", "FsxForLustre"),
+    "FsxForWindowsFileServer": ("storage", "FsxForWindowsFileServer"),
+    "Fsx": ("storage", "Fsx"),
+    "MultipleVolumesResource": ("storage", "MultipleVolumesResource"),
+    "S3AccessPoints": ("storage", "S3AccessPoints"),
+    "S3GlacierArchive": ("storage", "S3GlacierArchive"),
+    "S3GlacierVault": ("storage", "S3GlacierVault"),
+    "S3Glacier": ("storage", "S3Glacier"),
+    "S3ObjectLambdaAccessPoints": ("storage", "S3ObjectLambdaAccessPoints"),
+    "SimpleStorageServiceS3BucketWithObjects": ("storage", "SimpleStorageServiceS3BucketWithObjects"),
+    "SimpleStorageServiceS3Bucket": ("storage", "SimpleStorageServiceS3Bucket"),
+    "SimpleStorageServiceS3Object": ("storage", "SimpleStorageServiceS3Object"),
+    "SimpleStorageServiceS3": ("storage", "SimpleStorageServiceS3"),
+    "SnowFamilySnowballImportExport": ("storage", "SnowFamilySnowballImportExport"),
+    "StorageGatewayCachedVolume": ("storage", "StorageGatewayCachedVolume"),
+    "StorageGatewayNonCachedVolume": ("storage", "StorageGatewayNonCachedVolume"),
+    "StorageGatewayVirtualTapeLibrary": ("storage", "StorageGatewayVirtualTapeLibrary"),
+    "StorageGateway": ("storage", "StorageGateway"),
+    "Storage": ("storage", "Storage"),
+}
+
+loaded_classes = {}
+
+def get_node_class(node_type):
+    cls = loaded_classes.get(node_type)
+    if cls:
+        return cls
+
+    entry = node_types.get(node_type)
+    if not entry:
+        return None
+
+    module_name, class_name = entry
+    module = importlib.import_module(f"{AWS_PACKAGE}.{module_name}")
+    cls = getattr(module, class_name)
+    loaded_classes[node_type] = cls
+    return cls
+
+def get_icon_path(node_type):
+    # Icons live in the installed diagrams package, so the path is only valid in the process that asks.
+    cls = get_node_class(node_type)
+    if cls is None or not cls._icon:
+        return None
+    package_dir = os.path.dirname(os.path.abspath(importlib.import_module("diagrams").__file__))
+    return os.path.join(os.path.dirname(package_dir), cls._icon_dir, cls._icon)
@@ -1,3 +1,11 @@
+from node_types import node_types
+
+MAX_NODES = 1000
+MAX_EDGES = 3000
+MAX_LABEL_LENGTH = 200
+# Past this many the rest are usually the same mistake repeated.
+MAX_ERRORS = 50
+
 def validate_body(input_format, output_format, input_text, tenant_id):
     if not tenant_id:
         return "Missing tenantId"
@@ -12,3 +20,69 @@ def validate_body(input_format, output_format, input_text, tenant_id):
         return f"inputText is required"
     
     return None
+
+def validate_diagram(input_text):
+    # One pass over nodes and one over edges, before the Diagram context or Graphviz are touched.
+    errors = []
+
+    def add(path, message):
+        if len(errors) < MAX_ERRORS:
+            errors.append({"path": path, "message": message})
+
+    if not isinstance(input_text, dict):
+        add("schemaText", "Must be an object with nodes and edges")
+        return errors
+
+    nodes = input_text.get('nodes')
+    edges = input_text.get('edges')
+    if not isinstance(nodes, list):
+        add("nodes", "Must be a list")
+        nodes = []
+    if not isinstance(edges, list):
+        add("edges", "Must be a list")
+        edges = []
+
+    if len(nodes) > MAX_NODES:
+        add("nodes", f"At most {MAX_NODES} nodes are allowed, got {len(nodes)}")
+        return errors
+    if len(edges) > MAX_EDGES:
+        add("edges", f"At most {MAX_EDGES} edges are allowed, got {len(edges)}")
+        return errors
+
+    node_ids = set()
+    for index, node in enumerate(nodes):
+        path = f"nodes[{index}]"
+        if not isinstance(node, dict):
+            add(path, "Must be an object")
+            continue
+
+        node_id = node.get('id')
+        if not isinstance(node_id, str) or not node_id:
+            add(f"{path}.id", "Must be a non-empty string")
+        elif node_id in node_ids:
+            add(f"{path}.id", f"Duplicate node id: {node_id}")
+        else:
+            node_ids.add(node_id)
+
+        node_type = node.get('type')
+        if not isinstance(node_type, str) or node_type not in node_types:
+            add(f"{path}.type", f"Unknown node type: {node_type}")
+
+        label = node.get('label')
+        if not isinstance(label, str):
+            add(f"{path}.label", "Must be a string")
+        elif len(label) > MAX_LABEL_LENGTH:
+            add(f"{path}.label", f"At most {MAX_LABEL_LENGTH} characters are allowed")
+
+    for index, edge in enumerate(edges):
+        path = f"edges[{index}]"
+        if not isinstance(edge, dict):
+            add(path, "Must be an object")
+            continue
+
+        for end in ('from', 'to'):
+            node_id = edge.get(end)
+            if not isinstance(node_id, str) or node_id not in node_ids:
+                add(f"{path}.{end}", f"Unknown node id: {node_id}")
+
+    return errors
@@ -0,0 +1,119 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+from utils.validation import validate_body
+
+from ...utils.diagram_renderers import load_item_positions, render_item, save_item_positions, validate_item
+from ...utils.file_upload import handle_file_upload
+from ...utils.intermediate import save_intermediate
+from ...utils.lifecycle import on_shutdown
+from ...utils.metrics import instrument_handler
+from ...db.file_counters_queries import release_leased_blocks
+from ...db.files_queries import insert_files_batch
+
+MAX_UPLOAD_WORKERS = 8
+
+# Hand unused file ids back when the container shuts down so other containers can use them.
+on_shutdown(release_leased_blocks)
+
+def create_render_pool(worker_count):
+    try:
+        return ProcessPoolExecutor(max_workers=worker_count)
+    except (OSError, NotImplementedError):
+        # Lambda has no /dev/shm for multiprocessing; Graphviz still renders in its own process per thread.
+        return ThreadPoolExecutor(max_workers=worker_count)
+
+def upload_item(tenant_id, item, rendered):
+    data, intermediate = rendered
+    result = handle_file_upload(BytesIO(data), tenant_id, item.get('fileId'), item.get('metadata', {}), item['outputFormat'])
+    if isinstance(result, dict):
+        raise RuntimeError(json.loads(result['body'])['error'])
+    save_intermediate(tenant_id, result[2], item['diagramType'], intermediate, result[3].get('currentVersionId'))
+    save_item_positions(item, result[2], intermediate)
+    return result
+
+@instrument_handler('batch')
+def lambda_handler(event, context, metrics):
+    try:
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
+
+        tenant_id = body.get('tenantId')
+        items = body.get('items')
+
+        with metrics.stage("validation"):
+            error = validate_body(tenant_id, items)
+        if error:
+            return {"statusCode": 400, "body": error}
+
+        metrics.record("itemCount", len(items))
+        results = [None] * len(items)
+        renderable = []
+        # Two items writing one file would race on its S3 key and make batch_writer reject the whole write.
+        file_indexes = {}
+        with metrics.stage("validation"):
+            for index, item in enumerate(items):
+                item = {**item, 'tenantId': tenant_id, 'inputText': item.get('inputText', item.get('schemaText'))}
+                error = validate_item(item)
+                if not error and item.get('fileId'):
+                    if item['fileId'] in file_indexes:
+                        error = f"Duplicate fileId: {item['fileId']} is also used by item {file_indexes[item['fileId']]}"
+                    else:
+                        file_indexes[item['fileId']] = index
+                if error:
+                    results[index] = {"index": index, "error": error}
+                else:
+                    renderable.append((index, item))
+
+        rendered = []
+        if renderable:
+            with metrics.stage("s3Download"):
+                positions = {index: load_item_positions(item) for index, item in renderable}
+            with metrics.stage("render"), create_render_pool(min(len(renderable), os.cpu_count() or 1)) as pool:
+                futures = [(index, item, pool.submit(render_item, item, None, positions[index])) for index, item in renderable]
+                for index, item, future in futures:
+                    try:
+                        rendered.append((index, item, future.result()))
+                    except Exception as e:
+                        results[index] = {"index": index, "error": f"Render failed: {str(e)}"}
+
+        uploaded = []
+        if rendered:
+            metrics.record("outputBytes", sum(len(data) for _, _, (data, _) in rendered), "Bytes")
+            with metrics.stage("s3Upload"), ThreadPoolExecutor(max_workers=min(len(rendered), MAX_UPLOAD_WORKERS)) as pool:
+                futures = [(index, item, pool.submit(upload_item, tenant_id, item, output)) for index, item, output in rendered]
+                for index, item, future in futures:
+                    try:
+                        uploaded.append((index, item, future.result()))
+                    except Exception as e:
+                        results[index] = {"index": index, "error": f"Upload failed: {str(e)}"}
+
+        if uploaded:
+            try:
+                with metrics.stage("dynamoWrite"):
+                    insert_files_batch([
+                        (tenant_id, file_id, s3_key, item.get('fileName'), item['diagramType'], metadata, not item.get('fileId'))
+                        for _, item, (_, s3_key, file_id, metadata) in uploaded
+                    ])
+                db_error = None
+            except Exception as e:
+                db_error = f"Saving file data failed: {str(e)}"
+
+            for index, item, (bucket_name, s3_key, file_id, _) in uploaded:
+                if db_error:
+                    results[index] = {"index": index, "fileId": file_id, "error": db_error}
+                else:
+                    results[index] = {
+                        "index": index,
+                        "fileId": file_id,
+                        "imageUrl": f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"
+                    }
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({"results": results})
+        }
+    except Exception as e:
+        return {"statusCode": 500, "body": str(e)}
@@ -0,0 +1,13 @@
+MAX_BATCH_ITEMS = 25
+
+def validate_body(tenant_id, items):
+    if not tenant_id:
+        return "Missing tenantId"
+
+    if not items or not isinstance(items, list):
+        return "items must be a non-empty list"
+
+    if len(items) > MAX_BATCH_ITEMS:
+        return f"A batch can contain at most {MAX_BATCH_ITEMS} items"
+
+    return None
@@ -1,37 +1,83 @@
 import json
+from io import BytesIO
 
-from utils.validation import validate_body
-from utils.generate_er import generate_er_file
-from utils.render_image import render_er_to_memory
+from utils.validation import validate_body, validate_reflection_filters
+from utils.generate_er import count_markup_entities, generate_er_file
+from utils.render_image import render_er_formats
 
-from ...utils.file_upload import handle_file_upload
-from ...db.files_queries import insert_file_data
+from ...utils.file_upload import handle_formats_upload
+from ...utils.graph_layout import layout_runner, validate_layout_engine
+from ...utils.intermediate import save_intermediate
+from ...utils.lifecycle import on_shutdown
+from ...utils.metrics import instrument_handler
+from ...utils.output_formats import build_image_urls_body, get_output_formats, validate_output_formats
+from ...utils.render_cache import build_cache_key, cached_render_many
+from ...utils.render_jobs import submit_render_job
+from ...db.file_counters_queries import release_leased_blocks
+from ...db.files_queries import upsert_file_data
 
-def lambda_handler(event, context):
+RENDERER_VERSION = "er-3"
+
+# Hand unused file ids back when the container shuts down so other containers can use them.
+on_shutdown(release_leased_blocks)
+
+@instrument_handler('er')
+def lambda_handler(event, context, metrics):
     try:
-        body = json.loads(event['body'])
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
 
         tenant_id = body.get('tenantId')
         input_format = body.get('inputFormat')
         output_format = body.get('outputFormat')
         input_text = body.get('inputText', '')
         file_name = body.get('fileName')
+        layout_engine = body.get('layoutEngine')
         
-        error = validate_body(input_format, output_format, input_text, tenant_id)
+        with metrics.stage("validation"):
+            error = validate_body(input_format, output_format, input_text, tenant_id) or validate_output_formats(output_format) or validate_layout_engine(layout_engine)
+            error = error or validate_reflection_filters(body.get('schemas'), body.get('tables'))
         if error:
             return {"statusCode": 400, "body": error}
 
-        er_buffer = generate_er_file(input_format, input_text)
-        image_buffer = render_er_to_memory(er_buffer, output_format)
+        output_formats = get_output_formats(output_format)
+        if body.get('async') and len(output_formats) > 1:
+            return {"statusCode": 400, "body": "Asynchronous renders take a single outputFormat"}
+
+        if body.get('async'):
+            job_id = submit_render_job('er', tenant_id, input_text, body)
+            return {"statusCode": 202, "body": json.dumps({"jobId": job_id})}
+
+        def render():
+            with metrics.stage("graphBuild"):
+                er_buffer = generate_er_file(input_format, input_text, body.get('schemas'), body.get('tables'))
+            table_count, relationship_count = count_markup_entities(er_buffer.getvalue().decode())
+            metrics.record("nodeCount", table_count)
+            metrics.record("edgeCount", relationship_count)
+
+            images = render_er_formats(er_buffer, output_formats, layout_runner(layout_engine, metrics), metrics)
+            return {**{name: buffer.getvalue() for name, buffer in images.items()}, 'intermediate': er_buffer.getvalue()}
+
+        if input_format in ['sqlite', 'postgresql']:
+            artifacts = {name: BytesIO(data) for name, data in render().items()}
+        else:
+            cache_keys = {
+                name: build_cache_key('er', input_format, input_text, name, RENDERER_VERSION, layout_engine)
+                for name in [*output_formats, 'intermediate']
+            }
+            artifacts = cached_render_many(cache_keys, render, metrics)
+        markup = artifacts.pop('intermediate').getvalue()
 
-        bucket_name, s3_key, file_id, metadata = handle_file_upload(image_buffer, tenant_id, body.get('fileId'), body.get('metadata', {}), output_format)
-        insert_file_data(tenant_id, file_id, s3_key, file_name, 'er', metadata)
+        bucket_name, s3_keys, file_id, metadata = handle_formats_upload(artifacts, tenant_id, body.get('fileId'), body.get('metadata', {}), metrics)
+        with metrics.stage("s3Upload"):
+            save_intermediate(tenant_id, file_id, 'er', markup, metadata.get('currentVersionId'))
+        with metrics.stage("dynamoWrite"):
+            saved = upsert_file_data(tenant_id, file_id, s3_keys[output_formats[0]], file_name, 'er', metadata)
+        metrics.record("dynamoWriteErrors", 0 if saved else 1)
     
         return {
             "statusCode": 200,
-            "body": json.dumps({
-                "imageUrl": f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"
-            })
+            "body": json.dumps(build_image_urls_body(bucket_name, s3_keys, output_format))
         }
 
     except Exception as e:
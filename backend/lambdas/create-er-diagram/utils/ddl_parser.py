@@ -0,0 +1,254 @@
+import re
+from eralchemy.models import Column, Relation, Table
+
+IDENTIFIER = r'(?:"(?:[^"]|"")+"|`[^`]+`|\[[^\]]+\]|[\w$]+)'
+QUALIFIED_NAME = rf'{IDENTIFIER}(?:\s*\.\s*{IDENTIFIER}){{0,2}}'
+# Unrolled so long data strings are consumed in one step; E'' strings also allow backslash escapes.
+STRING_LITERAL = r"""[eE]'(?:[^'\\]|\\.)*(?:''(?:[^'\\]|\\.)*)*'|'[^']*(?:''[^']*)*'"""
+QUOTED_IDENTIFIER = r'"[^"]*(?:""[^"]*)*"|`[^`]*`'
+
+# Everything that can hide a ";" or a parenthesis: literals, quoted identifiers, comments and dollar-quoted bodies.
+# An unterminated comment or body runs to the end, so no opener is ever rescanned.
+STATEMENT_TOKEN = re.compile(rf"""
+    {STRING_LITERAL}
+  | {QUOTED_IDENTIFIER}
+  | --[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | \$\$.*?(?:\$\$|\Z)
+  | \$(?P<tag>[A-Za-z_]\w*)\$.*?(?:\$(?P=tag)\$|\Z)
+  | ;
+""", re.VERBOSE | re.DOTALL)
+NESTING_TOKEN = re.compile(rf"{STRING_LITERAL}|{QUOTED_IDENTIFIER}|[(),]")
+LITERAL = re.compile(STRING_LITERAL)
+
+CREATE_TABLE = re.compile(
+    rf"\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+"
+    rf"(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>{QUALIFIED_NAME})\s*\(",
+    re.IGNORECASE
+)
+ALTER_TABLE = re.compile(
+    rf"\s*ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?(?P<name>{QUALIFIED_NAME})\s+(?P<actions>.*)",
+    re.IGNORECASE | re.DOTALL
+)
+# The leading comments are matched possessively, so a long run of them is never re-split when no statement follows.
+DDL_HEAD = re.compile(r"(?:\s|--[^\n]*|/\*.*?(?:\*/|\Z))*+(?:CREATE\b[^;(]*?\bTABLE\b|ALTER\s+TABLE\b)", re.IGNORECASE | re.DOTALL)
+# pg_dump writes table data as COPY ... FROM stdin; followed by raw rows up to a "\." line.
+COPY_FROM_STDIN = re.compile(r"(?:\s|--[^\n]*|/\*.*?(?:\*/|\Z))*+COPY\b.*\bFROM\s+stdin\b", re.IGNORECASE | re.DOTALL)
+COPY_DATA_END = re.compile(r"^\\\.[ \t]*$", re.MULTILINE)
+
+TABLE_CONSTRAINT = re.compile(
+    rf"(?:CONSTRAINT\s+{IDENTIFIER}\s+)?(?P<kind>PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK|EXCLUDE)\b",
+    re.IGNORECASE
+)
+COLUMN_LIST = re.compile(r"\s*\((?P<columns>[^)]*)\)")
+REFERENCES = re.compile(rf"\bREFERENCES\s+(?P<table>{QUALIFIED_NAME})(?:\s*\((?P<columns>[^)]*)\))?", re.IGNORECASE)
+# The column type ends where the first column constraint starts.
+COLUMN_CONSTRAINT = re.compile(
+    r"\b(?:CONSTRAINT|PRIMARY|REFERENCES|NOT|NULL|UNIQUE|DEFAULT|CHECK|COLLATE|GENERATED|AUTOINCREMENT|AUTO_INCREMENT|ON)\b",
+    re.IGNORECASE
+)
+# MySQL's inline "KEY name (cols)"; a column named key is followed by its type instead, e.g. "key TEXT" or "key VARCHAR(10)".
+INDEX_CLAUSE = re.compile(rf"\s*(?:KEY|INDEX)\b\s*(?:{IDENTIFIER}\s*)?\(\s*(?!\d)", re.IGNORECASE)
+ADD_COLUMN = re.compile(r"ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?", re.IGNORECASE)
+
+DEFAULT_SCHEMAS = {"postgresql": ("public",), "sqlite": ("main", "temp")}
+
+def iter_statements(sql):
+    # Splits on top-level ";" in one pass; data statements are only scanned for their end, never parsed.
+    start = position = 0
+    while True:
+        match = STATEMENT_TOKEN.search(sql, position)
+        if match is None:
+            break
+        position = match.end()
+        if match.group() != ";":
+            continue
+
+        statement = sql[start:match.start()]
+        start = position
+        yield statement
+
+        if COPY_FROM_STDIN.match(statement):
+            end = COPY_DATA_END.search(sql, position)
+            start = position = end.end() if end else len(sql)
+
+    if sql[start:].strip():
+        yield sql[start:]
+
+def split_top_level(text, start=0):
+    # Returns the comma-separated parts up to the parenthesis closing the one just before start, and where it ended.
+    parts = []
+    depth = 0
+    part_start = start
+    for match in NESTING_TOKEN.finditer(text, start):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            if depth == 0:
+                parts.append(text[part_start:match.start()])
+                return parts, match.end()
+            depth -= 1
+        elif token == "," and depth == 0:
+            parts.append(text[part_start:match.start()])
+            part_start = match.end()
+    parts.append(text[part_start:])
+    return parts, len(text)
+
+def unquote(identifier):
+    if identifier[0] == '"':
+        return identifier[1:-1].replace('""', '"'), True
+    if identifier[0] in "`[":
+        return identifier[1:-1], True
+    return identifier, False
+
+def parse_name(name, dialect):
+    parts = []
+    for part in re.findall(IDENTIFIER, name):
+        value, quoted = unquote(part)
+        # PostgreSQL folds unquoted names to lower case.
+        parts.append(value.lower() if dialect == "postgresql" and not quoted else value)
+    if len(parts) > 1 and parts[-2].lower() in DEFAULT_SCHEMAS.get(dialect, ()):
+        parts = parts[-1:]
+    return ".".join(parts)
+
+def parse_name_list(names, dialect):
+    return [parse_name(name.strip(), dialect) for name in names.split(",") if name.strip()]
+
+def new_table(name):
+    return {"name": name, "columns": {}, "primary_key": [], "unique": set(), "foreign_keys": []}
+
+def add_table_constraint(table, element, dialect):
+    match = TABLE_CONSTRAINT.match(element)
+    if not match:
+        return False
+
+    kind = match.group("kind").upper().split()[0]
+    columns = COLUMN_LIST.match(element, match.end())
+    if kind == "PRIMARY" and columns:
+        table["primary_key"] = parse_name_list(columns.group("columns"), dialect)
+    elif kind == "UNIQUE" and columns:
+        names = parse_name_list(columns.group("columns"), dialect)
+        if len(names) == 1:
+            table["unique"].add(names[0])
+    elif kind == "FOREIGN" and columns:
+        references = REFERENCES.search(element, columns.end())
+        if references:
+            target_columns = parse_name_list(references.group("columns") or "", dialect)
+            table["foreign_keys"].append((
+                parse_name_list(columns.group("columns"), dialect),
+                parse_name(references.group("table"), dialect),
+                target_columns
+            ))
+    return True
+
+def add_column(table, element, dialect):
+    match = re.match(rf"\s*({IDENTIFIER})", element)
+    if not match:
+        return
+
+    name = parse_name(match.group(1), dialect)
+    rest = LITERAL.sub("''", element[match.end():])
+    constraint = COLUMN_CONSTRAINT.search(rest)
+    column_type = " ".join(rest[:constraint.start() if constraint else len(rest)].split()).upper()
+    constraints = rest[constraint.start():] if constraint else ""
+
+    table["columns"][name] = {
+        "type": column_type or "NULL",
+        "nullable": not re.search(r"\bNOT\s+NULL\b", constraints, re.IGNORECASE)
+    }
+    if re.search(r"\bPRIMARY\s+KEY\b", constraints, re.IGNORECASE):
+        table["primary_key"] = [name]
+    if re.search(r"\bUNIQUE\b", constraints, re.IGNORECASE):
+        table["unique"].add(name)
+
+    references = REFERENCES.search(constraints)
+    if references:
+        target_columns = parse_name_list(references.group("columns") or "", dialect)
+        table["foreign_keys"].append(([name], parse_name(references.group("table"), dialect), target_columns))
+
+def parse_create_table(statement, tables, dialect):
+    match = CREATE_TABLE.match(statement)
+    if not match:
+        return
+
+    table = new_table(parse_name(match.group("name"), dialect))
+    elements, _ = split_top_level(statement, match.end())
+    for element in elements:
+        if not element.strip() or re.match(r"\s*LIKE\b", element, re.IGNORECASE) or INDEX_CLAUSE.match(element):
+            continue
+        if not add_table_constraint(table, element.strip(), dialect):
+            add_column(table, element, dialect)
+    tables[table["name"].lower()] = table
+
+def parse_alter_table(statement, tables, dialect):
+    match = ALTER_TABLE.match(statement)
+    if not match:
+        return
+
+    table = tables.get(parse_name(match.group("name"), dialect).lower())
+    if table is None:
+        return
+
+    actions, _ = split_top_level(match.group("actions") + ")")
+    for action in actions:
+        action = action.strip()
+        if not re.match(r"ADD\b", action, re.IGNORECASE):
+            continue
+        definition = ADD_COLUMN.sub("", action, count=1)
+        if not add_table_constraint(table, definition, dialect):
+            add_column(table, definition, dialect)
+
+def build_relationships(tables):
+    relationships = []
+    for table in tables.values():
+        for columns, target_name, target_columns in table["foreign_keys"]:
+            target = tables.get(target_name.lower())
+            if target is None:
+                continue
+            # Without a column list the reference is to the target's primary key.
+            target_columns = target_columns or target["primary_key"]
+            for column, target_column in zip(columns, target_columns):
+                details = table["columns"].get(column)
+                if details is None:
+                    continue
+                unique = table["primary_key"] == [column] or column in table["unique"]
+                # Primary key columns are never null, even without NOT NULL.
+                nullable = details["nullable"] and column not in table["primary_key"]
+                relationships.append(Relation(
+                    right_table=table["name"],
+                    right_column=column,
+                    left_table=target["name"],
+                    left_column=target_column,
+                    right_cardinality="1" if unique else "*",
+                    left_cardinality="?" if nullable else "1"
+                ))
+    return relationships
+
+def parse_ddl(sql, dialect):
+    tables = {}
+    for statement in iter_statements(sql):
+        if not DDL_HEAD.match(statement):
+            continue
+        statement = STATEMENT_TOKEN.sub(lambda match: " " if match.group().startswith(("--", "/*")) else match.group(), statement)
+        if CREATE_TABLE.match(statement):
+            parse_create_table(statement, tables, dialect)
+        else:
+            parse_alter_table(statement, tables, dialect)
+
+    if not tables:
+        raise ValueError("No CREATE TABLE statements found in the SQL input")
+
+    intermediary_tables = [
+        Table(name=table["name"], columns=[
+            Column(
+                name=name,
+                type=details["type"],
+                is_key=name in table["primary_key"],
+                is_null=details["nullable"] and name not in table["primary_key"]
+            )
+            for name, details in table["columns"].items()
+        ])
+        for table in tables.values()
+    ]
+    return intermediary_tables, build_relationships(tables)
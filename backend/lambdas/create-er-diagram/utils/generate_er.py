@@ -1,52 +1,120 @@
-import tempfile
-from eralchemy import ERAlchemy
+import hashlib
+import os
+from collections import OrderedDict
+from eralchemy.sqla import metadata_to_intermediary
 from io import BytesIO
-import sqlite3
+from sqlalchemy import MetaData, create_engine, make_url, text
 
-def generate_er_file(input_format, input_text):
-    er_buffer = BytesIO()
+from ddl_parser import parse_ddl
 
-    if input_format == 'markup':
-        er_buffer.write(input_text.encode())
-        er_buffer.seek(0)
+MAX_ENGINES = int(os.getenv("ER_MAX_ENGINES", "8"))
+MAX_REFLECTIONS = int(os.getenv("ER_REFLECTION_CACHE_ENTRIES", "16"))
+# A Lambda container serves one request at a time, so one pooled connection per database is enough.
+POOL_OPTIONS = {"pool_size": 1, "max_overflow": 2, "pool_pre_ping": True, "pool_recycle": 300}
 
-    elif input_format == 'sqlite-sql':
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite") as db_file:
-            db_filepath = db_file.name
+# Warm containers reuse the engine for a URL and the markup reflected from it, keyed by URL and filters.
+engines = OrderedDict()
+reflections = OrderedDict()
 
-        try:
-            conn = sqlite3.connect(db_filepath)
-            cursor = conn.cursor()
-            cursor.executescript(input_text)
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            raise ValueError(f"SQL execution error: {str(e)}")
+# Every column and constraint of the user schemas in one catalog query, far cheaper than reflecting them.
+POSTGRESQL_FINGERPRINT = text("""
+    SELECT md5(coalesce(string_agg(part, ',' ORDER BY part), ''))
+    FROM (
+        SELECT n.nspname || '.' || c.relname || '.' || a.attname || ':' || format_type(a.atttypid, a.atttypmod) || ':' || a.attnotnull AS part
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('r', 'p', 'v') AND a.attnum > 0 AND NOT a.attisdropped
+          AND n.nspname NOT IN ('pg_catalog', 'information_schema') AND n.nspname NOT LIKE 'pg_toast%'
+        UNION ALL
+        SELECT n.nspname || '.' || con.conrelid::regclass::text || ':' || pg_get_constraintdef(con.oid)
+        FROM pg_constraint con
+        JOIN pg_namespace n ON n.oid = con.connamespace
+        WHERE con.contype IN ('p', 'f', 'u') AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+    ) parts
+""")
+SQLITE_FINGERPRINT = text("SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL ORDER BY type, name")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".er") as er_file:
-            er_filepath = er_file.name
+def intermediary_to_markup(tables, relationships):
+    tables_markup = "\n".join(table.to_markdown() for table in tables)
+    relationships_markup = "\n".join(relationship.to_markdown() for relationship in relationships)
+    return f"{tables_markup}\n{relationships_markup}"
 
-        ERAlchemy().extract_metadata(f"sqlite:///{db_filepath}", er_filepath)
+def metadata_to_markup(metadata):
+    return intermediary_to_markup(*metadata_to_intermediary(metadata))
 
-        with open(er_filepath, "rb") as f:
-            er_buffer.write(f.read())
-            er_buffer.seek(0)
+def count_markup_entities(markup):
+    # Tables are "[name]" headers; relationships are the "a *--1 b" lines.
+    lines = [line.strip() for line in markup.splitlines()]
+    tables = sum(1 for line in lines if line.startswith("["))
+    relationships = sum(1 for line in lines if "--" in line and not line.startswith("#"))
+    return tables, relationships
 
-    elif input_format == "postgresql-sql":
-        raise ValueError(f"PostgreSQL SQL text is not supported yet. Please use SQLite-compatible SQL syntax.")
+def sql_script_to_markup(script, dialect):
+    # Only CREATE TABLE and ALTER TABLE are read; the script is never executed.
+    return intermediary_to_markup(*parse_ddl(script, dialect))
 
-    elif input_format in ['sqlite', 'postgresql']:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".er") as er_file:
-            er_filepath = er_file.name
+def get_engine(url):
+    engine = engines.get(url)
+    if engine is not None:
+        engines.move_to_end(url)
+        return engine
+
+    options = POOL_OPTIONS if make_url(url).get_backend_name() == "postgresql" else {}
+    engine = create_engine(url, **options)
+    engines[url] = engine
+    while len(engines) > MAX_ENGINES:
+        _, evicted = engines.popitem(last=False)
+        evicted.dispose()
+    return engine
+
+def schema_fingerprint(connection):
+    if connection.dialect.name == "postgresql":
+        return connection.execute(POSTGRESQL_FINGERPRINT).scalar()
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(SQLITE_FINGERPRINT).all()
+        return hashlib.sha256(repr(rows).encode()).hexdigest()
+    return None
+
+def reflect_database_markup(url, schemas=None, tables=None):
+    cache_key = (url, tuple(schemas or ()), tuple(tables or ()))
+    table_names = set(tables or ())
+
+    try:
+        with get_engine(url).connect() as connection:
+            fingerprint = schema_fingerprint(connection)
+            cached = reflections.get(cache_key)
+            if fingerprint and cached and cached[0] == fingerprint:
+                reflections.move_to_end(cache_key)
+                return cached[1]
+
+            metadata = MetaData()
+            for schema in schemas or [None]:
+                metadata.reflect(bind=connection, schema=schema, only=(lambda name, _: name in table_names) if table_names else None)
+    except Exception as e:
+        raise ValueError(f"Failed to connect to database: {str(e)}")
 
-        try:
-            ERAlchemy().extract_metadata(input_text, er_filepath)
-        except Exception as e:
-            raise ValueError(f"Failed to connect to database: {str(e)}")
+    markup = metadata_to_markup(metadata)
+    if fingerprint:
+        reflections[cache_key] = (fingerprint, markup)
+        while len(reflections) > MAX_REFLECTIONS:
+            reflections.popitem(last=False)
+    return markup
 
-        with open(er_filepath, "rb") as f:
-            er_buffer.write(f.read())
-            er_buffer.seek(0)
+def generate_er_file(input_format, input_text, schemas=None, tables=None):
+    er_buffer = BytesIO()
+
+    if input_format == 'markup':
+        er_buffer.write(input_text.encode())
+        er_buffer.seek(0)
+
+    elif input_format in ['sqlite-sql', 'postgresql-sql']:
+        er_buffer.write(sql_script_to_markup(input_text, input_format.split('-')[0]).encode())
+        er_buffer.seek(0)
+
+    elif input_format in ['sqlite', 'postgresql']:
+        er_buffer.write(reflect_database_markup(input_text, schemas, tables).encode())
+        er_buffer.seek(0)
 
     else:
         raise ValueError(f"Unsupported schema format: {input_format}")
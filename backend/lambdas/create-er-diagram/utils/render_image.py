@@ -1,24 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from eralchemy.main import intermediary_to_dot, line_iterator_to_intermediary
+from graphviz import Source
 from io import BytesIO
-from eralchemy import render_er
-
-def render_er_to_memory(er_buffer, output_format):
-    if output_format == "png":
-        png_buffer = BytesIO()
-        try:
-            render_er(er_buffer, png_buffer, output_format='png')
-            png_buffer.seek(0)
-            return png_buffer
-        except Exception as e:
-            raise RuntimeError(f"Failed to render PNG: {str(e)}")
-
-    elif output_format == "svg":
-        svg_buffer = BytesIO()
-        try:
-            render_er(er_buffer, svg_buffer, output_format='svg')
-            svg_buffer.seek(0)
-            return svg_buffer
-        except Exception as e:
-            raise RuntimeError(f"Failed to render SVG: {str(e)}")
-
-    else:
-        raise ValueError(f"Unsupported output format: {output_format}")
+
+SUPPORTED_FORMATS = ("png", "svg")
+
+def build_er_dot(er_buffer):
+    tables, relationships = line_iterator_to_intermediary(er_buffer.getvalue().decode().splitlines())
+    return intermediary_to_dot(tables, relationships).decode(), len(tables), len(relationships)
+
+def layout_er(er_buffer, layout=None):
+    dot_source, table_count, relationship_count = build_er_dot(er_buffer)
+    if layout is None:
+        return Source(dot_source).pipe(format="dot").decode()
+    return layout(dot_source, table_count, relationship_count)
+
+def render_laid_out(laid_out, output_format):
+    # -n2 keeps every coordinate from the layout pass and only draws.
+    try:
+        return BytesIO(Source(laid_out, engine="neato").pipe(format=output_format, neato_no_op=2))
+    except Exception as e:
+        raise RuntimeError(f"Failed to render {output_format.upper()}: {str(e)}")
+
+def check_formats(output_formats):
+    for output_format in output_formats:
+        if output_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+def render_formats(laid_out, output_formats):
+    check_formats(output_formats)
+
+    # One Graphviz process per format, all drawing the same layout.
+    with ThreadPoolExecutor(max_workers=len(output_formats)) as pool:
+        buffers = pool.map(lambda output_format: render_laid_out(laid_out, output_format), output_formats)
+        return dict(zip(output_formats, buffers))
+
+def render_single_format(er_buffer, output_format, layout=None):
+    # No separate layout pass: one Graphviz process lays the diagram out and draws it.
+    dot_source, table_count, relationship_count = build_er_dot(er_buffer)
+    try:
+        if layout is None:
+            return BytesIO(Source(dot_source).pipe(format=output_format))
+        return BytesIO(layout(dot_source, table_count, relationship_count, output_format=output_format)[1])
+    except Exception as e:
+        raise RuntimeError(f"Failed to render {output_format.upper()}: {str(e)}")
+
+def render_er_formats(er_buffer, output_formats, layout=None, metrics=None):
+    check_formats(output_formats)
+    if len(output_formats) == 1:
+        with metrics.stage("render") if metrics else nullcontext():
+            return {output_formats[0]: render_single_format(er_buffer, output_formats[0], layout)}
+
+    with metrics.stage("layout") if metrics else nullcontext():
+        laid_out = layout_er(er_buffer, layout)
+    with metrics.stage("render") if metrics else nullcontext():
+        return render_formats(laid_out, output_formats)
+
+def render_er_to_memory(er_buffer, output_format, layout=None):
+    return render_er_formats(er_buffer, [output_format], layout)[output_format]
@@ -18,3 +18,12 @@ def validate_body(input_format, output_format, input_text, tenant_id):
             return "Unsafe database URL: localhost/private IPs are not allowed"
 
     return None
+
+def validate_reflection_filters(schemas, tables):
+    for name, names in (("schemas", schemas), ("tables", tables)):
+        if names is None:
+            continue
+        if not isinstance(names, list) or not names or not all(isinstance(entry, str) and entry for entry in names):
+            return f"{name} must be a non-empty list of names"
+
+    return None
@@ -1,33 +1,70 @@
 import json
 
 from utils.validation import validate_body
-from utils.render_image import render_json_to_buffer
+from utils.render_image import render_json_with_layout
 
-from ...utils.file_upload import handle_file_upload
-from ...db.files_queries import insert_file_data
+from ...utils.file_upload import handle_formats_upload
+from ...utils.intermediate import save_intermediate
+from ...utils.lifecycle import on_shutdown
+from ...utils.metrics import instrument_handler
+from ...utils.output_formats import build_image_urls_body, get_output_formats, validate_output_formats
+from ...utils.render_cache import build_cache_key, cached_render_many
+from ...utils.render_jobs import submit_render_job
+from ...db.file_counters_queries import release_leased_blocks
+from ...db.files_queries import upsert_file_data
 
-def lambda_handler(event, context):
+RENDERER_VERSION = "json-2"
+
+# Hand unused file ids back when the container shuts down so other containers can use them.
+on_shutdown(release_leased_blocks)
+
+@instrument_handler('json')
+def lambda_handler(event, context, metrics):
     try:
-        body = json.loads(event['body'])
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
 
         tenant_id = body.get('tenantId')
         input_format = body.get('inputFormat')
         output_format = body.get('outputFormat')
         input_text = body.get('schemaText', '')
         file_name = body.get('fileName')
+        layout = body.get('layout', 'tree')
 
-        error = validate_body(input_format, output_format, input_text, tenant_id)
+        with metrics.stage("validation"):
+            error = validate_body(input_format, output_format, input_text, tenant_id, layout) or validate_output_formats(output_format)
         if error:
             return {"statusCode": 400, "body": error}
+
+        output_formats = get_output_formats(output_format)
+        if body.get('async') and len(output_formats) > 1:
+            return {"statusCode": 400, "body": "Asynchronous renders take a single outputFormat"}
+
+        if body.get('async'):
+            job_id = submit_render_job('json', tenant_id, input_text, body)
+            return {"statusCode": 202, "body": json.dumps({"jobId": job_id})}
         
-        graph_buffer = render_json_to_buffer(input_text, output_format)
+        def render():
+            images, laid_out = render_json_with_layout(input_text, output_formats, layout, metrics)
+            return {**{name: buffer.getvalue() for name, buffer in images.items()}, 'intermediate': laid_out}
+
+        cache_keys = {
+            name: build_cache_key('json', input_format, input_text, name, RENDERER_VERSION, layout)
+            for name in [*output_formats, 'intermediate']
+        }
+        artifacts = cached_render_many(cache_keys, render, metrics)
+        laid_out = artifacts.pop('intermediate').getvalue()
 
-        bucket_name, s3_key, file_id, metadata = handle_file_upload(graph_buffer, tenant_id, body.get('fileId'), body.get('metadata', {}), output_format)
-        insert_file_data(tenant_id, file_id, s3_key, file_name, 'json', metadata)
+        bucket_name, s3_keys, file_id, metadata = handle_formats_upload(artifacts, tenant_id, body.get('fileId'), body.get('metadata', {}), metrics)
+        with metrics.stage("s3Upload"):
+            save_intermediate(tenant_id, file_id, 'json', laid_out, metadata.get('currentVersionId'))
+        with metrics.stage("dynamoWrite"):
+            saved = upsert_file_data(tenant_id, file_id, s3_keys[output_formats[0]], file_name, 'json', metadata)
+        metrics.record("dynamoWriteErrors", 0 if saved else 1)
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"imageUrl": f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"})
+            "body": json.dumps(build_image_urls_body(bucket_name, s3_keys, output_format))
         }
     except Exception as e:
         return {"statusCode": 500, "body": str(e)}
\ No newline at end of file
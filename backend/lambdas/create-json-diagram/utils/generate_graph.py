@@ -1,27 +1,157 @@
-import networkx as nx
-
-def json_to_graph(data, graph=None, parent=None):
-    if graph is None:
-        graph = nx.DiGraph()
-
-    if isinstance(data, dict):
-        for key, value in data.items():
-            graph.add_node(key)
-            if parent:
-                graph.add_edge(parent, key)
-            json_to_graph(value, graph, parent=key)
-
-    elif isinstance(data, list):
-        for index, item in enumerate(data):
-            list_key = f"{parent}[{index}]"
-            graph.add_node(list_key)
-            if parent:
-                graph.add_edge(parent, list_key)
-            json_to_graph(item, graph, parent=list_key)
-
-    else:
-        graph.add_node(data)
-        if parent:
-            graph.add_edge(parent, data)
+import json
+import re
+from array import array
+from json.decoder import scanstring
+
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+NUMBER_RE = re.compile(r'-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?')
+LITERALS = {"true": True, "false": False, "null": None}
+MAX_LABEL_LENGTH = 32
+
+
+class JsonGraph:
+    # Tree stored as parallel arrays indexed by node id; parents[i] == -1 marks a root.
+    def __init__(self):
+        self.labels = []
+        self.parents = array('l')
+        self.depths = array('l')
+
+    def __len__(self):
+        return len(self.labels)
+
+    def add_node(self, label, parent):
+        if len(label) > MAX_LABEL_LENGTH:
+            label = label[:MAX_LABEL_LENGTH - 1] + "…"
+        self.labels.append(label)
+        self.parents.append(parent)
+        self.depths.append(self.depths[parent] + 1 if parent >= 0 else 0)
+        return len(self.labels) - 1
+
+    def edges(self):
+        for node_id, parent in enumerate(self.parents):
+            if parent >= 0:
+                yield parent, node_id
+
+    def node_path(self, node_id):
+        parts = []
+        while node_id >= 0:
+            parts.append(self.labels[node_id])
+            node_id = self.parents[node_id]
+        return "/".join(reversed(parts))
+
+
+def iter_json_tokens(text):
+    pos = 0
+    end = len(text)
+    while True:
+        pos = WHITESPACE_RE.match(text, pos).end()
+        if pos >= end:
+            return
+
+        char = text[pos]
+        if char in '{}[]:,':
+            yield char, None
+            pos += 1
+        elif char == '"':
+            value, pos = scanstring(text, pos + 1)
+            yield 'string', value
+        else:
+            match = NUMBER_RE.match(text, pos)
+            if match:
+                number = match.group()
+                yield 'scalar', float(number) if match.group(1) or match.group(2) else int(number)
+                pos = match.end()
+                continue
+
+            for literal, value in LITERALS.items():
+                if text.startswith(literal, pos):
+                    yield 'scalar', value
+                    pos += len(literal)
+                    break
+            else:
+                raise ValueError(f"Invalid JSON: unexpected character {char!r} at position {pos}")
+
+
+def iter_json_events(text):
+    containers = []
+    state = 'value'
+
+    for token, value in iter_json_tokens(text):
+        if state == 'colon':
+            if token != ':':
+                raise ValueError("Invalid JSON: expected ':' after object key")
+            state = 'value'
+            continue
+
+        if state == 'key' or (state == 'key_or_end' and token != '}'):
+            if token != 'string':
+                raise ValueError("Invalid JSON: expected object key")
+            yield 'map_key', value
+            state = 'colon'
+            continue
+
+        if state == 'after_value':
+            if not containers:
+                raise ValueError("Invalid JSON: extra data after document")
+            if token == ',':
+                state = 'key' if containers[-1] == '{' else 'value'
+                continue
+            if token not in ('}', ']'):
+                raise ValueError(f"Invalid JSON: unexpected {token!r}")
+
+        if token in ('}', ']') and state in ('after_value', 'key_or_end', 'value_or_end'):
+            # A closer must match the innermost open container: "[}" and {"a": 1] are both rejected.
+            opened = containers.pop()
+            if opened != ('{' if token == '}' else '['):
+                raise ValueError(f"Invalid JSON: {token!r} does not close {opened!r}")
+            yield 'end_map' if token == '}' else 'end_array', None
+            state = 'after_value'
+        elif token == '{':
+            containers.append('{')
+            yield 'start_map', None
+            state = 'key_or_end'
+        elif token == '[':
+            containers.append('[')
+            yield 'start_array', None
+            state = 'value_or_end'
+        elif token in ('string', 'scalar'):
+            yield 'scalar', value
+            state = 'after_value'
+        else:
+            raise ValueError(f"Invalid JSON: unexpected {token!r}")
+
+    if containers or state != 'after_value':
+        raise ValueError("Invalid JSON: unexpected end of document")
+
+
+def scalar_label(value):
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def json_to_graph(input_text):
+    graph = JsonGraph()
+    # Each frame is [owner node id, is_array, next array index].
+    stack = []
+    key_node = -1
+
+    def value_owner():
+        if not stack:
+            return -1
+        frame = stack[-1]
+        if frame[1]:
+            item = graph.add_node(f"[{frame[2]}]", frame[0])
+            frame[2] += 1
+            return item
+        return key_node
+
+    for event, value in iter_json_events(input_text):
+        if event == 'map_key':
+            key_node = graph.add_node(value, stack[-1][0])
+        elif event in ('start_map', 'start_array'):
+            stack.append([value_owner(), event == 'start_array', 0])
+        elif event in ('end_map', 'end_array'):
+            stack.pop()
+        else:
+            graph.add_node(scalar_label(value), value_owner())
 
     return graph
@@ -0,0 +1,52 @@
+import networkx as nx
+import numpy as np
+
+def tree_layout(graph):
+    node_count = len(graph)
+    if not node_count:
+        return np.zeros((0, 2))
+
+    parents = np.frombuffer(graph.parents, dtype=np.dtype(graph.parents.typecode))
+    depths = np.frombuffer(graph.depths, dtype=np.dtype(graph.depths.typecode))
+    has_parent = parents >= 0
+
+    has_children = np.zeros(node_count, dtype=bool)
+    has_children[parents[has_parent]] = True
+
+    # Node ids follow document order, so leaves in id order are already left-to-right.
+    x = np.zeros(node_count)
+    leaves = ~has_children
+    x[leaves] = np.arange(np.count_nonzero(leaves))
+
+    # Center every parent over its children, one depth level at a time from the bottom up.
+    by_depth = np.argsort(depths, kind='stable')
+    level_ends = np.cumsum(np.bincount(depths))
+    child_min = np.full(node_count, np.inf)
+    child_max = np.full(node_count, -np.inf)
+    for depth in range(len(level_ends) - 1, 0, -1):
+        level = by_depth[level_ends[depth - 1]:level_ends[depth]]
+        level_parents = parents[level]
+        np.minimum.at(child_min, level_parents, x[level])
+        np.maximum.at(child_max, level_parents, x[level])
+        centered = np.unique(level_parents)
+        x[centered] = (child_min[centered] + child_max[centered]) / 2
+
+    return np.column_stack((x, -depths.astype(float)))
+
+def spring_layout(graph):
+    nx_graph = nx.DiGraph()
+    nx_graph.add_nodes_from(range(len(graph)))
+    nx_graph.add_edges_from(graph.edges())
+    pos = nx.spring_layout(nx_graph)
+    return np.array([pos[node_id] for node_id in range(len(graph))]).reshape(-1, 2)
+
+LAYOUTS = {
+    "tree": tree_layout,
+    "spring": spring_layout,
+}
+
+def compute_layout(graph, layout):
+    layout_fn = LAYOUTS.get(layout)
+    if not layout_fn:
+        raise ValueError(f"Unsupported layout: {layout}")
+    return layout_fn(graph)
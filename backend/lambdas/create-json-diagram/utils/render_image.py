@@ -1,21 +1,140 @@
 import json
-import networkx as nx
-import matplotlib.pyplot as plt
+import threading
+from contextlib import nullcontext
+import numpy as np
 from io import BytesIO
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 
-from generate_graph import json_to_graph
-
-def render_json_to_buffer(input_text, output_format):
-    json_data = json.loads(input_text)
-    graph = json_to_graph(json_data)
-    pos = nx.spring_layout(graph)
-    
-    plt.figure(figsize=(10, 10))
-    nx.draw(graph, pos, with_labels=True, node_color="lightblue", font_size=8, node_size=500)
-    
-    buffer = BytesIO()
-    plt.savefig(buffer, format=output_format)
-    buffer.seek(0)
-    plt.close()
-    
-    return buffer
+from generate_graph import JsonGraph, json_to_graph
+from layout import compute_layout
+
+NODE_COLOR = "lightblue"
+EDGE_COLOR = "black"
+NODE_SIZE = 500
+FONT_SIZE = 8
+FIGURE_INCHES = 10
+MAX_FIGURE_INCHES = 60
+INCHES_PER_LEAF = 0.6
+INCHES_PER_LEVEL = 1.0
+MAX_CACHED_LABELS = 10000
+
+font = FontProperties(family=["sans-serif"])
+label_paths = {}
+canvases = threading.local()
+
+def get_figure():
+    # One figure per thread, reused across invocations instead of going through pyplot's global state.
+    figure = getattr(canvases, "figure", None)
+    if figure is None:
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        canvases.figure = figure
+    figure.clear()
+    return figure
+
+def get_label_path(label):
+    path = label_paths.get(label)
+    if path is None:
+        if len(label_paths) >= MAX_CACHED_LABELS:
+            label_paths.clear()
+        text_path = TextPath((0, 0), label, size=FONT_SIZE, prop=font)
+        # Centre on the vertex bounds; Path.get_extents solves every bezier segment and dominates large renders.
+        vertices = text_path.vertices
+        offset = -(vertices.min(axis=0) + vertices.max(axis=0)) / 2 if len(vertices) else (0, 0)
+        path = text_path.transformed(Affine2D().translate(*offset))
+        label_paths[label] = path
+    return path
+
+def figure_size(coords, layout):
+    if layout != "tree" or not len(coords):
+        return FIGURE_INCHES, FIGURE_INCHES
+    width, height = np.ptp(coords, axis=0) + 1
+    return (
+        min(max(FIGURE_INCHES, width * INCHES_PER_LEAF), MAX_FIGURE_INCHES),
+        min(max(FIGURE_INCHES, height * INCHES_PER_LEVEL), MAX_FIGURE_INCHES),
+    )
+
+def draw_graph(figure, graph, coords):
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+
+    parents = np.frombuffer(graph.parents, dtype=np.dtype(graph.parents.typecode))
+    children = np.flatnonzero(parents >= 0)
+    segments = np.stack((coords[parents[children]], coords[children]), axis=1)
+    ax.add_collection(LineCollection(segments, colors=EDGE_COLOR, linewidths=1, zorder=1))
+
+    ax.scatter(coords[:, 0], coords[:, 1], s=NODE_SIZE, c=NODE_COLOR, zorder=2)
+
+    # All labels are a single collection: glyph outlines in points, offset to node positions in data space.
+    labels = PathCollection(
+        [get_label_path(label) for label in graph.labels],
+        offsets=coords,
+        offset_transform=ax.transData,
+        facecolors=EDGE_COLOR,
+        edgecolors="none",
+        zorder=3,
+    )
+    labels.set_transform(Affine2D().scale(1 / 72) + figure.dpi_scale_trans)
+    ax.add_collection(labels)
+
+    ax.update_datalim(coords)
+    ax.margins(0.05)
+    ax.autoscale_view()
+
+def layout_json(input_text, layout="tree", metrics=None):
+    with metrics.stage("graphBuild") if metrics else nullcontext():
+        graph = json_to_graph(input_text)
+    if metrics:
+        metrics.record("nodeCount", len(graph))
+        metrics.record("edgeCount", len(graph) - graph.parents.count(-1))
+
+    with metrics.stage("layout") if metrics else nullcontext():
+        coords = compute_layout(graph, layout)
+    return graph, coords
+
+def draw_layout(graph, coords, layout, output_formats, metrics=None):
+    # The figure is drawn once and saved in every requested format.
+    with metrics.stage("render") if metrics else nullcontext():
+        figure = get_figure()
+        figure.set_size_inches(*figure_size(coords, layout))
+        if len(graph):
+            draw_graph(figure, graph, coords)
+
+        buffers = {}
+        for output_format in output_formats:
+            buffers[output_format] = BytesIO()
+            figure.savefig(buffers[output_format], format=output_format)
+            buffers[output_format].seek(0)
+        figure.clear()
+
+    return buffers
+
+def serialize_layout(graph, coords, layout):
+    return json.dumps({
+        "layout": layout,
+        "labels": graph.labels,
+        "parents": graph.parents.tolist(),
+        "coords": np.round(coords, 4).tolist()
+    }, separators=(",", ":")).encode()
+
+def render_layout_to_buffer(data, output_format):
+    # Stored layouts are already positioned: rebuild the tree and draw it, skipping parsing and layout.
+    stored = json.loads(data)
+    graph = JsonGraph()
+    for label, parent in zip(stored["labels"], stored["parents"]):
+        graph.add_node(label, parent)
+    coords = np.array(stored["coords"], dtype=float).reshape(-1, 2)
+    return draw_layout(graph, coords, stored["layout"], [output_format])[output_format]
+
+def render_json_to_buffer(input_text, output_format, layout="tree", metrics=None):
+    graph, coords = layout_json(input_text, layout, metrics)
+    return draw_layout(graph, coords, layout, [output_format], metrics)[output_format]
+
+def render_json_with_layout(input_text, output_formats, layout="tree", metrics=None):
+    graph, coords = layout_json(input_text, layout, metrics)
+    return draw_layout(graph, coords, layout, output_formats, metrics), serialize_layout(graph, coords, layout)
@@ -1,5 +1,6 @@
+from layout import LAYOUTS
 
-def validate_body(input_format, output_format, input_text, tenant_id):
+def validate_body(input_format, output_format, input_text, tenant_id, layout="tree"):
     if not tenant_id:
         return "Missing tenantId"
 
@@ -12,4 +13,7 @@ def validate_body(input_format, output_format, input_text, tenant_id):
     if not input_text:
         return "Missing input text"
 
+    if layout not in LAYOUTS:
+        return f"Unsupported layout: {layout}"
+
     return None
@@ -1,17 +1,46 @@
-import boto3
 import json
 import os
 
-s3 = boto3.client('s3')
+from ...db.file_versions_queries import build_file_key, query_file_versions
+from ...utils.file_upload import build_image_key
+from ...utils.pagination import decode_token, encode_token, parse_page_size
+from ...utils.metrics import instrument_handler
+from ...utils.s3_versions import format_last_modified, list_key_versions
 
-def lambda_handler(event, context):
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+def list_s3_history(tenant_id, file_id, page_size, start_key, metrics):
+    with metrics.stage("s3Download"):
+        s3_versions, markers = list_key_versions(os.getenv("S3-BUCKET-NAME"), build_image_key(tenant_id, file_id), page_size, start_key)
+
+    versions = [
+        {
+            "VersionId": version["VersionId"],
+            "LastModified": format_last_modified(version["LastModified"]),
+            "IsLatest": version["IsLatest"],
+            "Size": version["Size"]
+        }
+        for version in s3_versions
+    ]
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps({
+            "versions": versions,
+            "nextToken": encode_token(markers and {'fileKey': build_file_key(tenant_id, file_id), **markers})
+        })
+    }
+
+@instrument_handler()
+def lambda_handler(event, context, metrics):
     try:
         body = json.loads(event['body'])
 
         tenant_id = body.get('tenantId')
         file_id = event.get('pathParameters', {}).get('fileId')
-        key_marker = body.get('KeyMarker', None)
-        version_id_marker = body.get('VersionIdMarker', None)
+        next_token = body.get('nextToken')
+        page_size = parse_page_size(body.get('pageSize'), DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
 
         if not tenant_id or not file_id:
             return {
@@ -19,35 +48,43 @@ def lambda_handler(event, context):
                 "body": json.dumps({"message": "Both tenantId and fileId are required"})
             }
 
-        bucket_name = os.getenv("S3-BUCKET-NAME")
-        s3_key = f"{tenant_id}/{file_id}"
+        if page_size is None:
+            return {"statusCode": 400, "body": json.dumps({"message": "pageSize must be a positive integer"})}
+
+        try:
+            start_key = decode_token(next_token)
+        except ValueError as e:
+            return {"statusCode": 400, "body": json.dumps({"message": str(e)})}
+
+        if start_key and start_key.get('fileKey') != build_file_key(tenant_id, file_id):
+            return {"statusCode": 400, "body": json.dumps({"message": "Continuation token does not belong to this file"})}
+
+        # Files saved only before the FileVersions index existed have no rows; their history is read from S3.
+        # Older files saved since then are covered once db/backfill_file_versions.py has run, or on their first restore.
+        if start_key and 'versionIdMarker' in start_key:
+            return list_s3_history(tenant_id, file_id, page_size, start_key, metrics)
+
+        with metrics.stage("dynamoRead"):
+            items, last_evaluated_key = query_file_versions(tenant_id, file_id, page_size, start_key)
+        if not items and not start_key:
+            return list_s3_history(tenant_id, file_id, page_size, None, metrics)
 
-        response = s3.list_object_versions(
-            Bucket=bucket_name,
-            Prefix=s3_key,
-            KeyMarker=key_marker,
-            VersionIdMarker=version_id_marker
-        )
-        
         versions = [
             {
-                "VersionId": version["VersionId"],
-                "LastModified": version["LastModified"].isoformat(),
-                "IsLatest": version["IsLatest"],
-                "Size": version["Size"]
+                "VersionId": item["versionId"],
+                "LastModified": item["versionTimestamp"],
+                "IsLatest": not start_key and index == 0,
+                "Size": int(item["sizeBytes"]),
+                **({"Formats": item["formatVersions"]} if item.get("formatVersions") else {})
             }
-            for version in response.get('Versions', [])
+            for index, item in enumerate(items)
         ]
 
-        next_key_marker = response.get('NextKeyMarker')
-        next_version_id_marker = response.get('NextVersionIdMarker')
-
         return {
             "statusCode": 200,
             "body": json.dumps({
                 "versions": versions,
-                "nextKeyMarker": next_key_marker,
-                "nextVersionIdMarker": next_version_id_marker
+                "nextToken": encode_token(last_evaluated_key)
             })
         }
     
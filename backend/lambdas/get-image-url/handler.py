@@ -1,15 +1,50 @@
-import boto3
 import json
 import os
 
-s3 = boto3.client('s3')
+from ...utils.presigned_urls import get_presigned_url
+from ...utils.metrics import instrument_handler
+from ...db.files_queries import get_current_versions
 
-def lambda_handler(event, context):
+MAX_BULK_FILE_IDS = 100
+
+@instrument_handler()
+def lambda_handler(event, context, metrics):
     try:
-        body = json.loads(event['body'])
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
 
         tenant_id = body.get('tenantId')
-        file_id = event.get('pathParameters', {}).get('fileId', None)
+        file_id = (event.get('pathParameters') or {}).get('fileId', None)
+        file_ids = body.get('fileIds')
+
+        bucket_name = os.getenv("S3-BUCKET-NAME")
+
+        if file_ids is not None:
+            if not tenant_id or not isinstance(file_ids, list) or not file_ids:
+                return {
+                    "statusCode": 400,
+                    "body": json.dumps({"message": "tenantId and a non-empty fileIds list are required"})
+                }
+
+            if len(file_ids) > MAX_BULK_FILE_IDS:
+                return {
+                    "statusCode": 400,
+                    "body": json.dumps({"message": f"At most {MAX_BULK_FILE_IDS} fileIds can be requested at once"})
+                }
+
+            metrics.record("urlCount", len(file_ids))
+            with metrics.stage("dynamoRead"):
+                current_versions = get_current_versions(tenant_id, file_ids)
+            with metrics.stage("presign"):
+                image_urls = {
+                    requested_id: get_presigned_url(bucket_name, f"{tenant_id}/{requested_id}", current_versions.get(requested_id))
+                    for requested_id in file_ids
+                }
+
+            return {
+                "statusCode": 200,
+                "body": json.dumps({"imageUrls": image_urls})
+            }
 
         if not tenant_id or not file_id:
             return {
@@ -17,17 +52,10 @@ def lambda_handler(event, context):
                 "body": json.dumps({"message": "Both tenantId and fileId are required"})
             }
 
-        bucket_name = os.getenv("S3-BUCKET-NAME")
-        s3_key = f"{tenant_id}/{file_id}"
-
-        url = s3.generate_presigned_url(
-            ClientMethod="get_object",
-            Params={
-                "Bucket": bucket_name,
-                "Key": s3_key
-            },
-            ExpiresIn=3600
-        )
+        with metrics.stage("dynamoRead"):
+            current_version_id = get_current_versions(tenant_id, [file_id]).get(file_id)
+        with metrics.stage("presign"):
+            url = get_presigned_url(bucket_name, f"{tenant_id}/{file_id}", current_version_id)
 
         return {
             "statusCode": 200,
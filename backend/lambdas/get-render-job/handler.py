@@ -0,0 +1,46 @@
+import json
+
+from ...db.render_jobs_queries import get_render_job
+from ...utils.metrics import instrument_handler
+
+@instrument_handler()
+def lambda_handler(event, context, metrics):
+    try:
+        body = json.loads(event['body'])
+
+        tenant_id = body.get('tenantId')
+        job_id = (event.get('pathParameters') or {}).get('jobId')
+
+        if not tenant_id or not job_id:
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"message": "Both tenantId and jobId are required"})
+            }
+
+        with metrics.stage("dynamoRead"):
+            job = get_render_job(job_id)
+        if not job or job['tenantId'] != tenant_id:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"message": "Job not found"})
+            }
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "jobId": job['jobId'],
+                "diagramType": job['diagramType'],
+                "status": job['status'],
+                "progress": float(job['progress']),
+                "fileId": job.get('fileId'),
+                "imageUrl": job.get('imageUrl'),
+                "error": job.get('error'),
+                "createdAt": job['createdAt'],
+                "updatedAt": job['updatedAt']
+            })
+        }
+    except Exception as e:
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": str(e)})
+        }
@@ -0,0 +1,73 @@
+import json
+import os
+
+from ...db.files_queries import query_tenant_files
+from ...utils.pagination import decode_token, encode_token, parse_page_size
+from ...utils.presigned_urls import get_presigned_url
+from ...utils.metrics import instrument_handler
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+DIAGRAM_TYPES = ('er', 'json', 'aws')
+
+@instrument_handler()
+def lambda_handler(event, context, metrics):
+    try:
+        with metrics.stage("bodyParse"):
+            body = json.loads(event['body'])
+
+        tenant_id = body.get('tenantId')
+        diagram_type = body.get('diagramType')
+        next_token = body.get('nextToken')
+        page_size = parse_page_size(body.get('pageSize'), DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+        if not tenant_id:
+            return {"statusCode": 400, "body": json.dumps({"message": "tenantId is required"})}
+
+        if page_size is None:
+            return {"statusCode": 400, "body": json.dumps({"message": "pageSize must be a positive integer"})}
+
+        if diagram_type is not None and diagram_type not in DIAGRAM_TYPES:
+            return {"statusCode": 400, "body": json.dumps({"message": f"Unsupported diagramType: {diagram_type}"})}
+
+        try:
+            start_key = decode_token(next_token)
+        except ValueError as e:
+            return {"statusCode": 400, "body": json.dumps({"message": str(e)})}
+
+        # Per-type tokens carry diagramType, full-listing tokens do not, so a token only continues the listing it came from.
+        if start_key and (start_key.get('tenantId') != tenant_id or start_key.get('diagramType') != diagram_type):
+            return {"statusCode": 400, "body": json.dumps({"message": "Continuation token does not belong to this listing"})}
+
+        with metrics.stage("dynamoRead"):
+            items, last_evaluated_key = query_tenant_files(tenant_id, page_size, start_key, diagram_type)
+        metrics.record("itemCount", len(items))
+
+        files = [
+            {
+                "fileId": item["fileId"],
+                "fileName": item.get("fileName"),
+                "diagramType": item.get("diagramType"),
+                "createdAt": item.get("createdAt"),
+                "updatedAt": item.get("updatedAt")
+            }
+            for item in items
+        ]
+
+        if body.get('includeThumbnails'):
+            bucket_name = os.getenv("S3-BUCKET-NAME")
+            metrics.record("urlCount", len(items))
+            with metrics.stage("presign"):
+                for file, item in zip(files, items):
+                    file["thumbnailUrl"] = get_presigned_url(bucket_name, item.get("s3Key", f"{tenant_id}/{item['fileId']}"), item.get("currentVersionId"))
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "files": files,
+                "nextToken": encode_token(last_evaluated_key)
+            })
+        }
+
+    except Exception as e:
+        return {"statusCode": 500, "body": str(e)}
@@ -0,0 +1,80 @@
+import json
+from io import BytesIO
+
+from ...utils.diagram_renderers import load_item_positions, render_item, save_item_positions
+from ...utils.file_upload import handle_file_upload
+from ...utils.intermediate import save_intermediate
+from ...utils.job_queue import get_job_queue
+from ...utils.lifecycle import on_shutdown
+from ...utils.metrics import RequestMetrics
+from ...utils.render_jobs import delete_render_payload, load_render_job
+from ...db.file_counters_queries import release_leased_blocks
+from ...db.files_queries import upsert_file_data
+from ...db.render_jobs_queries import update_render_job
+
+# Hand unused file ids back when the container shuts down so other containers can use them.
+on_shutdown(release_leased_blocks)
+
+def process_render_job(message, request_id=None):
+    # Raises only when the job cannot be read; the message is then retried instead of marking the job failed.
+    job = load_render_job(message)
+    job_id = job['jobId']
+    metrics = RequestMetrics(job.get('diagramType'), request_id)
+
+    try:
+        update_render_job(job_id, 'rendering', 0.1)
+        with metrics.stage("s3Download"):
+            previous_positions = load_item_positions(job)
+        image_bytes, intermediate = render_item(job, metrics, previous_positions)
+
+        update_render_job(job_id, 'uploading', 0.7)
+        result = handle_file_upload(BytesIO(image_bytes), job['tenantId'], job.get('fileId'), job.get('metadata', {}), job['outputFormat'], metrics)
+        if isinstance(result, dict):
+            raise RuntimeError(json.loads(result['body'])['error'])
+
+        bucket_name, s3_key, file_id, metadata = result
+        with metrics.stage("s3Upload"):
+            save_intermediate(job['tenantId'], file_id, job['diagramType'], intermediate, metadata.get('currentVersionId'))
+            save_item_positions(job, file_id, intermediate)
+        with metrics.stage("dynamoWrite"):
+            upsert_file_data(job['tenantId'], file_id, s3_key, job.get('fileName'), job['diagramType'], metadata)
+
+        update_render_job(job_id, 'done', 1, fileId=file_id, imageUrl=f"https://{bucket_name}.s3.amazonaws.com/{s3_key}")
+        metrics.emit(jobStatus='done')
+    except Exception as e:
+        update_render_job(job_id, 'failed', 1, error=str(e))
+        metrics.emit(jobStatus='failed')
+
+    delete_render_payload(message)
+
+def lambda_handler(event, context):
+    # SQS trigger: the records are the jobs. Render failures are recorded on the job and not retried;
+    # a record that cannot be read is reported back so SQS retries just that one.
+    if 'Records' in event:
+        failures = []
+        for record in event['Records']:
+            try:
+                process_render_job(json.loads(record['body']), getattr(context, "aws_request_id", None))
+            except Exception as e:
+                print(f"Render job message {record.get('messageId')} failed: {e}")
+                failures.append({"itemIdentifier": record['messageId']})
+        return {"batchItemFailures": failures}
+
+    # Manual or local invocation: drain whatever the configured queue holds.
+    queue = get_job_queue()
+    processed = 0
+    failed = 0
+    messages = queue.receive()
+    while messages:
+        for receipt, message in messages:
+            try:
+                process_render_job(message)
+            except Exception as e:
+                # Left on the queue; it becomes visible again after the visibility timeout.
+                print(f"Render job message failed: {e}")
+                failed += 1
+                continue
+            queue.delete(receipt)
+            processed += 1
+        messages = queue.receive()
+    return {"processed": processed, "failed": failed}
@@ -1,10 +1,14 @@
-import boto3
 import json
 import os
 
-s3 = boto3.client('s3')
+from ...db.backfill_file_versions import backfill_file
+from ...db.file_versions_queries import find_file_version
+from ...db.files_queries import get_file, restore_file_version
+from ...utils.file_upload import build_image_key
+from ...utils.metrics import instrument_handler
 
-def lambda_handler(event, context):
+@instrument_handler()
+def lambda_handler(event, context, metrics):
     try:
         body = json.loads(event['body'])
 
@@ -18,14 +22,26 @@ def lambda_handler(event, context):
                 "body": json.dumps({"message": "tenantId, fileId, and versionId are required"})
             }
 
-        bucket_name = os.getenv("S3-BUCKET-NAME")
-        s3_key = f"{tenant_id}/{file_id}"
+        with metrics.stage("dynamoRead"):
+            version = find_file_version(tenant_id, file_id, version_id)
+        if not version:
+            with metrics.stage("dynamoRead"):
+                file = get_file(tenant_id, file_id)
+            if file:
+                # The version may predate the FileVersions index. Index the file's S3 history first, so the
+                # restore row written below does not become the only row and hide that history.
+                with metrics.stage("s3Download"):
+                    backfill_file(os.getenv("S3-BUCKET-NAME"), tenant_id, file_id, file.get('s3Key', build_image_key(tenant_id, file_id)))
+                with metrics.stage("dynamoRead"):
+                    version = find_file_version(tenant_id, file_id, version_id)
+        if not version:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"message": "Version not found for this file"})
+            }
 
-        s3.copy_object(
-            Bucket=bucket_name,
-            CopySource={"Bucket": bucket_name, "Key": s3_key, "VersionId": version_id},
-            Key=s3_key
-        )
+        with metrics.stage("dynamoWrite"):
+            restore_file_version(tenant_id, file_id, version)
 
         return {
             "statusCode": 200,
@@ -0,0 +1,89 @@
+import importlib
+import os
+import sys
+
+import boto3
+import pytest
+from moto import mock_aws
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(BACKEND_DIR)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ["S3-BUCKET-NAME"] = "test-bucket"
+
+def create_resources():
+    dynamodb = boto3.resource("dynamodb")
+    dynamodb.create_table(
+        TableName="Files",
+        KeySchema=[{"AttributeName": "tenantId", "KeyType": "HASH"}, {"AttributeName": "fileId", "KeyType": "RANGE"}],
+        AttributeDefinitions=[
+            {"AttributeName": "tenantId", "AttributeType": "S"},
+            {"AttributeName": "fileId", "AttributeType": "S"},
+            {"AttributeName": "diagramType", "AttributeType": "S"},
+            {"AttributeName": "createdAt", "AttributeType": "S"}
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "TenantCreatedAtIndex",
+                "KeySchema": [{"AttributeName": "tenantId", "KeyType": "HASH"}, {"AttributeName": "createdAt", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"}
+            },
+            {
+                "IndexName": "DiagramTypeIndex",
+                "KeySchema": [{"AttributeName": "diagramType", "KeyType": "HASH"}, {"AttributeName": "tenantId", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"}
+            }
+        ],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    dynamodb.create_table(
+        TableName="FileCounters",
+        KeySchema=[{"AttributeName": "tenantId", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "tenantId", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    dynamodb.create_table(
+        TableName="FileVersions",
+        KeySchema=[{"AttributeName": "fileKey", "KeyType": "HASH"}, {"AttributeName": "versionTimestamp", "KeyType": "RANGE"}],
+        AttributeDefinitions=[
+            {"AttributeName": "fileKey", "AttributeType": "S"},
+            {"AttributeName": "versionTimestamp", "AttributeType": "S"}
+        ],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    dynamodb.create_table(
+        TableName="RenderJobs",
+        KeySchema=[{"AttributeName": "jobId", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "jobId", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST"
+    )
+
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket="test-bucket")
+    s3.put_bucket_versioning(Bucket="test-bucket", VersioningConfiguration={"Status": "Enabled"})
+
+@pytest.fixture
+def aws():
+    with mock_aws():
+        create_resources()
+        yield
+        from backend.db import file_counters_queries
+        file_counters_queries.leased_blocks.clear()
+
+def load_handler(lambda_name):
+    # Handlers import their own helpers as "utils.*", so each lambda's directory must come first on sys.path.
+    for name in [name for name in sys.modules if name == "utils" or name.startswith("utils.")]:
+        del sys.modules[name]
+    lambda_dir = os.path.join(BACKEND_DIR, "lambdas", lambda_name)
+    import_paths = [lambda_dir, os.path.join(lambda_dir, "utils")]
+    sys.path[:0] = import_paths
+    try:
+        return importlib.import_module(f"backend.lambdas.{lambda_name}.handler")
+    finally:
+        for path in import_paths:
+            sys.path.remove(path)
@@ -0,0 +1,53 @@
+import subprocess
+
+from backend.utils import graph_layout
+from backend.utils.diagram_renderers import load_module
+
+build_diagram = load_module("aws", "build_diagram")
+
+NODES = [
+    {"id": "web", "type": "EC2", "label": "Web"},
+    {"id": "db \"main\"", "type": "RDS", "label": "Database"}
+]
+
+def test_nodes_carry_their_diagram_id():
+    graph, _ = build_diagram.build_graph(NODES, [])
+
+    assert "[label=Web diagramid=web " in graph.source
+    assert 'diagramid="db \\"main\\""' in graph.source
+
+def test_positions_are_read_back_from_the_stored_layout():
+    ec2 = build_diagram.get_icon_path("EC2")
+    rds = build_diagram.get_icon_path("RDS")
+    # Node statements as Graphviz -Tdot writes them, one quoted value wrapped with a backslash-newline.
+    laid_out = (
+        'digraph "AWS Architecture" {\n'
+        f'\t"{"a" * 32}"\t[diagramid=web,\n\t\timage="{ec2}",\n\t\tlabel=Web,\n\t\tpos="10.5,20!"];\n'
+        f'\t"{"b" * 32}"\t[diagramid="db \\\n\\"main\\"",\n\t\timage="{rds}",\n\t\tlabel=Database,\n\t\tpos="-3,4.25"];\n'
+        '}\n'
+    )
+
+    stored = build_diagram.to_stored_layout(laid_out, NODES)
+
+    assert "image=" not in stored
+    assert build_diagram.parse_positions(stored) == {"web": [10.5, 20.0], 'db "main"': [-3.0, 4.25]}
+    assert build_diagram.parse_positions(stored) == build_diagram.parse_positions(laid_out)
+
+def test_forced_engine_never_falls_back(monkeypatch):
+    calls = []
+
+    def pipe_layout(dot_source, engine, timeout=None, output_format=None):
+        calls.append((engine, timeout))
+        if timeout is not None:
+            raise subprocess.TimeoutExpired("dot", timeout)
+        return "laid out"
+
+    monkeypatch.setattr(graph_layout, "pipe_layout", pipe_layout)
+    layout = graph_layout.layout_runner("neato", time_budget=1)
+
+    assert layout("digraph {}", 10, 10, "neato") == "laid out"
+    assert calls == [("neato", None)]
+
+    calls.clear()
+    assert layout("digraph {}", 10, 10) == "laid out"
+    assert calls == [("neato", 1), ("sfdp", None)]
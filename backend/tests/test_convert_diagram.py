@@ -0,0 +1,46 @@
+import json
+
+import boto3
+import pytest
+
+from backend.utils.diagram_renderers import load_module
+from backend.utils.intermediate import save_intermediate
+from conftest import load_handler
+
+@pytest.fixture
+def handler(aws):
+    return load_handler("convert-diagram")
+
+def store_json_file(tenant_id, file_id, version_id):
+    boto3.resource("dynamodb").Table("Files").put_item(Item={
+        "tenantId": tenant_id,
+        "fileId": file_id,
+        "diagramType": "json",
+        "currentVersionId": version_id
+    })
+
+def convert(handler, file_id, output_format):
+    event = {"body": json.dumps({"tenantId": "tenant-a", "outputFormat": output_format}), "pathParameters": {"fileId": file_id}}
+    return handler.lambda_handler(event, None)
+
+def test_convert_writes_beside_the_file(handler):
+    _, intermediate = load_module("json", "render_image").render_json_with_layout(json.dumps({"root": {"child": 1}}), ["png"])
+    save_intermediate("tenant-a", "file_001", "json", intermediate, "v1")
+    store_json_file("tenant-a", "file_001", "v1")
+
+    response = convert(handler, "file_001", "svg")
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["imageUrl"].endswith("/tenant-a/file_001.svg")
+    s3 = boto3.client("s3")
+    keys = [item["Key"] for item in s3.list_objects_v2(Bucket="test-bucket")["Contents"]]
+    assert "tenant-a/file_001.svg" in keys
+    assert "tenant-a/file_001" not in keys
+
+def test_convert_follows_the_current_version(handler):
+    _, intermediate = load_module("json", "render_image").render_json_with_layout(json.dumps({"root": {"child": 1}}), ["png"])
+    save_intermediate("tenant-a", "file_001", "json", intermediate, "v1")
+    # Restoring a version without a stored intermediate must not convert the newest diagram instead.
+    store_json_file("tenant-a", "file_001", "v0")
+
+    assert convert(handler, "file_001", "svg")["statusCode"] == 409
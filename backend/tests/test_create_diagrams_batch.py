@@ -0,0 +1,61 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+
+from backend.utils.node_layouts import load_node_positions, save_node_positions
+from conftest import load_handler
+
+@pytest.fixture
+def handler(aws):
+    return load_handler("create-diagrams-batch")
+
+def json_item(file_id):
+    return {
+        "diagramType": "json",
+        "inputFormat": "json",
+        "outputFormat": "png",
+        "inputText": json.dumps({"root": {"child": 1}}),
+        "fileId": file_id
+    }
+
+def test_duplicate_file_id_is_rejected_per_item(handler):
+    items = [json_item("file_001"), json_item("file_001"), json_item("file_002")]
+    event = {"body": json.dumps({"tenantId": "tenant-a", "items": items})}
+
+    response = handler.lambda_handler(event, None)
+
+    assert response["statusCode"] == 200
+    results = json.loads(response["body"])["results"]
+    assert results[1] == {"index": 1, "error": "Duplicate fileId: file_001 is also used by item 0"}
+    assert [results[0]["fileId"], results[2]["fileId"]] == ["file_001", "file_002"]
+    assert "error" not in results[0] and "error" not in results[2]
+
+    items = boto3.resource("dynamodb").Table("Files").scan()["Items"]
+    assert sorted(item["fileId"] for item in items) == ["file_001", "file_002"]
+
+def test_aws_items_keep_stored_positions(handler, monkeypatch):
+    save_node_positions("tenant-a", "file_001", {"web": [1.0, 2.0]})
+    nodes = [{"id": "web", "type": "EC2", "label": "Web"}, {"id": "db", "type": "RDS", "label": "Database"}]
+    item = {"diagramType": "aws", "inputFormat": "json", "outputFormat": "png", "inputText": {"nodes": nodes, "edges": []}, "fileId": "file_001"}
+    pinned = []
+
+    def render_item(item, metrics, previous_positions):
+        # Stands in for Graphviz, which is not installed here: the web node stays put and db is placed beside it.
+        pinned.append(previous_positions)
+        laid_out = (
+            'digraph {\n'
+            f'\t"{"a" * 32}"\t[diagramid=web, pos="1,2!"];\n'
+            f'\t"{"b" * 32}"\t[diagramid=db, pos="5,2"];\n'
+            '}\n'
+        )
+        return b"image", laid_out.encode()
+
+    monkeypatch.setattr(handler, "render_item", render_item)
+    monkeypatch.setattr(handler, "create_render_pool", ThreadPoolExecutor)
+    response = handler.lambda_handler({"body": json.dumps({"tenantId": "tenant-a", "items": [item]})}, None)
+
+    assert "error" not in json.loads(response["body"])["results"][0]
+    assert pinned == [{"web": [1.0, 2.0]}]
+    assert load_node_positions("tenant-a", "file_001") == {"web": [1.0, 2.0], "db": [5.0, 2.0]}
@@ -0,0 +1,117 @@
+import textwrap
+import time
+
+import pytest
+
+from backend.utils.diagram_renderers import load_module
+
+ddl_parser = load_module("er", "ddl_parser")
+
+def parse(sql, dialect="postgresql"):
+    tables, relationships = ddl_parser.parse_ddl(sql, dialect)
+    return {table.name: table for table in tables}, relationships
+
+def columns(table):
+    return {column.name: (column.type, column.is_key, column.is_null) for column in table.columns}
+
+def test_create_table_columns_and_keys():
+    tables, _ = parse("""
+        CREATE TABLE public.users (
+            id SERIAL PRIMARY KEY,
+            email VARCHAR(255) NOT NULL UNIQUE,
+            price NUMERIC(10, 2) DEFAULT 0,
+            CHECK (price >= 0)
+        );
+    """)
+
+    assert list(tables) == ["users"]
+    assert columns(tables["users"]) == {
+        "id": ("SERIAL", True, False),
+        "email": ("VARCHAR(255)", False, False),
+        "price": ("NUMERIC(10, 2)", False, True)
+    }
+
+def test_quoted_names_keep_their_case():
+    tables, _ = parse('CREATE TABLE "Order Items" ("ItemId" int, Quantity int, PRIMARY KEY ("ItemId"));')
+
+    assert list(tables) == ["Order Items"]
+    assert columns(tables["Order Items"]) == {"ItemId": ("INT", True, False), "quantity": ("INT", False, True)}
+
+def test_column_named_key_is_kept():
+    tables, _ = parse("CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT, Index VARCHAR(10))")
+
+    assert columns(tables["settings"]) == {
+        "key": ("TEXT", True, False),
+        "value": ("TEXT", False, True),
+        "index": ("VARCHAR(10)", False, True)
+    }
+
+def test_mysql_index_clauses_are_skipped():
+    tables, _ = parse("CREATE TABLE `users` (`id` int, `email` text, KEY `users_email` (`email`), INDEX (`id`));", "mysql")
+
+    assert list(columns(tables["users"])) == ["id", "email"]
+
+def test_alter_table_adds_columns_and_foreign_keys():
+    tables, relationships = parse("""
+        CREATE TABLE users (id int PRIMARY KEY);
+        CREATE TABLE orders (id int PRIMARY KEY);
+        ALTER TABLE ONLY orders ADD COLUMN user_id int NOT NULL;
+        ALTER TABLE orders ADD CONSTRAINT orders_user_fk FOREIGN KEY (user_id) REFERENCES users (id);
+    """)
+
+    assert columns(tables["orders"])["user_id"] == ("INT", False, False)
+    [relation] = relationships
+    assert (relation.right_table, relation.right_column, relation.left_table, relation.left_column) == ("orders", "user_id", "users", "id")
+
+@pytest.mark.parametrize("column, cardinality", [
+    ("user_id int REFERENCES users", ("*", "?")),
+    ("user_id int NOT NULL REFERENCES users", ("*", "1")),
+    ("user_id int UNIQUE REFERENCES users(id)", ("1", "?")),
+    ("user_id int PRIMARY KEY REFERENCES users", ("1", "1")),
+])
+def test_foreign_key_cardinality(column, cardinality):
+    _, relationships = parse(f"CREATE TABLE users (id int PRIMARY KEY); CREATE TABLE profiles ({column});")
+
+    [relation] = relationships
+    assert (relation.right_cardinality, relation.left_cardinality) == cardinality
+
+def test_references_to_unknown_tables_are_skipped():
+    _, relationships = parse("CREATE TABLE orders (user_id int REFERENCES users (id));")
+
+    assert relationships == []
+
+def test_copy_data_and_literals_do_not_split_statements():
+    # pg_dump writes the rows and the closing \. at the start of their lines.
+    tables, _ = parse(textwrap.dedent("""
+        CREATE TABLE notes (id int, body text DEFAULT 'a;b', CONSTRAINT "odd;name" CHECK (body <> ')'));
+        COPY notes (id, body) FROM stdin;
+        1\tCREATE TABLE fake (x int);
+        2\t);(
+        \\.
+        CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql;
+        -- CREATE TABLE commented (x int);
+        CREATE TABLE tags (id int);
+    """))
+
+    assert sorted(tables) == ["notes", "tags"]
+    assert list(columns(tables["notes"])) == ["id", "body"]
+
+def test_default_schema_is_dropped_per_dialect():
+    tables, _ = parse("CREATE TABLE main.items (id integer); CREATE TABLE other.items (id integer);", "sqlite")
+
+    assert sorted(tables) == ["items", "other.items"]
+
+def test_input_without_tables_is_rejected():
+    with pytest.raises(ValueError, match="No CREATE TABLE"):
+        parse("SELECT 1; INSERT INTO t VALUES (1);")
+
+@pytest.mark.parametrize("filler", ["/* ", "-- \n", "$a$ ", "' "])
+def test_unterminated_openers_parse_in_linear_time(filler):
+    sql = "CREATE TABLE t (id int);" + filler * 20000
+
+    start = time.perf_counter()
+    tables, _ = parse(sql)
+
+    assert list(tables) == ["t"]
+    # Quadratic scanning took seconds at this size; the linear scan takes a few milliseconds.
+    assert time.perf_counter() - start < 1
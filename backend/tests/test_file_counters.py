@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+from moto.moto_server.werkzeug_app import DomainDispatcherApplication, create_backend_app
+from werkzeug.serving import make_server
+
+from backend.db import file_counters_queries
+from conftest import create_resources
+
+@pytest.fixture
+def counters(monkeypatch):
+    # moto's in-process backend does not apply concurrent updates to one item atomically; a single-threaded
+    # server handles one request at a time, which is the guarantee DynamoDB gives per item.
+    server = make_server("127.0.0.1", 0, DomainDispatcherApplication(create_backend_app), threaded=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    endpoint_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        monkeypatch.setenv("AWS_ENDPOINT_URL", endpoint_url)
+        create_resources()
+        monkeypatch.setattr(file_counters_queries, "table", boto3.resource("dynamodb").Table("FileCounters"))
+        monkeypatch.setattr(file_counters_queries, "leased_blocks", {})
+        yield endpoint_url
+    finally:
+        # Backend state is process-wide, so clear it for the next test.
+        urllib.request.urlopen(urllib.request.Request(f"{endpoint_url}/moto-api/reset", method="POST"))
+        server.shutdown()
+        thread.join()
+
+def take_ids(tenant_id, count):
+    return [file_counters_queries.get_next_file_id(tenant_id) for _ in range(count)]
+
+def test_threads_get_unique_ids(counters):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        batches = list(pool.map(lambda _: take_ids("tenant-a", 25), range(8)))
+
+    ids = [file_id for batch in batches for file_id in batch]
+    assert len(set(ids)) == len(ids) == 200
+
+def test_released_ids_are_not_reused(counters):
+    issued = take_ids("tenant-a", 5)
+    file_counters_queries.release_leased_blocks()
+    assert file_counters_queries.leased_blocks == {}
+
+    # The rest of the released block is handed out again, but never the ids already used.
+    issued += take_ids("tenant-a", file_counters_queries.BLOCK_SIZE * 2)
+    assert len(set(issued)) == len(issued)
+
+def take_ids_in_process(endpoint_url, tenant_id, count):
+    os.environ["AWS_ENDPOINT_URL"] = endpoint_url
+    from backend.db.file_counters_queries import get_next_file_id, release_leased_blocks
+    ids = [get_next_file_id(tenant_id) for _ in range(count)]
+    release_leased_blocks()
+    return ids
+
+def test_processes_get_unique_ids_across_releases(counters):
+    # Each process stops part-way through its block and releases it, so later rounds claim freed blocks.
+    context = multiprocessing.get_context("spawn")
+    ids = []
+    with context.Pool(4) as pool:
+        for _ in range(3):
+            for batch in pool.starmap(take_ids_in_process, [(counters, "tenant-a", 7)] * 4):
+                ids += batch
+
+    assert len(set(ids)) == len(ids) == 84
+    item = file_counters_queries.table.get_item(Key={"tenantId": "tenant-a"})["Item"]
+    assert item.get("freeBlocks")
@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+from io import BytesIO
+
+import boto3
+import pytest
+
+from backend.db.backfill_file_versions import backfill_all
+from backend.db.files_queries import upsert_file_data
+from backend.db.file_versions_queries import query_file_versions
+from backend.utils.file_upload import handle_file_upload, handle_formats_upload
+from conftest import load_handler
+
+@pytest.fixture
+def handler(aws):
+    return load_handler("get-file-history")
+
+def save(data, file_id=None):
+    bucket_name, s3_key, file_id, metadata = handle_file_upload(BytesIO(data), "tenant-a", file_id, {}, "png")
+    upsert_file_data("tenant-a", file_id, s3_key, "diagram", "json", metadata)
+    return file_id, metadata['currentVersionId']
+
+def put_legacy(key, data):
+    # Written straight to S3, as saves were before the FileVersions index existed.
+    return boto3.client("s3").put_object(Bucket="test-bucket", Key=key, Body=data, ContentType="png")["VersionId"]
+
+def history(handler, file_id, **body):
+    event = {"body": json.dumps({"tenantId": "tenant-a", **body}), "pathParameters": {"fileId": file_id}}
+    response = handler.lambda_handler(event, None)
+    return response["statusCode"], json.loads(response["body"])
+
+def read_all(handler, file_id, page_size):
+    version_ids = []
+    next_token = None
+    while True:
+        status, body = history(handler, file_id, pageSize=page_size, nextToken=next_token)
+        assert status == 200
+        version_ids += [version["VersionId"] for version in body["versions"]]
+        next_token = body["nextToken"]
+        if not next_token:
+            return version_ids
+
+def test_history_pages_newest_first(handler):
+    file_id, first = save(b"1")
+    _, second = save(b"2", file_id)
+    _, third = save(b"3", file_id)
+
+    assert read_all(handler, file_id, 2) == [third, second, first]
+
+def test_history_falls_back_to_s3_for_unindexed_files(handler):
+    versions = [put_legacy("tenant-a/file_001", data) for data in (b"1", b"2", b"3")]
+    put_legacy("tenant-a/file_001.svg", b"derived")
+    put_legacy("tenant-a/file_0010", b"other file")
+
+    assert read_all(handler, "file_001", 2) == versions[::-1]
+
+@pytest.mark.parametrize("page_size", ["abc", 0, -1, 1.5, True, [10]])
+def test_history_rejects_bad_page_sizes(handler, page_size):
+    status, _ = history(handler, "file_001", pageSize=page_size)
+    assert status == 400
+
+def test_backfill_adds_only_unindexed_versions(aws):
+    legacy_version = put_legacy("tenant-a/file_001", b"legacy")
+    boto3.resource("dynamodb").Table("Files").put_item(Item={"tenantId": "tenant-a", "fileId": "file_001", "s3Key": "tenant-a/file_001"})
+    _, indexed_version = save(b"indexed", "file_001")
+
+    assert backfill_all("test-bucket") == 1
+    assert backfill_all("test-bucket") == 0
+
+    items, _ = query_file_versions("tenant-a", "file_001", 10)
+    assert [item["versionId"] for item in items] == [indexed_version, legacy_version]
+
+def test_history_records_extra_format_versions(handler):
+    buffers = {"png": BytesIO(b"png"), "svg": BytesIO(b"<svg/>")}
+    _, s3_keys, file_id, metadata = handle_formats_upload(buffers, "tenant-a", None, {})
+
+    status, body = history(handler, file_id)
+
+    svg_version = boto3.client("s3").head_object(Bucket="test-bucket", Key=s3_keys["svg"])["VersionId"]
+    assert status == 200
+    assert body["versions"] == [{
+        "VersionId": metadata["currentVersionId"],
+        "LastModified": body["versions"][0]["LastModified"],
+        "IsLatest": True,
+        "Size": 3,
+        "Formats": {"svg": svg_version}
+    }]
+
+def test_both_history_sources_use_one_timestamp_format(handler):
+    put_legacy("tenant-a/file_001", b"legacy")
+    file_id, _ = save(b"indexed")
+
+    _, from_s3 = history(handler, "file_001")
+    _, from_index = history(handler, file_id)
+
+    for body in (from_s3, from_index):
+        timestamp = datetime.fromisoformat(body["versions"][0]["LastModified"])
+        assert timestamp.tzinfo is None
+        assert abs((datetime.utcnow() - timestamp).total_seconds()) < 60
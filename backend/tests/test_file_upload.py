@@ -0,0 +1,26 @@
+import os
+from io import BytesIO
+
+import boto3
+
+from backend.utils import file_upload
+
+def test_large_images_upload_in_parts_and_keep_their_version(aws, monkeypatch):
+    monkeypatch.setattr(file_upload, "MULTIPART_THRESHOLD", 1024)
+    image = os.urandom(file_upload.MULTIPART_PART_SIZE * 2 + 1024)
+
+    result = file_upload.handle_formats_upload({"png": BytesIO(image)}, "tenant-a", "file_001", {})
+
+    _, s3_keys, _, metadata = result
+    s3 = boto3.client("s3")
+    head = s3.head_object(Bucket="test-bucket", Key=s3_keys["png"])
+    assert head["VersionId"] == metadata["currentVersionId"]
+    assert head["ETag"].endswith('-3"')
+    assert s3.get_object(Bucket="test-bucket", Key=s3_keys["png"])["Body"].read() == image
+
+def test_small_images_upload_in_one_request(aws):
+    _, s3_keys, _, metadata = file_upload.handle_formats_upload({"png": BytesIO(b"image")}, "tenant-a", "file_001", {})
+
+    head = boto3.client("s3").head_object(Bucket="test-bucket", Key=s3_keys["png"])
+    assert head["VersionId"] == metadata["currentVersionId"]
+    assert "-" not in head["ETag"]
@@ -0,0 +1,24 @@
+from backend.db import files_queries
+
+def test_upsert_keeps_create_time_attributes(aws):
+    created = files_queries.upsert_file_data("tenant-a", "file_001", "tenant-a/file_001", "first.png", "er", {"owner": "ana", "currentVersionId": "v1"})
+
+    updated = files_queries.upsert_file_data("tenant-a", "file_001", "tenant-a/file_001", "renamed.png", "er", {
+        "owner": "bob",
+        "createdAt": "2000-01-01T00:00:00",
+        "currentVersionId": "v2"
+    })
+
+    assert updated["fileName"] == "first.png"
+    assert updated["owner"] == "ana"
+    assert updated["createdAt"] == created["createdAt"]
+    assert updated["currentVersionId"] == "v2"
+    assert updated["updatedAt"] >= created["updatedAt"]
+    assert files_queries.get_file("tenant-a", "file_001") == updated
+
+def test_upsert_without_a_version_keeps_the_current_one(aws):
+    files_queries.upsert_file_data("tenant-a", "file_001", "tenant-a/file_001", "first.png", "er", {"currentVersionId": "v1"})
+
+    updated = files_queries.upsert_file_data("tenant-a", "file_001", "tenant-a/file_001", "first.png", "er", {})
+
+    assert updated["currentVersionId"] == "v1"
@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+import pytest
+
+from backend.utils.diagram_renderers import load_module
+
+generate_graph = load_module("json", "generate_graph")
+layout = load_module("json", "layout")
+
+def build_tree(parents):
+    graph = generate_graph.JsonGraph()
+    for node_id, parent in enumerate(parents):
+        graph.add_node(str(node_id), parent)
+    return graph
+
+def test_empty_graph_has_no_positions():
+    assert layout.tree_layout(generate_graph.JsonGraph()).shape == (0, 2)
+
+def test_parent_is_centered_over_its_children():
+    positions = layout.tree_layout(build_tree([-1, 0, 0, 0]))
+
+    assert positions.tolist() == [[1, 0], [0, -1], [1, -1], [2, -1]]
+
+def test_leaves_keep_document_order_in_an_uneven_tree():
+    # 0 -> 1 -> (2, 3), 0 -> 4
+    positions = layout.tree_layout(build_tree([-1, 0, 1, 1, 0]))
+
+    assert positions.tolist() == [[1.25, 0], [0.5, -1], [0, -2], [1, -2], [2, -1]]
+
+def test_separate_roots_sit_side_by_side():
+    positions = layout.tree_layout(build_tree([-1, 0, -1, 2]))
+
+    assert positions.tolist() == [[0, 0], [0, -1], [1, 0], [1, -1]]
+
+def test_deep_documents_are_laid_out_without_recursion():
+    depth = 5000
+    graph = generate_graph.json_to_graph("[" * depth + "]" * depth)
+
+    positions = layout.tree_layout(graph)
+
+    assert positions[:, 0].tolist() == [0] * len(graph)
+    assert positions[-1, 1] == -(len(graph) - 1)
+
+def test_nodes_on_one_level_never_overlap():
+    graph = generate_graph.json_to_graph(json.dumps({"a": {"b": [1, 2, {"c": 3}], "d": None}, "e": [4, [5, 6]]}))
+
+    positions = layout.tree_layout(graph)
+
+    for depth in np.unique(positions[:, 1]):
+        level = np.sort(positions[positions[:, 1] == depth, 0])
+        assert np.all(np.diff(level) > 0)
+
+def test_unknown_layout_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported layout: radial"):
+        layout.compute_layout(build_tree([-1]), "radial")
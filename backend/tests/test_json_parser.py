@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from backend.utils.diagram_renderers import load_module
+
+generate_graph = load_module("json", "generate_graph")
+
+def events(text):
+    return list(generate_graph.iter_json_events(text))
+
+def test_events_follow_the_document():
+    assert events('{"a": [1, "x", null], "b": {}}') == [
+        ("start_map", None),
+        ("map_key", "a"),
+        ("start_array", None),
+        ("scalar", 1),
+        ("scalar", "x"),
+        ("scalar", None),
+        ("end_array", None),
+        ("map_key", "b"),
+        ("start_map", None),
+        ("end_map", None),
+        ("end_map", None),
+    ]
+
+@pytest.mark.parametrize("text", ['0', '-1.5e3', '"s\\u00e9"', 'true', '[]', '{}', '[[], {}]', ' {"a" : {"b" : [1 , 2]}} '])
+def test_valid_documents_match_json_loads(text):
+    # Rebuild the value from the events and compare with the standard parser.
+    stack = [[]]
+    keys = []
+    for event, value in events(text):
+        if event == "map_key":
+            keys.append(value)
+            continue
+        if event in ("start_map", "start_array"):
+            stack.append({} if event == "start_map" else [])
+            continue
+        if event in ("end_map", "end_array"):
+            value = stack.pop()
+        parent = stack[-1]
+        if isinstance(parent, dict):
+            parent[keys.pop()] = value
+        else:
+            parent.append(value)
+    assert stack == [[json.loads(text)]]
+
+@pytest.mark.parametrize("text", [
+    '[}',
+    '{"a": 1]',
+    '[1, {"a": 2]}',
+    '{"a": [1}',
+    '',
+    '[',
+    '{"a"}',
+    '{"a": 1,}',
+    '[1 2]',
+    '[1,]',
+    '{1: 2}',
+    '[] []',
+    'nul',
+    '"unterminated',
+])
+def test_invalid_documents_raise(text):
+    with pytest.raises(ValueError):
+        events(text)
+
+def test_graph_labels_keys_indexes_and_scalars():
+    graph = generate_graph.json_to_graph('{"users": [{"name": "ana"}, 7]}')
+
+    assert graph.labels == ["users", "[0]", "name", "ana", "[1]", "7"]
+    assert list(graph.parents) == [-1, 0, 1, 2, 0, 4]
+    assert graph.node_path(3) == "users/[0]/name/ana"
@@ -0,0 +1,74 @@
+import json
+
+import boto3
+import pytest
+
+from conftest import load_handler
+
+@pytest.fixture
+def handler(aws):
+    return load_handler("list-files")
+
+def list_files(handler, **body):
+    response = handler.lambda_handler({"body": json.dumps({"tenantId": "tenant-a", **body})}, None)
+    return response["statusCode"], json.loads(response["body"])
+
+@pytest.mark.parametrize("page_size", ["abc", 0, -1, 1.5, True, [10]])
+def test_list_rejects_bad_page_sizes(handler, page_size):
+    status, _ = list_files(handler, pageSize=page_size)
+    assert status == 400
+
+def test_list_caps_large_page_sizes(handler):
+    status, body = list_files(handler, pageSize="1000")
+    assert status == 200
+    assert body["files"] == []
+
+def put_file(file_id, diagram_type, created_at):
+    boto3.resource("dynamodb").Table("Files").put_item(Item={
+        "tenantId": "tenant-a",
+        "fileId": file_id,
+        "diagramType": diagram_type,
+        "createdAt": created_at
+    })
+
+def read_all(handler, page_size, **body):
+    file_ids = []
+    next_token = None
+    while True:
+        status, page = list_files(handler, pageSize=page_size, nextToken=next_token, **body)
+        assert status == 200
+        assert len(page["files"]) <= page_size
+        file_ids += [file["fileId"] for file in page["files"]]
+        next_token = page["nextToken"]
+        if not next_token:
+            return file_ids
+
+@pytest.fixture
+def files(handler):
+    # Ids past 999 and ids from released blocks are out of creation order on purpose.
+    for index, (file_id, diagram_type) in enumerate([
+        ("file_1000", "er"),
+        ("file_002", "json"),
+        ("file_999", "er"),
+        ("file_1001", "aws"),
+        ("file_003", "er"),
+    ]):
+        put_file(file_id, diagram_type, f"2026-10-0{index + 1}T00:00:00")
+    put_file("file_001", "er", "2026-09-01T00:00:00")
+
+def test_list_pages_newest_first(handler, files):
+    assert read_all(handler, 2) == ["file_003", "file_1001", "file_999", "file_002", "file_1000", "file_001"]
+
+def test_list_filters_by_type(handler, files):
+    # DiagramTypeIndex is keyed by tenant within a type, so only membership is fixed.
+    assert sorted(read_all(handler, 2, diagramType="er")) == ["file_001", "file_003", "file_1000", "file_999"]
+    assert read_all(handler, 2, diagramType="json") == ["file_002"]
+
+def test_list_rejects_tokens_from_another_listing(handler, files):
+    _, page = list_files(handler, pageSize=1, diagramType="er")
+    status, _ = list_files(handler, pageSize=1, nextToken=page["nextToken"])
+    assert status == 400
+
+    _, page = list_files(handler, pageSize=1)
+    status, _ = list_files(handler, pageSize=1, diagramType="er", nextToken=page["nextToken"])
+    assert status == 400
@@ -0,0 +1,59 @@
+import hashlib
+import json
+
+import boto3
+import pytest
+
+from backend.utils import render_cache
+from backend.utils.diagram_renderers import load_module
+from backend.utils.metrics import RequestMetrics
+from conftest import load_handler
+
+@pytest.fixture
+def cache(aws, monkeypatch):
+    monkeypatch.setenv("RENDER_CACHE_BUCKET", "test-bucket")
+    render_cache.memory_cache.clear()
+    render_cache.memory_usage["bytes"] = 0
+    yield render_cache
+    render_cache.memory_cache.clear()
+    render_cache.memory_usage["bytes"] = 0
+
+def render_once(cache):
+    metrics = RequestMetrics()
+    cache.cached_render_many({"png": "key-png", "intermediate": "key-intermediate"}, lambda: {"png": b"image", "intermediate": b"layout"}, metrics)
+    return {name: value for name, (value, _) in metrics.values.items() if name.startswith("renderCache")}
+
+def test_hits_and_misses_are_recorded_per_request(cache, capsys):
+    assert render_once(cache) == {"renderCacheHit": 0, "renderCacheMemoryHits": 0, "renderCachePersistentHits": 0, "renderCacheMisses": 2}
+    assert render_once(cache) == {"renderCacheHit": 1, "renderCacheMemoryHits": 2, "renderCachePersistentHits": 0, "renderCacheMisses": 0}
+
+    cache.memory_cache.clear()
+    assert render_once(cache) == {"renderCacheHit": 1, "renderCacheMemoryHits": 0, "renderCachePersistentHits": 2, "renderCacheMisses": 0}
+    assert capsys.readouterr().out == ""
+
+def test_persistent_tier_is_off_without_a_cache_bucket(cache, monkeypatch):
+    monkeypatch.delenv("RENDER_CACHE_BUCKET")
+
+    render_once(cache)
+    cache.memory_cache.clear()
+
+    assert render_once(cache)["renderCacheMisses"] == 2
+    assert "Contents" not in boto3.client("s3").list_objects_v2(Bucket="test-bucket")
+
+def test_renderer_version_is_part_of_the_key():
+    keys = {render_cache.build_cache_key("json", "json", '{"a": 1}', "png", version, "tree") for version in ("json-1", "json-2")}
+
+    assert len(keys) == 2
+
+# Output fingerprints per renderer version. When one of these fails, the renderer's output changed:
+# bump RENDERER_VERSION in that handler so cached renders from the old code stop being served, and record the new hash.
+JSON_LAYOUT_FINGERPRINTS = {"json-2": "67608026097533383de42abcf4174d009f00bc1d82e6cb8e434f266939e5f70b"}
+
+def test_json_output_changes_come_with_a_new_renderer_version(aws):
+    handler = load_handler("create-json-diagram")
+    render_image = load_module("json", "render_image")
+    graph, coords = render_image.layout_json(json.dumps({"a": {"b": [1, 2, {"c": None}], "d": "x"}, "e": [True, [3, 4]]}), "tree", None)
+
+    fingerprint = hashlib.sha256(render_image.serialize_layout(graph, coords, "tree")).hexdigest()
+
+    assert JSON_LAYOUT_FINGERPRINTS.get(handler.RENDERER_VERSION) == fingerprint
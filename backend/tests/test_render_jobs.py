@@ -0,0 +1,114 @@
+import json
+
+import boto3
+import pytest
+
+from backend.db.render_jobs_queries import get_render_job
+from backend.utils import job_queue, render_jobs
+from backend.utils.node_layouts import load_node_positions, save_node_positions
+from backend.utils.render_jobs import submit_render_job
+from conftest import load_handler
+
+@pytest.fixture
+def queue_url(aws, monkeypatch):
+    queue_url = boto3.client("sqs").create_queue(QueueName="render-jobs")["QueueUrl"]
+    monkeypatch.setenv("RENDER_JOBS_QUEUE_URL", queue_url)
+    monkeypatch.setattr(job_queue, "queues", {})
+    return queue_url
+
+@pytest.fixture
+def worker(queue_url):
+    return load_handler("render-worker")
+
+def submit(input_text):
+    return submit_render_job("json", "tenant-a", json.dumps(input_text), {"outputFormat": "png", "fileName": "diagram"})
+
+def receive_records(queue_url):
+    messages = boto3.client("sqs").receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10)["Messages"]
+    return [{"messageId": message["MessageId"], "body": message["Body"]} for message in messages]
+
+def payload_keys():
+    response = boto3.client("s3").list_objects_v2(Bucket="test-bucket", Prefix=render_jobs.PAYLOAD_PREFIX)
+    return [item["Key"] for item in response.get("Contents", [])]
+
+def test_job_runs_from_queued_to_done(worker, queue_url):
+    job_id = submit({"root": {"child": 1}})
+    assert get_render_job(job_id)["status"] == "queued"
+
+    response = worker.lambda_handler({"Records": receive_records(queue_url)}, None)
+
+    assert response == {"batchItemFailures": []}
+    job = get_render_job(job_id)
+    assert job["status"] == "done"
+    assert job["imageUrl"].endswith(f"/tenant-a/{job['fileId']}")
+
+def test_staged_payload_is_kept_until_the_job_finishes(worker, queue_url, monkeypatch):
+    monkeypatch.setattr(render_jobs, "MAX_INLINE_PAYLOAD", 10)
+    job_id = submit({"root": {"child": 1}})
+    render_item = worker.render_item
+    seen_while_rendering = []
+
+    def render_and_check(job, metrics, previous_positions):
+        # A worker that dies here leaves the message to be retried, which needs the payload again.
+        seen_while_rendering.extend(payload_keys())
+        return render_item(job, metrics, previous_positions)
+
+    monkeypatch.setattr(worker, "render_item", render_and_check)
+    assert worker.lambda_handler({"Records": receive_records(queue_url)}, None) == {"batchItemFailures": []}
+
+    assert len(seen_while_rendering) == 1
+    assert get_render_job(job_id)["status"] == "done"
+    assert payload_keys() == []
+
+def test_render_failures_are_terminal(worker, queue_url, monkeypatch):
+    monkeypatch.setattr(render_jobs, "MAX_INLINE_PAYLOAD", 10)
+    job_id = submit_render_job("json", "tenant-a", "not json", {"outputFormat": "png"})
+
+    assert worker.lambda_handler({"Records": receive_records(queue_url)}, None) == {"batchItemFailures": []}
+
+    assert get_render_job(job_id)["status"] == "failed"
+    assert payload_keys() == []
+
+def test_unreadable_records_fail_alone(worker, queue_url):
+    job_id = submit({"root": {"child": 1}})
+    records = [
+        {"messageId": "not-json", "body": "{"},
+        {"messageId": "missing-payload", "body": json.dumps({"jobId": "job-x", "payloadKey": "render-jobs/job-x.json"})},
+        *receive_records(queue_url)
+    ]
+
+    response = worker.lambda_handler({"Records": records}, None)
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "not-json"}, {"itemIdentifier": "missing-payload"}]}
+    assert get_render_job(job_id)["status"] == "done"
+
+def test_submit_needs_a_configured_queue(aws, monkeypatch):
+    monkeypatch.delenv("RENDER_JOBS_QUEUE_URL", raising=False)
+    monkeypatch.delenv("RENDER_JOBS_SQLITE_PATH", raising=False)
+
+    with pytest.raises(RuntimeError):
+        submit({"root": {}})
+    assert boto3.resource("dynamodb").Table("RenderJobs").scan()["Items"] == []
+
+def test_aws_jobs_keep_stored_positions(worker, queue_url, monkeypatch):
+    save_node_positions("tenant-a", "file_001", {"web": [1.0, 2.0]})
+    nodes = [{"id": "web", "type": "EC2", "label": "Web"}, {"id": "db", "type": "RDS", "label": "Database"}]
+    submit_render_job("aws", "tenant-a", {"nodes": nodes, "edges": []}, {"outputFormat": "png", "fileId": "file_001"})
+    pinned = []
+
+    def render_item(job, metrics, previous_positions):
+        # Stands in for Graphviz, which is not installed here: the web node stays put and db is placed beside it.
+        pinned.append(previous_positions)
+        laid_out = (
+            'digraph {\n'
+            f'\t"{"a" * 32}"\t[diagramid=web, pos="1,2!"];\n'
+            f'\t"{"b" * 32}"\t[diagramid=db, pos="5,2"];\n'
+            '}\n'
+        )
+        return b"image", laid_out.encode()
+
+    monkeypatch.setattr(worker, "render_item", render_item)
+    assert worker.lambda_handler({"Records": receive_records(queue_url)}, None) == {"batchItemFailures": []}
+
+    assert pinned == [{"web": [1.0, 2.0]}]
+    assert load_node_positions("tenant-a", "file_001") == {"web": [1.0, 2.0], "db": [5.0, 2.0]}
@@ -0,0 +1,69 @@
+import json
+from io import BytesIO
+
+import boto3
+import pytest
+
+from backend.db.files_queries import get_file, upsert_file_data
+from backend.db.file_versions_queries import query_file_versions
+from backend.utils.file_upload import handle_file_upload
+from conftest import load_handler
+
+@pytest.fixture
+def handler(aws):
+    return load_handler("restore-file-version")
+
+def save(data, file_id=None, metadata=None):
+    bucket_name, s3_key, file_id, metadata = handle_file_upload(BytesIO(data), "tenant-a", file_id, metadata or {}, "png")
+    upsert_file_data("tenant-a", file_id, s3_key, "diagram", "json", metadata)
+    return file_id, metadata.get('currentVersionId')
+
+def restore(handler, file_id, version_id):
+    event = {"body": json.dumps({"tenantId": "tenant-a", "versionId": version_id}), "pathParameters": {"fileId": file_id}}
+    return handler.lambda_handler(event, None)
+
+def test_restore_moves_the_pointer_and_logs_it(handler):
+    file_id, first_version = save(b"first")
+    _, second_version = save(b"second", file_id)
+    assert get_file("tenant-a", file_id)["currentVersionId"] == second_version
+
+    assert restore(handler, file_id, first_version)["statusCode"] == 200
+
+    assert get_file("tenant-a", file_id)["currentVersionId"] == first_version
+    items, _ = query_file_versions("tenant-a", file_id, 10)
+    assert [item["versionId"] for item in items] == [first_version, second_version, first_version]
+
+def test_restore_finds_versions_missing_from_the_index(handler):
+    file_id, _ = save(b"indexed")
+    # Written straight to S3, as saves were before the FileVersions index existed.
+    legacy_version = boto3.client("s3").put_object(Bucket="test-bucket", Key=f"tenant-a/{file_id}", Body=b"legacy", ContentType="png")["VersionId"]
+
+    assert restore(handler, file_id, legacy_version)["statusCode"] == 200
+    assert get_file("tenant-a", file_id)["currentVersionId"] == legacy_version
+
+def test_restoring_an_unindexed_file_keeps_its_s3_history(handler):
+    s3 = boto3.client("s3")
+    # Saved only before the FileVersions index existed.
+    legacy_versions = [s3.put_object(Bucket="test-bucket", Key="tenant-a/file_001", Body=data, ContentType="png")["VersionId"] for data in (b"1", b"2", b"3")]
+    boto3.resource("dynamodb").Table("Files").put_item(Item={"tenantId": "tenant-a", "fileId": "file_001", "s3Key": "tenant-a/file_001"})
+
+    assert restore(handler, "file_001", legacy_versions[0])["statusCode"] == 200
+
+    items, _ = query_file_versions("tenant-a", "file_001", 10)
+    assert [item["versionId"] for item in items] == [legacy_versions[0], *legacy_versions[::-1]]
+
+def test_restore_rejects_unknown_versions(handler):
+    file_id, _ = save(b"first")
+    assert restore(handler, file_id, "not-a-version")["statusCode"] == 404
+    assert restore(handler, "file_999", "not-a-version")["statusCode"] == 404
+
+def test_client_version_pointer_is_ignored(aws, monkeypatch):
+    boto3.client("s3").create_bucket(Bucket="unversioned-bucket")
+    monkeypatch.setenv("S3-BUCKET-NAME", "unversioned-bucket")
+
+    file_id, version_id = save(b"first", metadata={"currentVersionId": "forged", "author": "someone"})
+
+    assert version_id is None
+    item = get_file("tenant-a", file_id)
+    assert "currentVersionId" not in item
+    assert item["author"] == "someone"
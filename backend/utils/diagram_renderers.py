@@ -0,0 +1,118 @@
+import importlib.util
+import os
+import sys
+from io import BytesIO
+
+from .graph_layout import layout_runner, validate_layout_engine
+from .metrics import measure
+from .node_layouts import load_pinned_positions, save_node_positions
+
+# Deployed functions set LAMBDAS_DIR to where their package puts the diagram lambdas.
+LAMBDAS_DIR = os.getenv("LAMBDAS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lambdas"))
+
+RENDERER_DIRS = {
+    "er": os.path.join(LAMBDAS_DIR, "create-er-diagram", "utils"),
+    "json": os.path.join(LAMBDAS_DIR, "create-json-diagram", "utils"),
+    "aws": os.path.join(LAMBDAS_DIR, "create-aws-diagram", "utils"),
+}
+
+CONVERT_OUTPUT_FORMATS = {
+    "er": ("png", "svg"),
+    "json": ("png", "svg", "pdf", "jpg"),
+    "aws": ("png", "svg", "pdf", "jpg"),
+}
+
+VALIDATION_MODULES = {
+    "er": "validation",
+    "json": "validation",
+    "aws": "validate_body",
+}
+
+# Each diagram lambda imports its helpers by bare module name, so its utils directory must be importable.
+for utils_dir in RENDERER_DIRS.values():
+    if utils_dir not in sys.path:
+        sys.path.append(utils_dir)
+
+def load_module(diagram_type, module_name):
+    # ER and JSON both ship validation.py and render_image.py, so load them under type-qualified names.
+    qualified_name = f"{diagram_type}_{module_name}"
+    module = sys.modules.get(qualified_name)
+    if module is None:
+        path = os.path.join(RENDERER_DIRS[diagram_type], f"{module_name}.py")
+        spec = importlib.util.spec_from_file_location(qualified_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+def validate_item(item):
+    diagram_type = item.get('diagramType')
+    if diagram_type not in RENDERER_DIRS:
+        return f"Unsupported diagram type: {diagram_type}"
+
+    if diagram_type != 'json':
+        error = validate_layout_engine(item.get('layoutEngine'))
+        if error:
+            return error
+
+    validation = load_module(diagram_type, VALIDATION_MODULES[diagram_type])
+    if diagram_type == 'json':
+        return validation.validate_body(item.get('inputFormat'), item.get('outputFormat'), item.get('inputText'), item.get('tenantId'), item.get('layout', 'tree'))
+    error = validation.validate_body(item.get('inputFormat'), item.get('outputFormat'), item.get('inputText'), item.get('tenantId'))
+    if error:
+        return error
+    if diagram_type == 'er':
+        return validation.validate_reflection_filters(item.get('schemas'), item.get('tables'))
+
+    errors = validation.validate_diagram(item.get('inputText'))
+    if errors:
+        return "Invalid diagram: " + "; ".join(f"{error['path']}: {error['message']}" for error in errors)
+    return None
+
+def load_item_positions(item):
+    # Read by the caller, not render_item, so renders in worker processes never touch S3.
+    if item['diagramType'] != 'aws':
+        return None
+    return load_pinned_positions(item['tenantId'], item.get('fileId'), item.get('layoutEngine'), item.get('relayout'))
+
+def save_item_positions(item, file_id, intermediate):
+    # Taken from the intermediate, like the sync AWS handler does, so the next incremental render starts from this one.
+    if item['diagramType'] != 'aws':
+        return
+    positions = load_module('aws', 'build_diagram').parse_positions(intermediate.decode())
+    if positions:
+        save_node_positions(item['tenantId'], file_id, positions)
+
+def render_item(item, metrics=None, previous_positions=None):
+    # Returns the image and the intermediate form that convert_intermediate starts from.
+    diagram_type = item['diagramType']
+    input_format = item.get('inputFormat')
+    output_format = item['outputFormat']
+    input_text = item['inputText']
+
+    if diagram_type == 'er':
+        with measure(metrics, "graphBuild"):
+            er_buffer = load_module('er', 'generate_er').generate_er_file(input_format, input_text, item.get('schemas'), item.get('tables'))
+        with measure(metrics, "render"):
+            image_buffer = load_module('er', 'render_image').render_er_to_memory(er_buffer, output_format, layout_runner(item.get('layoutEngine'), metrics))
+        intermediate = er_buffer.getvalue()
+    elif diagram_type == 'json':
+        images, intermediate = load_module('json', 'render_image').render_json_with_layout(input_text, [output_format], item.get('layout', 'tree'), metrics)
+        image_buffer = images[output_format]
+    else:
+        images, laid_out, _ = load_module('aws', 'generate_aws').generate_aws_layout(input_text, [output_format], previous_positions, metrics, layout_runner(item.get('layoutEngine'), metrics))
+        image_buffer = images[output_format]
+        intermediate = laid_out.encode()
+
+    return image_buffer.getvalue(), intermediate
+
+def convert_intermediate(diagram_type, data, output_format):
+    # Starts from the stored intermediate form: no SQL or database reflection, and only ER markup is laid out again.
+    if diagram_type == 'er':
+        image_buffer = load_module('er', 'render_image').render_er_to_memory(BytesIO(data), output_format, layout_runner())
+    elif diagram_type == 'json':
+        image_buffer = load_module('json', 'render_image').render_layout_to_buffer(data, output_format)
+    else:
+        return load_module('aws', 'build_diagram').render_stored_layout(data.decode(), output_format)
+
+    return image_buffer.getvalue()
@@ -1,9 +1,11 @@
 import boto3
 import json
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from utils.file_metadata import get_file_metadata
+from .metrics import measure
 from ..db.file_counters_queries import get_next_file_id
+from ..db.file_versions_queries import insert_file_version
 
 dynamodb = boto3.resource('dynamodb')
 s3 = boto3.client('s3')
@@ -11,26 +13,130 @@ s3 = boto3.client('s3')
 files_table = dynamodb.Table('Files')
 bucket_name = "your-bucket-name"
 
-def handle_file_upload(image_buffer, tenant_id, file_id, metadata, output_format):
+MULTIPART_THRESHOLD = int(os.getenv("MULTIPART_THRESHOLD", str(16 * 1024 * 1024)))
+MULTIPART_PART_SIZE = max(int(os.getenv("MULTIPART_PART_SIZE", str(8 * 1024 * 1024))), 5 * 1024 * 1024)
+MULTIPART_CONCURRENCY = int(os.getenv("MULTIPART_CONCURRENCY", "4"))
+
+def get_stream_size(stream):
+    position = stream.tell()
+    size = stream.seek(0, os.SEEK_END) - position
+    stream.seek(position)
+    return size
+
+def upload_part(bucket_name, s3_key, upload_id, part_number, chunk):
+    response = s3.upload_part(
+        Bucket=bucket_name,
+        Key=s3_key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=chunk
+    )
+    return {"PartNumber": part_number, "ETag": response['ETag']}
+
+def multipart_upload(stream, bucket_name, s3_key, content_type):
+    upload_id = s3.create_multipart_upload(Bucket=bucket_name, Key=s3_key, ContentType=content_type)['UploadId']
+
     try:
-        file_id = file_id or get_next_file_id(tenant_id)
+        parts = []
+        with ThreadPoolExecutor(max_workers=MULTIPART_CONCURRENCY) as pool:
+            in_flight = set()
+            part_number = 1
+            chunk = stream.read(MULTIPART_PART_SIZE)
+            while chunk:
+                # Bound the parts held in memory to the ones currently being uploaded.
+                if len(in_flight) >= MULTIPART_CONCURRENCY:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    parts.extend(future.result() for future in done)
 
-        bucket_name = os.getenv("S3-BUCKET-NAME")
-        s3_key = f"{tenant_id}/{file_id}"
+                in_flight.add(pool.submit(upload_part, bucket_name, s3_key, upload_id, part_number, chunk))
+                part_number += 1
+                chunk = stream.read(MULTIPART_PART_SIZE)
+
+            parts.extend(future.result() for future in in_flight)
 
-        s3.put_object(
+        parts.sort(key=lambda part: part["PartNumber"])
+        # Like put_object's, this response carries the VersionId the version index records.
+        return s3.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts}
+        )
+    except Exception:
+        s3.abort_multipart_upload(Bucket=bucket_name, Key=s3_key, UploadId=upload_id)
+        raise
+
+def upload_image(image_buffer, bucket_name, s3_key, content_type):
+    # Small images take one request; past the threshold parts go up in parallel.
+    if get_stream_size(image_buffer) < MULTIPART_THRESHOLD:
+        return s3.put_object(
             Bucket=bucket_name,
             Key=s3_key,
             Body=image_buffer,
-            ContentType=output_format
+            ContentType=content_type
         )
+    return multipart_upload(image_buffer, bucket_name, s3_key, content_type)
+
+def build_image_key(tenant_id, file_id, output_format=None):
+    # The primary format lives at the file's own key, which the version index tracks; extra formats sit beside it.
+    s3_key = f"{tenant_id}/{file_id}"
+    return f"{s3_key}.{output_format}" if output_format else s3_key
+
+def handle_formats_upload(image_buffers, tenant_id, file_id, metadata, metrics=None):
+    try:
+        if not file_id:
+            with measure(metrics, "dynamoWrite"):
+                file_id = get_next_file_id(tenant_id)
+
+        bucket_name = os.getenv("S3-BUCKET-NAME")
+        primary_format = next(iter(image_buffers))
+        s3_keys = {
+            output_format: build_image_key(tenant_id, file_id, None if output_format == primary_format else output_format)
+            for output_format in image_buffers
+        }
+
+        sizes = {output_format: get_stream_size(buffer) for output_format, buffer in image_buffers.items()}
+        if metrics:
+            metrics.record("outputBytes", sum(sizes.values()), "Bytes")
+
+        with measure(metrics, "s3Upload"):
+            if len(image_buffers) == 1:
+                responses = {primary_format: upload_image(image_buffers[primary_format], bucket_name, s3_keys[primary_format], primary_format)}
+            else:
+                with ThreadPoolExecutor(max_workers=len(image_buffers)) as pool:
+                    futures = {
+                        output_format: pool.submit(upload_image, buffer, bucket_name, s3_keys[output_format], output_format)
+                        for output_format, buffer in image_buffers.items()
+                    }
+                    responses = {output_format: future.result() for output_format, future in futures.items()}
+
+        version_id = responses[primary_format].get('VersionId')
+        # The extra formats belong to this version; recording their VersionIds keeps them with it in history.
+        format_versions = {
+            output_format: response['VersionId']
+            for output_format, response in responses.items()
+            if output_format != primary_format and response.get('VersionId')
+        }
+        with measure(metrics, "dynamoWrite"):
+            insert_file_version(tenant_id, file_id, version_id, sizes[primary_format], primary_format, format_versions)
+
+        # The pointer only ever comes from S3; a client-supplied one could name any version, or none that exists.
+        metadata = {key: value for key, value in metadata.items() if key != 'currentVersionId'}
+        if version_id:
+            metadata['currentVersionId'] = version_id
+
+        return bucket_name, s3_keys, file_id, metadata
 
-        metadata = get_file_metadata(tenant_id, file_id, metadata)
-        
-        return bucket_name, s3_key, file_id, metadata
-    
     except Exception as e:
         return {
             "statusCode": 500,
             "body": json.dumps({"error": str(e)})
         }
+
+def handle_file_upload(image_buffer, tenant_id, file_id, metadata, output_format, metrics=None):
+    result = handle_formats_upload({output_format: image_buffer}, tenant_id, file_id, metadata, metrics)
+    if isinstance(result, dict):
+        return result
+
+    bucket_name, s3_keys, file_id, metadata = result
+    return bucket_name, s3_keys[output_format], file_id, metadata
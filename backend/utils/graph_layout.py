@@ -0,0 +1,81 @@
+import os
+import subprocess
+import tempfile
+
+LAYOUT_ENGINES = ("dot", "sfdp", "neato", "osage")
+LAYOUT_TIME_BUDGET_SECONDS = float(os.getenv("LAYOUT_TIME_BUDGET_SECONDS", "10"))
+
+# dot's layered layout reads best but grows much faster than linearly with size and crossings.
+MAX_DOT_NODES = 150
+MAX_DOT_EDGES_PER_NODE = 2.5
+# neato's stress majorization is quadratic in nodes; sfdp's multilevel layout is close to linear.
+MAX_NEATO_NODES = 400
+# With few edges there is little structure to show, so osage just packs the nodes.
+MAX_OSAGE_EDGES_PER_NODE = 0.2
+
+# Each engine's faster stand-in once the time budget runs out; osage is the fastest and is never cut short.
+FALLBACK_ENGINES = {"dot": "sfdp", "neato": "sfdp", "sfdp": "osage"}
+
+def validate_layout_engine(engine):
+    if engine is not None and engine not in LAYOUT_ENGINES:
+        return f"Unsupported layoutEngine: {engine}. Use one of {', '.join(LAYOUT_ENGINES)}"
+    return None
+
+def select_layout_engine(node_count, edge_count):
+    edges_per_node = edge_count / max(node_count, 1)
+    if node_count <= MAX_DOT_NODES and edges_per_node <= MAX_DOT_EDGES_PER_NODE:
+        return "dot"
+    if edges_per_node <= MAX_OSAGE_EDGES_PER_NODE:
+        return "osage"
+    if node_count <= MAX_NEATO_NODES and edges_per_node <= MAX_DOT_EDGES_PER_NODE:
+        return "neato"
+    return "sfdp"
+
+def run_graphviz(command, dot_source, engine, timeout):
+    try:
+        return subprocess.run(command, input=dot_source.encode(), capture_output=True, check=True, timeout=timeout)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Layout with {engine} failed: {e.stderr.decode().strip()}")
+
+def pipe_layout(dot_source, engine, timeout=None, output_format=None):
+    # With output_format, the same process also draws that format and returns (laid_out, image).
+    command = ["dot", f"-K{engine}"]
+    if engine != "dot":
+        command.append("-Goverlap=false")
+    if not output_format:
+        return run_graphviz(command + ["-Tdot"], dot_source, engine, timeout).stdout.decode()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Graphviz pairs each -o with the -T before it, so both outputs go to files.
+        layout_path = os.path.join(directory, "layout.dot")
+        image_path = os.path.join(directory, f"image.{output_format}")
+        run_graphviz(command + ["-Tdot", f"-o{layout_path}", f"-T{output_format}", f"-o{image_path}"], dot_source, engine, timeout)
+        with open(layout_path) as layout_file, open(image_path, "rb") as image_file:
+            return layout_file.read(), image_file.read()
+
+def run_layout(dot_source, engine, time_budget=LAYOUT_TIME_BUDGET_SECONDS, metrics=None, output_format=None):
+    fallback = FALLBACK_ENGINES.get(engine)
+    if metrics:
+        metrics.record("layoutFallback", 0)
+    if fallback is None or time_budget is None:
+        return pipe_layout(dot_source, engine, output_format=output_format)
+
+    try:
+        return pipe_layout(dot_source, engine, time_budget, output_format)
+    except subprocess.TimeoutExpired:
+        # subprocess.run has already killed the engine; the faster one runs unbounded so the request still gets a diagram.
+        print(f"Layout with {engine} exceeded {time_budget}s, falling back to {fallback}")
+        if metrics:
+            metrics.record("layoutFallback", 1)
+        return pipe_layout(dot_source, fallback, output_format=output_format)
+
+def layout_runner(requested_engine=None, metrics=None, time_budget=LAYOUT_TIME_BUDGET_SECONDS):
+    # Diagram utils call this with the graph they built; engine forces one, e.g. neato for pinned positions.
+    # Single-format requests pass output_format so layout and drawing share one Graphviz process.
+    def layout(dot_source, node_count, edge_count, engine=None, output_format=None):
+        if engine:
+            # No fallback for a forced engine: sfdp would silently drop the pins neato was forced for.
+            return run_layout(dot_source, engine, None, metrics, output_format)
+        engine = requested_engine or select_layout_engine(node_count, edge_count)
+        return run_layout(dot_source, engine, time_budget, metrics, output_format)
+    return layout
@@ -0,0 +1,29 @@
+import boto3
+import os
+
+s3 = boto3.client('s3')
+
+INTERMEDIATE_PREFIX = "intermediate"
+
+def build_intermediate_key(tenant_id, file_id, version_id=None):
+    # One intermediate per image version, so a restored version converts from its own diagram.
+    key = f"{INTERMEDIATE_PREFIX}/{tenant_id}/{file_id}"
+    return f"{key}/{version_id}" if version_id else key
+
+def save_intermediate(tenant_id, file_id, diagram_type, data, version_id=None):
+    try:
+        s3.put_object(
+            Bucket=os.getenv("S3-BUCKET-NAME"),
+            Key=build_intermediate_key(tenant_id, file_id, version_id),
+            Body=data,
+            Metadata={"diagram-type": diagram_type}
+        )
+    except Exception as e:
+        print(f"Intermediate form write error: {e}")
+
+def load_intermediate(tenant_id, file_id, version_id=None):
+    try:
+        response = s3.get_object(Bucket=os.getenv("S3-BUCKET-NAME"), Key=build_intermediate_key(tenant_id, file_id, version_id))
+    except s3.exceptions.NoSuchKey:
+        return None, None
+    return response['Metadata'].get('diagram-type'), response['Body'].read()
@@ -0,0 +1,74 @@
+import boto3
+import json
+import os
+import sqlite3
+import threading
+import time
+
+VISIBILITY_TIMEOUT = int(os.getenv("RENDER_JOBS_VISIBILITY_TIMEOUT", "900"))
+
+
+class SqsJobQueue:
+    def __init__(self, queue_url):
+        self.queue_url = queue_url
+        self.sqs = boto3.client('sqs')
+
+    def send(self, message):
+        self.sqs.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(message))
+
+    def receive(self, max_messages=10):
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=max_messages,
+            VisibilityTimeout=VISIBILITY_TIMEOUT
+        )
+        return [(message['ReceiptHandle'], json.loads(message['Body'])) for message in response.get('Messages', [])]
+
+    def delete(self, receipt):
+        self.sqs.delete_message(QueueUrl=self.queue_url, ReceiptHandle=receipt)
+
+
+class SqliteJobQueue:
+    # Local stand-in for SQS: messages are leased for VISIBILITY_TIMEOUT and reappear unless deleted.
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_queue (id INTEGER PRIMARY KEY AUTOINCREMENT, body TEXT NOT NULL, visible_at REAL NOT NULL)"
+        )
+
+    def send(self, message):
+        with self.lock:
+            self.conn.execute("INSERT INTO job_queue (body, visible_at) VALUES (?, ?)", (json.dumps(message), time.time()))
+
+    def receive(self, max_messages=10):
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            rows = self.conn.execute(
+                "SELECT id, body FROM job_queue WHERE visible_at <= ? ORDER BY id LIMIT ?", (now, max_messages)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE job_queue SET visible_at = ? WHERE id = ?", [(now + VISIBILITY_TIMEOUT, row[0]) for row in rows]
+            )
+            self.conn.execute("COMMIT")
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def delete(self, receipt):
+        with self.lock:
+            self.conn.execute("DELETE FROM job_queue WHERE id = ?", (receipt,))
+
+
+queues = {}
+
+def get_job_queue():
+    queue_url = os.getenv("RENDER_JOBS_QUEUE_URL")
+    location = queue_url or os.getenv("RENDER_JOBS_SQLITE_PATH")
+    # An in-memory queue would accept jobs that no worker ever sees, so the local queue has to be asked for.
+    if not location:
+        raise RuntimeError("No render job queue configured: set RENDER_JOBS_QUEUE_URL, or RENDER_JOBS_SQLITE_PATH for a local queue")
+    queue = queues.get(location)
+    if queue is None:
+        queue = SqsJobQueue(queue_url) if queue_url else SqliteJobQueue(location)
+        queues[location] = queue
+    return queue
@@ -0,0 +1,30 @@
+import atexit
+import os
+import signal
+import threading
+
+shutdown_callbacks = []
+
+def run_shutdown_callbacks():
+    while shutdown_callbacks:
+        callback = shutdown_callbacks.pop()
+        try:
+            callback()
+        except Exception as e:
+            print(f"Shutdown callback error: {e}")
+
+def handle_sigterm(signum, frame):
+    run_shutdown_callbacks()
+    # Let the default action end the process, as it would have without this hook.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+def on_shutdown(callback):
+    # Called by Lambda entry points, not shared modules, so importing a helper never installs a signal handler.
+    if callback in shutdown_callbacks:
+        return
+    if not shutdown_callbacks:
+        atexit.register(run_shutdown_callbacks)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, handle_sigterm)
+    shutdown_callbacks.append(callback)
@@ -0,0 +1,80 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+NAMESPACE = os.getenv("METRICS_NAMESPACE", "UtecDiagram")
+FUNCTION_NAME = os.getenv("AWS_LAMBDA_FUNCTION_NAME", "local")
+
+# Only the first request a container serves pays for imports and client setup.
+container = {"coldStart": True}
+
+
+class RequestMetrics:
+    def __init__(self, diagram_type=None, request_id=None):
+        self.start = time.perf_counter()
+        self.diagram_type = diagram_type
+        self.request_id = request_id
+        self.start_type = "cold" if container["coldStart"] else "warm"
+        container["coldStart"] = False
+        self.values = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # Stages can repeat (batch uploads run in threads), so durations accumulate.
+            elapsed = (time.perf_counter() - start) * 1000
+            with self.lock:
+                total, _ = self.values.get(f"{name}Duration", (0, None))
+                self.values[f"{name}Duration"] = (total + elapsed, "Milliseconds")
+
+    def record(self, name, value, unit="Count"):
+        with self.lock:
+            self.values[name] = (value, unit)
+
+    def emit(self, status_code=None, **properties):
+        self.record("totalDuration", (time.perf_counter() - self.start) * 1000, "Milliseconds")
+
+        dimensions = {"Function": FUNCTION_NAME}
+        if self.diagram_type:
+            dimensions["DiagramType"] = self.diagram_type
+
+        # CloudWatch Embedded Metric Format: one JSON line per request, extracted into metrics from the logs.
+        print(json.dumps({
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": NAMESPACE,
+                    "Dimensions": [list(dimensions), [*dimensions, "StartType"]],
+                    "Metrics": [{"Name": name, "Unit": unit} for name, (_, unit) in self.values.items()]
+                }]
+            },
+            **dimensions,
+            "StartType": self.start_type,
+            "requestId": self.request_id,
+            "statusCode": status_code,
+            **properties,
+            **{name: round(value, 3) for name, (value, _) in self.values.items()}
+        }))
+
+
+def measure(metrics, name):
+    return metrics.stage(name) if metrics else nullcontext()
+
+def instrument_handler(diagram_type=None):
+    def decorate(handler):
+        @functools.wraps(handler)
+        def wrapper(event, context):
+            metrics = RequestMetrics(diagram_type, getattr(context, "aws_request_id", None))
+            metrics.record("inputBytes", len((event or {}).get('body') or ""), "Bytes")
+            response = handler(event, context, metrics)
+            metrics.emit(response.get("statusCode"))
+            return response
+        return wrapper
+    return decorate
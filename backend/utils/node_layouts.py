@@ -0,0 +1,37 @@
+import boto3
+import json
+import os
+
+s3 = boto3.client('s3')
+
+LAYOUT_PREFIX = "layouts"
+
+def build_layout_key(tenant_id, file_id):
+    return f"{LAYOUT_PREFIX}/{tenant_id}/{file_id}.json"
+
+def load_node_positions(tenant_id, file_id):
+    try:
+        response = s3.get_object(Bucket=os.getenv("S3-BUCKET-NAME"), Key=build_layout_key(tenant_id, file_id))
+        return json.loads(response['Body'].read())
+    except s3.exceptions.NoSuchKey:
+        return None
+    except Exception as e:
+        print(f"Node layout read error: {e}")
+        return None
+
+def load_pinned_positions(tenant_id, file_id, layout_engine=None, relayout=False):
+    # Only neato can keep stored positions, so asking for another engine means a full layout.
+    if not file_id or relayout or layout_engine not in (None, 'neato'):
+        return None
+    return load_node_positions(tenant_id, file_id)
+
+def save_node_positions(tenant_id, file_id, positions):
+    try:
+        s3.put_object(
+            Bucket=os.getenv("S3-BUCKET-NAME"),
+            Key=build_layout_key(tenant_id, file_id),
+            Body=json.dumps(positions, separators=(",", ":")),
+            ContentType="application/json"
+        )
+    except Exception as e:
+        print(f"Node layout write error: {e}")
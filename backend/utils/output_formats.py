@@ -0,0 +1,29 @@
+MAX_OUTPUT_FORMATS = 4
+
+def get_output_formats(output_format):
+    # outputFormat is either one format name or a list of them; the first listed is the file's primary image.
+    if isinstance(output_format, str):
+        return [output_format]
+    return list(dict.fromkeys(output_format))
+
+def validate_output_formats(output_format):
+    if isinstance(output_format, str):
+        return None
+
+    if not isinstance(output_format, list) or not output_format:
+        return "outputFormat must be a format name or a non-empty list of format names"
+
+    if not all(isinstance(name, str) and name for name in output_format):
+        return "Every outputFormat entry must be a format name"
+
+    if len(set(output_format)) > MAX_OUTPUT_FORMATS:
+        return f"At most {MAX_OUTPUT_FORMATS} output formats can be requested at once"
+
+    return None
+
+def build_image_urls_body(bucket_name, s3_keys, output_format):
+    image_urls = {name: f"https://{bucket_name}.s3.amazonaws.com/{s3_key}" for name, s3_key in s3_keys.items()}
+    body = {"imageUrl": next(iter(image_urls.values()))}
+    if not isinstance(output_format, str):
+        body["imageUrls"] = image_urls
+    return body
@@ -0,0 +1,35 @@
+import base64
+import json
+from decimal import Decimal
+
+def encode_token(last_evaluated_key):
+    if not last_evaluated_key:
+        return None
+    payload = json.dumps(last_evaluated_key, default=lambda value: int(value) if value % 1 == 0 else float(value))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_token(token):
+    if not token:
+        return None
+    try:
+        start_key = json.loads(base64.urlsafe_b64decode(token.encode()), parse_float=Decimal, parse_int=Decimal)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid continuation token")
+
+    if not isinstance(start_key, dict):
+        raise ValueError("Invalid continuation token")
+    return start_key
+
+def parse_page_size(value, default, maximum):
+    # None when the value is not a positive whole number; larger sizes are capped rather than rejected.
+    if value is None:
+        return default
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        return None
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return None
+    if page_size <= 0:
+        return None
+    return min(page_size, maximum)
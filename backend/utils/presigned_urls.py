@@ -0,0 +1,40 @@
+import boto3
+import os
+import time
+
+s3 = boto3.client('s3')
+
+URL_EXPIRATION = int(os.getenv("PRESIGNED_URL_EXPIRATION", "3600"))
+# Re-sign once less than this many seconds of validity remain, so clients never get a nearly expired URL.
+REFRESH_MARGIN = int(os.getenv("PRESIGNED_URL_REFRESH_MARGIN", "600"))
+MAX_CACHED_URLS = 5000
+
+# (bucket, key, versionId) -> (url, expiresAt)
+signed_urls = {}
+
+def get_presigned_url(bucket_name, s3_key, version_id=None):
+    cache_key = (bucket_name, s3_key, version_id)
+    now = time.time()
+
+    cached = signed_urls.get(cache_key)
+    if cached and cached[1] - now > REFRESH_MARGIN:
+        return cached[0]
+
+    params = {"Bucket": bucket_name, "Key": s3_key}
+    if version_id:
+        params["VersionId"] = version_id
+
+    url = s3.generate_presigned_url(
+        ClientMethod="get_object",
+        Params=params,
+        ExpiresIn=URL_EXPIRATION
+    )
+
+    if len(signed_urls) >= MAX_CACHED_URLS:
+        for key in [key for key, (_, expires_at) in signed_urls.items() if expires_at - now <= REFRESH_MARGIN]:
+            del signed_urls[key]
+        if len(signed_urls) >= MAX_CACHED_URLS:
+            signed_urls.clear()
+
+    signed_urls[cache_key] = (url, now + URL_EXPIRATION)
+    return url
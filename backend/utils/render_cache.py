@@ -0,0 +1,115 @@
+import boto3
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from io import BytesIO
+
+s3 = boto3.client('s3')
+
+CACHE_PREFIX = "render-cache"
+MAX_ENTRIES = int(os.getenv("RENDER_CACHE_MAX_ENTRIES", "64"))
+MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+memory_cache = OrderedDict()
+memory_usage = {"bytes": 0}
+
+def normalize_input(input_text):
+    if isinstance(input_text, str):
+        return "\n".join(line.rstrip() for line in input_text.strip().splitlines())
+    return json.dumps(input_text, sort_keys=True, separators=(",", ":"))
+
+def build_cache_key(diagram_type, input_format, input_text, output_format, renderer_version, *options):
+    digest = hashlib.sha256()
+    for part in (diagram_type, input_format or "", normalize_input(input_text), output_format, renderer_version, *options):
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def get_cache_bucket():
+    # Only a dedicated bucket: in the versioned image bucket every cache write would pile up versions.
+    # Without one the persistent tier is off and only the in-memory cache is used.
+    return os.getenv("RENDER_CACHE_BUCKET")
+
+def memory_get(cache_key):
+    data = memory_cache.get(cache_key)
+    if data is not None:
+        memory_cache.move_to_end(cache_key)
+    return data
+
+def memory_put(cache_key, data):
+    if len(data) > MAX_BYTES:
+        return
+
+    if cache_key in memory_cache:
+        memory_usage["bytes"] -= len(memory_cache.pop(cache_key))
+
+    memory_cache[cache_key] = data
+    memory_usage["bytes"] += len(data)
+
+    while len(memory_cache) > MAX_ENTRIES or memory_usage["bytes"] > MAX_BYTES:
+        _, evicted = memory_cache.popitem(last=False)
+        memory_usage["bytes"] -= len(evicted)
+
+def persistent_get(cache_key):
+    bucket_name = get_cache_bucket()
+    if not bucket_name:
+        return None
+
+    try:
+        response = s3.get_object(Bucket=bucket_name, Key=f"{CACHE_PREFIX}/{cache_key}")
+        return response['Body'].read()
+    except s3.exceptions.NoSuchKey:
+        return None
+    except Exception as e:
+        print(f"Render cache read error: {e}")
+        return None
+
+def persistent_put(cache_key, data):
+    bucket_name = get_cache_bucket()
+    if not bucket_name:
+        return
+
+    try:
+        s3.put_object(Bucket=bucket_name, Key=f"{CACHE_PREFIX}/{cache_key}", Body=data)
+    except Exception as e:
+        print(f"Render cache write error: {e}")
+
+def cache_lookup(cache_key):
+    # Returns the data and the tier it came from, or (None, None).
+    data = memory_get(cache_key)
+    if data is not None:
+        return data, "memory"
+
+    data = persistent_get(cache_key)
+    if data is not None:
+        memory_put(cache_key, data)
+        return data, "persistent"
+    return None, None
+
+def cache_store(cache_key, data):
+    persistent_put(cache_key, data)
+    memory_put(cache_key, data)
+
+def cached_render_many(cache_keys, render, metrics=None):
+    # cache_keys maps each artifact (an output format, the intermediate form) to its key.
+    # render produces every artifact in one pass, so any miss renders once and refills all of them.
+    lookups = {name: cache_lookup(cache_key) for name, cache_key in cache_keys.items()}
+    found = {name: data for name, (data, _) in lookups.items()}
+    missing = [name for name, data in found.items() if data is None]
+    if missing:
+        produced = render()
+        for name in missing:
+            found[name] = produced[name]
+            cache_store(cache_keys[name], found[name])
+
+    if metrics:
+        tiers = [tier for _, tier in lookups.values()]
+        metrics.record("renderCacheHit", 0 if missing else 1)
+        metrics.record("renderCacheMemoryHits", tiers.count("memory"))
+        metrics.record("renderCachePersistentHits", tiers.count("persistent"))
+        metrics.record("renderCacheMisses", len(missing))
+    return {name: BytesIO(data) for name, data in found.items()}
+
+def cached_render(cache_key, render, metrics=None):
+    return cached_render_many({"image": cache_key}, lambda: {"image": render().getvalue()}, metrics)["image"]
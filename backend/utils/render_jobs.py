@@ -0,0 +1,57 @@
+import boto3
+import json
+import os
+import uuid
+
+from .job_queue import get_job_queue
+from ..db.render_jobs_queries import insert_render_job
+
+s3 = boto3.client('s3')
+
+PAYLOAD_PREFIX = "render-jobs"
+# SQS messages are capped at 256 KB; bigger inputs travel through S3.
+MAX_INLINE_PAYLOAD = 200 * 1024
+
+JOB_FIELDS = ('inputFormat', 'outputFormat', 'fileName', 'fileId', 'metadata', 'layout', 'layoutEngine', 'relayout', 'schemas', 'tables')
+
+def submit_render_job(diagram_type, tenant_id, input_text, body):
+    job_id = str(uuid.uuid4())
+    job = {
+        'jobId': job_id,
+        'tenantId': tenant_id,
+        'diagramType': diagram_type,
+        'inputText': input_text,
+        **{field: body[field] for field in JOB_FIELDS if field in body}
+    }
+
+    # Resolve the queue first, so a missing queue fails the request before a job is recorded.
+    queue = get_job_queue()
+    insert_render_job(job_id, tenant_id, diagram_type)
+
+    payload = json.dumps(job)
+    if len(payload) > MAX_INLINE_PAYLOAD:
+        payload_key = f"{PAYLOAD_PREFIX}/{job_id}.json"
+        s3.put_object(Bucket=os.getenv("S3-BUCKET-NAME"), Key=payload_key, Body=payload)
+        message = {'jobId': job_id, 'payloadKey': payload_key}
+    else:
+        message = job
+
+    queue.send(message)
+    return job_id
+
+def load_render_job(message):
+    if 'payloadKey' not in message:
+        return message
+
+    response = s3.get_object(Bucket=os.getenv("S3-BUCKET-NAME"), Key=message['payloadKey'])
+    return json.loads(response['Body'].read())
+
+def delete_render_payload(message):
+    # Only once the job is done or failed: until then a retried message still needs its payload.
+    if 'payloadKey' not in message:
+        return
+    try:
+        s3.delete_object(Bucket=os.getenv("S3-BUCKET-NAME"), Key=message['payloadKey'])
+    except Exception as e:
+        # The job already has its final status; a retry would render it again just to delete this.
+        print(f"Render job payload delete error: {e}")
@@ -0,0 +1,34 @@
+import boto3
+from datetime import timezone
+
+s3 = boto3.client('s3')
+
+def format_last_modified(last_modified):
+    # The naive UTC format insert_file_version writes, so S3 and index history read and sort alike.
+    return last_modified.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+def list_key_versions(bucket_name, s3_key, limit, markers=None):
+    list_args = {'Bucket': bucket_name, 'Prefix': s3_key, 'MaxKeys': limit}
+    if markers:
+        list_args['KeyMarker'] = markers['keyMarker']
+        list_args['VersionIdMarker'] = markers['versionIdMarker']
+    response = s3.list_object_versions(**list_args)
+
+    # The prefix also matches file_0010 and file_001.svg; those sort after this key, so the first one ends the listing.
+    versions = []
+    for version in response.get('Versions', []):
+        if version['Key'] != s3_key:
+            return versions, None
+        versions.append(version)
+
+    if not response.get('IsTruncated'):
+        return versions, None
+    return versions, {'keyMarker': response['NextKeyMarker'], 'versionIdMarker': response['NextVersionIdMarker']}
+
+def iter_key_versions(bucket_name, s3_key):
+    markers = None
+    while True:
+        versions, markers = list_key_versions(bucket_name, s3_key, 1000, markers)
+        yield from versions
+        if not markers:
+            return